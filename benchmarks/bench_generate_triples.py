@@ -0,0 +1,120 @@
+"""Benchmark for per-document triple generation in CLSCorGenerator.
+
+Compare the current triple construction against the former one,
+which allocated a Graph per ttl object and per RDFGenerator.
+Time and peak traced memory (tracemalloc) are reported per document.
+
+Usage: python benchmarks/bench_generate_triples.py [-n NUMBER] [FILE ...]
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+from collections.abc import Callable, Mapping
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from unittest import mock
+
+from rdflib import Graph
+
+from eltec2rdf import rdfgenerators
+from eltec2rdf.extractors import ELTeCBindingsExtractor
+from eltec2rdf.extractors.sources import raw_url
+from eltec2rdf.rdfgenerators import CLSCorGenerator
+from eltec2rdf.utils.utils import ttl
+
+
+fixtures_path = Path(__file__).parent / "fixtures"
+
+
+class EagerGraphGenerator(CLSCorGenerator):
+    """CLSCorGenerator allocating its Graph on initialization."""
+
+    def __init__(self, **bindings) -> None:
+        """Initialize an EagerGraphGenerator."""
+        super().__init__(graph=Graph(), **bindings)
+
+
+def eager_graphs() -> AbstractContextManager:
+    """Patch rdfgenerators to allocate Graphs like the former ttl path."""
+    return mock.patch.multiple(
+        rdfgenerators,
+        ttl_triples=lambda uri, *pairs: ttl(uri, *pairs, graph=Graph()),
+        CLSCorGenerator=EagerGraphGenerator
+    )
+
+
+def generate(bindings: list[Mapping]) -> None:
+    """Generate all triples for bindings."""
+    for _bindings in bindings:
+        for _ in rdfgenerators.CLSCorGenerator(**_bindings):
+            pass
+
+
+def bench_time(bindings: list[Mapping], number: int) -> float:
+    """Get the best mean generation time per document in microseconds."""
+    timer = timeit.Timer(lambda: generate(bindings))
+    best = min(timer.repeat(repeat=5, number=number))
+    return best / (number * len(bindings)) * 1e6
+
+
+def bench_memory(bindings: list[Mapping]) -> float:
+    """Get the mean peak of traced memory per document in KiB."""
+    generate(bindings)  # warm up caches
+    peaks = []
+
+    tracemalloc.start()
+    for _bindings in bindings:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        triples = list(rdfgenerators.CLSCorGenerator(**_bindings))
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - start)
+        del triples
+    tracemalloc.stop()
+
+    return sum(peaks) / len(peaks) / 1024
+
+
+def bench(bindings: list[Mapping],
+          number: int,
+          context: Callable[[], AbstractContextManager]
+          ) -> tuple[float, float]:
+    """Run time and memory benchmarks within context."""
+    with context():
+        return bench_time(bindings, number), bench_memory(bindings)
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("-n", "--number", type=int, default=200)
+    args = parser.parse_args()
+
+    files = args.files or sorted(fixtures_path.glob("*.xml"))
+    bindings = [
+        dict(
+            ELTeCBindingsExtractor(
+                raw_url(f"ELTeC-{f.stem[:3].lower()}", "master", f.name),
+                source=f.read_bytes()
+            )
+        )
+        for f in files
+    ]
+
+    before = bench(bindings, args.number, eager_graphs)
+    after = bench(bindings, args.number, nullcontext)
+
+    print(f"documents: {len(bindings)}")
+    print(f"{'':<14} {'µs/document':>12} {'peak KiB/document':>18}")
+    for label, (time, peak) in (
+            ("eager Graphs", before),
+            ("no Graphs", after)
+    ):
+        print(f"{label:<14} {time:12.1f} {peak:18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark for inserting generated triples into an rdflib.Graph.
+
+Compare Graph.add per triple against batched Graph.addN (add_triples)
+on a synthetic corpus derived from the fixture headers.
+
+Usage: python benchmarks/bench_graph_insertion.py [-d DOCUMENTS] [-b BATCH_SIZE ...]
+"""
+
+import argparse
+import time
+
+from collections.abc import Callable
+from pathlib import Path
+
+from lodkit.types import _Triple
+from rdflib import Graph
+
+from eltec2rdf.extractors import ELTeCBindingsExtractor
+from eltec2rdf.extractors.sources import raw_url
+from eltec2rdf.rdfgenerators import CLSCorGenerator
+from eltec2rdf.utils.utils import add_triples
+
+
+fixtures_path = Path(__file__).parent / "fixtures"
+
+
+def synthetic_corpus(documents: int) -> list[list[_Triple]]:
+    """Generate triple batches for a synthetic corpus of documents.
+
+    Bindings of the fixture headers are varied per document,
+    so every document yields distinct triples.
+    """
+    fixtures = [
+        dict(
+            ELTeCBindingsExtractor(
+                raw_url(f"ELTeC-{f.stem[:3].lower()}", "master", f.name),
+                source=f.read_bytes()
+            )
+        )
+        for f in sorted(fixtures_path.glob("*.xml"))
+    ]
+
+    batches = []
+    for i in range(documents):
+        bindings = dict(fixtures[i % len(fixtures)])
+        stem = f"{bindings['file_stem']}_{i:06}"
+        bindings.update(
+            resource_uri=bindings["resource_uri"].replace(
+                f"{bindings['file_stem'].upper()}.xml", f"{stem}.xml"
+            ),
+            file_stem=stem,
+            work_title=f"{bindings['work_title']} ({i})",
+            author_name=f"{bindings['author_name']} ({i})"
+        )
+        batches.append(list(CLSCorGenerator(**bindings)))
+
+    return batches
+
+
+def bench(insert: Callable[[Graph, list[list[_Triple]]], None],
+          batches: list[list[_Triple]],
+          repeat: int) -> float:
+    """Get the best insertion throughput in triples per second."""
+    count = sum(map(len, batches))
+    times = []
+
+    for _ in range(repeat):
+        graph = Graph()
+        start = time.perf_counter()
+        insert(graph, batches)
+        times.append(time.perf_counter() - start)
+
+    return count / min(times)
+
+
+def add_per_triple(graph: Graph, batches: list[list[_Triple]]) -> None:
+    """Insert triples with Graph.add."""
+    for triples in batches:
+        for triple in triples:
+            graph.add(triple)
+
+
+def add_batched(batch_size: int) -> Callable:
+    """Get an insert function using add_triples with batch_size."""
+    def _insert(graph: Graph, batches: list[list[_Triple]]) -> None:
+        add_triples(
+            graph,
+            (triple for triples in batches for triple in triples),
+            batch_size=batch_size
+        )
+    return _insert
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-d", "--documents", type=int, default=2000)
+    parser.add_argument(
+        "-b", "--batch-size",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10_000]
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    batches = synthetic_corpus(args.documents)
+    print(f"documents: {len(batches)}, triples: {sum(map(len, batches))}")
+
+    baseline = bench(add_per_triple, batches, args.repeat)
+    print(f"{'Graph.add':<22} {baseline:12,.0f} triples/s")
+
+    for batch_size in args.batch_size:
+        throughput = bench(add_batched(batch_size), batches, args.repeat)
+        print(
+            f"{f'addN, batch {batch_size}':<22} {throughput:12,.0f} triples/s"
+            f" ({throughput / baseline:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
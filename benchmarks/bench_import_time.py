@@ -0,0 +1,85 @@
+"""Benchmark for the import time of eltec2rdf modules.
+
+Every module is imported in fresh interpreters; the median wall time
+minus the startup time of a bare interpreter is reported, along with
+the slowest eltec2rdf modules according to 'python -X importtime'.
+With --max-ms, exit with status 1 if any module exceeds the limit.
+
+Usage: python benchmarks/bench_import_time.py [-n NUMBER] [--max-ms MS] [MODULE ...]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+default_modules = [
+    "eltec2rdf.vocabs.vocabs",
+    "eltec2rdf.models",
+    "eltec2rdf.extractors",
+    "eltec2rdf.rdfgenerators",
+    "eltec2rdf.main"
+]
+
+
+def wall_time(statement: str, number: int) -> float:
+    """Get the median wall time of running statement in a fresh interpreter."""
+    times = []
+
+    for _ in range(number):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times) * 1e3
+
+
+def self_times(module: str) -> list[tuple[int, str]]:
+    """Get the self import times in µs of eltec2rdf modules imported by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        if name.strip().startswith("eltec2rdf") and self_us.strip().isdigit():
+            times.append((int(self_us), name.strip()))
+
+    return sorted(times, reverse=True)
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=default_modules)
+    parser.add_argument("-n", "--number", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    baseline = wall_time("pass", args.number)
+    print(f"interpreter startup: {baseline:8.1f} ms")
+
+    exceeded = False
+    for module in args.modules:
+        elapsed = wall_time(f"import {module}", args.number) - baseline
+        exceeded |= args.max_ms is not None and elapsed > args.max_ms
+        print(f"{module:<30} {elapsed:8.1f} ms")
+
+    print("\nslowest eltec2rdf modules (self time):")
+    for self_us, name in self_times(args.modules[-1])[:5]:
+        print(f"{name:<30} {self_us / 1e3:8.1f} ms")
+
+    if exceeded:
+        sys.exit(f"import time exceeds {args.max_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Benchmark for term interning in triple generation.
+
+Compare CLSCorGenerator with and without interned namespace terms,
+memoized hashed URIs (mkuri) and shared Literals, for documents
+linked to registered actors (as in eltec2rdf.main) and for the
+per-document actor triples generated without a registry.
+Time per document, retained memory of the generated triple batches
+and of a Graph holding all triples are reported.
+
+Usage: python benchmarks/bench_interning.py [-n NUMBER] [-d DOCUMENTS]
+"""
+
+import argparse
+import contextlib
+import gc
+import timeit
+import tracemalloc
+
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import AbstractContextManager, nullcontext
+from unittest import mock
+
+import clisn
+
+from bench_validation import load_bindings
+from rdflib import Graph, Literal, namespace
+
+from eltec2rdf import rdfgenerators
+from eltec2rdf.rdfgenerators import CLSCorGenerator
+from eltec2rdf.registry import EntityRegistry
+from eltec2rdf.utils import utils
+
+
+# memoized term constructors, also while patched by no_interning
+term_caches = (utils._hashed_uri, utils.literal)
+
+
+@contextlib.contextmanager
+def no_interning() -> Iterator[None]:
+    """Patch rdfgenerators and mkuri to create all terms anew."""
+    patches = mock.patch.multiple(
+        rdfgenerators,
+        RDF=namespace.RDF,
+        RDFS=namespace.RDFS,
+        OWL=namespace.OWL,
+        crm=clisn.crm,
+        crmcls=clisn.crmcls,
+        lrm=clisn.lrm,
+        literal=Literal
+    )
+    hashed_uri = mock.patch.object(
+        utils, "_hashed_uri", utils._hashed_uri.__wrapped__
+    )
+
+    with patches, hashed_uri:
+        yield
+
+
+def generate(bindings: list[Mapping]) -> list[list]:
+    """Generate the triple batches for bindings."""
+    return [list(CLSCorGenerator(**_bindings)) for _bindings in bindings]
+
+
+def bench_time(bindings: list[Mapping], number: int) -> float:
+    """Get the best mean generation time per document in microseconds."""
+    timer = timeit.Timer(lambda: generate(bindings))
+    best = min(timer.repeat(repeat=5, number=number))
+    return best / (number * len(bindings)) * 1e6
+
+
+def bench_memory(bindings: list[Mapping]) -> tuple[float, float]:
+    """Get the retained memory of all triple batches and of a Graph in KiB.
+
+    Term caches are cleared first, so memory held by them is included.
+    """
+    for cache in term_caches:
+        cache.cache_clear()
+    gc.collect()
+
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    batches = generate(bindings)
+    batches_size, _ = tracemalloc.get_traced_memory()
+
+    graph = Graph()
+    graph.addN((s, p, o, graph) for batch in batches for s, p, o in batch)
+    del batches
+    gc.collect()
+    graph_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (batches_size - start) / 1024, (graph_size - start) / 1024
+
+
+def bench(bindings: list[Mapping],
+          number: int,
+          context: Callable[[], AbstractContextManager]
+          ) -> tuple[float, float, float]:
+    """Run time and memory benchmarks within context."""
+    with context():
+        return bench_time(bindings, number), *bench_memory(bindings)
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=5)
+    parser.add_argument("-d", "--documents", type=int, default=2000)
+    args = parser.parse_args()
+
+    bindings = load_bindings(args.documents)
+
+    registry = EntityRegistry()
+    registered = [
+        {
+            **_bindings,
+            "actor_uri": str(
+                registry.resolve(
+                    _bindings["resource_uri"],
+                    _bindings["author_name"],
+                    _bindings["author_ids"]
+                )
+            )
+        }
+        for _bindings in bindings
+    ]
+
+    with no_interning():
+        expected = [generate(registered), generate(bindings)]
+    assert [generate(registered), generate(bindings)] == expected, (
+        "Interning must not change the generated triples."
+    )
+
+    print(f"documents: {len(bindings)}")
+    print(
+        f"{'':<26} {'µs/document':>12} {'batches KiB':>12} {'Graph KiB':>10}"
+    )
+    for label, _bindings in (("registered actors", registered),
+                             ("per-document actors", bindings)):
+        for interning, context in (("", no_interning),
+                                   (", interned", nullcontext)):
+            time, batches, graph = bench(_bindings, args.number, context)
+            print(
+                f"{label + interning:<26} {time:12.1f} "
+                f"{batches:12.0f} {graph:10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""End-to-end benchmark of the conversion pipeline on synthetic corpora.
+
+Synthetic ELTeC level1 corpora (see synthetic.py) are written once per
+document count and body size and converted offline from the checkout.
+Every conversion runs in a fresh interpreter; throughput, the per-stage
+times recorded by eltec2rdf.instrumentation and the peak RSS are reported.
+
+Usage: python benchmarks/bench_pipeline.py [-d DOCUMENTS ...] [-s BODY_SIZE ...]
+           [-f FORMAT ...] [--jobs N] [--trusted] [--corpus-dir DIR]
+           [--json PATH]
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from synthetic import parse_size, write_corpus
+
+
+REPO = "ELTeC-syn"
+STAGES = ("extract", "validate", "generate", "write", "serialize")
+
+
+def run_single(checkout: Path,
+               output_format: str,
+               jobs: int,
+               trusted: bool = False) -> dict:
+    """Convert a checkout in this process and get the metrics summary."""
+    from loguru import logger
+
+    from eltec2rdf.extractors.sources import CheckoutSource
+    from eltec2rdf.main import _output_stem, generate_graph
+
+    logger.remove()
+
+    with (
+            tempfile.TemporaryDirectory() as directory,
+            contextlib.chdir(directory),
+            contextlib.ExitStack() as stack
+    ):
+        Path("output").mkdir()
+        executor = (
+            stack.enter_context(ProcessPoolExecutor(jobs)) if jobs > 1
+            else None
+        )
+
+        generate_graph(
+            REPO,
+            source=CheckoutSource(checkout, repo=REPO),
+            output_format=output_format,
+            executor=executor,
+            jobs=jobs,
+            trusted=trusted
+        )
+        summary = json.loads(
+            Path(f"output/{_output_stem(REPO)}.metrics.json").read_text()
+        )
+
+    summary["max_rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return summary
+
+
+def run(checkout: Path,
+        output_format: str,
+        jobs: int,
+        trusted: bool = False) -> dict:
+    """Convert a checkout in a fresh interpreter and get the metrics summary."""
+    result = subprocess.run(
+        [
+            sys.executable, __file__,
+            "--single", str(checkout),
+            "--format", output_format,
+            "--jobs", str(jobs),
+            *(["--trusted"] if trusted else [])
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-d", "--documents", type=int, nargs="+", default=[10, 100, 1000]
+    )
+    parser.add_argument(
+        "-s", "--body-size", type=parse_size, nargs="+", default=[4096]
+    )
+    parser.add_argument(
+        "-f", "--format", nargs="+", default=["nt", "turtle"],
+        choices=["nt", "nq", "turtle"]
+    )
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--trusted", action="store_true")
+    parser.add_argument(
+        "--corpus-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "eltec2rdf-bench"
+    )
+    parser.add_argument("--json", type=Path, default=None)
+    parser.add_argument("--single", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_single(
+            args.single, args.format[0], args.jobs, args.trusted
+        )))
+        return
+
+    header = (
+        f"{'docs':>7} {'body':>8} {'format':>7} {'wall s':>8} {'docs/s':>9} "
+        f"{'MiB/s':>7} "
+        + " ".join(f"{stage:>9}" for stage in STAGES)
+        + f" {'RSS MiB':>8}"
+    )
+    print(header)
+
+    results = []
+    for documents, body_size, output_format in itertools.product(
+            args.documents, args.body_size, args.format
+    ):
+        checkout = write_corpus(
+            args.corpus_dir / f"{documents}x{body_size}",
+            REPO,
+            documents=documents,
+            body_size=body_size
+        )
+        size = sum(f.stat().st_size for f in (checkout / "level1").iterdir())
+
+        summary = run(checkout, output_format, args.jobs, args.trusted)
+        wall = summary["wall_seconds"]
+        stages = summary["stages"]
+
+        print(
+            f"{documents:>7} {body_size:>8} {output_format:>7} {wall:>8.2f} "
+            f"{documents / wall:>9.1f} {size / wall / 1024 ** 2:>7.1f} "
+            + " ".join(
+                f"{stages.get(stage, {}).get('seconds', 0.0):>9.3f}"
+                for stage in STAGES
+            )
+            + f" {summary['max_rss_kib'] / 1024:>8.1f}"
+        )
+
+        results.append({
+            "documents": documents,
+            "body_size": body_size,
+            "input_bytes": size,
+            "format": output_format,
+            "jobs": args.jobs,
+            "trusted": args.trusted,
+            **summary
+        })
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
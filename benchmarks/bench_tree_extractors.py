@@ -0,0 +1,63 @@
+"""Micro-benchmark for per-document extraction in tree_extractors.
+
+Compare extraction with the shared XPath registry against
+compiling every XPath expression per call (the former TEIXPath partial).
+
+Usage: python benchmarks/bench_tree_extractors.py [-n NUMBER] [FILE ...]
+"""
+
+import argparse
+import timeit
+
+from pathlib import Path
+from unittest import mock
+
+from lxml import etree
+
+from eltec2rdf.extractors import tree_extractors
+
+
+fixtures_path = Path(__file__).parent / "fixtures"
+
+
+def extract(tree: etree._ElementTree) -> dict:
+    """Run all extractors used for bindings generation on tree."""
+    return {
+        "work_title": tree_extractors.get_work_title(tree),
+        "author_name": tree_extractors.get_author_name(tree),
+        "work_ids": tree_extractors.get_work_ids(tree),
+        "author_ids": tree_extractors.get_author_ids(tree)
+    }
+
+
+def bench(trees: list[etree._ElementTree], number: int) -> float:
+    """Get the best mean extraction time per document in microseconds."""
+    timer = timeit.Timer(lambda: [extract(tree) for tree in trees])
+    best = min(timer.repeat(repeat=5, number=number))
+    return best / (number * len(trees)) * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("-n", "--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    files = args.files or sorted(fixtures_path.glob("*.xml"))
+    trees = [etree.parse(str(f)) for f in files]
+
+    uncached = tree_extractors.TEIXPath.__wrapped__
+
+    with mock.patch.object(tree_extractors, "TEIXPath", uncached):
+        before = bench(trees, args.number)
+    after = bench(trees, args.number)
+
+    print(f"documents: {len(trees)}")
+    print(f"compile per call: {before:8.1f} µs/document")
+    print(f"XPath registry:   {after:8.1f} µs/document")
+    print(f"speedup:          {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
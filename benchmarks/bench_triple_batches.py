@@ -0,0 +1,137 @@
+"""Benchmark for dictionary-encoded triple batches.
+
+Compare per-document triple batches from CLSCorGenerator as lists
+of rdflib terms against TripleBatches (see eltec2rdf.batches):
+pickled size, time to pickle and unpickle (as for the transfer from
+worker processes) and time to write N-Triples. Encoding and decoding
+times of TripleBatches are reported as well.
+Round-trip fidelity is checked on all batches and on Literals
+with language tags, datatypes and escaped characters.
+
+Usage: python benchmarks/bench_triple_batches.py [-n NUMBER] [-d DOCUMENTS]
+"""
+
+import argparse
+import pickle
+import timeit
+
+from collections.abc import Callable
+
+from bench_validation import load_bindings
+from rdflib import XSD, BNode, Literal, URIRef
+from rdflib.plugins.serializers.nt import _nt_row
+
+from eltec2rdf.batches import TripleBatch
+from eltec2rdf.rdfgenerators import CLSCorGenerator
+
+
+LITERALS = [
+    Literal("Effi Briest"),
+    Literal("Effi Briest", lang="de"),
+    Literal("Effi Briest", lang="de-AT"),
+    Literal("Effi Briest", datatype=XSD.string),
+    Literal("1895", datatype=XSD.gYear),
+    Literal("01", datatype=XSD.integer, normalize=False),
+    Literal("1.50", datatype=XSD.decimal, normalize=False),
+    Literal(True),
+    Literal('"Quoted"\nmulti-line\r\ttext \\ with ünïcödé ✓'),
+    Literal(""),
+]
+
+
+def check_round_trip(batches: list[list]) -> None:
+    """Assert that TripleBatches decode to exactly the encoded triples."""
+    subject = URIRef("https://example.org/s")
+    predicate = URIRef("https://example.org/p")
+    literals = [(subject, predicate, literal) for literal in LITERALS]
+    nodes = [(BNode("b0"), predicate, subject), (subject, predicate, BNode("b0"))]
+
+    for triples in [literals + nodes, *batches]:
+        batch = pickle.loads(pickle.dumps(TripleBatch.from_triples(triples)))
+        decoded = list(batch)
+
+        assert decoded == triples, "TripleBatches must decode to the same triples."
+        for term, _term in zip(
+                (t for triple in triples for t in triple),
+                (t for triple in decoded for t in triple)
+        ):
+            assert type(term) is type(_term) and str(term) == str(_term)
+            if isinstance(term, Literal):
+                assert (term.language, term.datatype) == (
+                    _term.language, _term.datatype
+                ), "Language tags and datatypes must be kept."
+
+        ntriples = "".join(map(_nt_row, triples))
+        assert batch.to_ntriples() == ntriples, (
+            "TripleBatches must write the same N-Triples."
+        )
+        assert TripleBatch.from_ntriples(ntriples) == batch
+
+
+def bench_time(function: Callable[[], object], number: int) -> float:
+    """Get the best time of function in milliseconds."""
+    return min(timeit.Timer(function).repeat(repeat=5, number=number)) / number * 1e3
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=5)
+    parser.add_argument("-d", "--documents", type=int, default=1000)
+    args = parser.parse_args()
+
+    batches = [
+        list(CLSCorGenerator(**bindings))
+        for bindings in load_bindings(args.documents)
+    ]
+    encoded = [TripleBatch.from_triples(triples) for triples in batches]
+    check_round_trip(batches)
+
+    def _pickle(values: list) -> Callable[[], object]:
+        return lambda: [
+            pickle.loads(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+            for value in values
+        ]
+
+    sizes = [
+        sum(len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)) for value in values)
+        for values in (batches, encoded)
+    ]
+    times = {
+        "pickle + unpickle": [
+            bench_time(_pickle(batches), args.number),
+            bench_time(_pickle(encoded), args.number)
+        ],
+        "write N-Triples": [
+            bench_time(
+                lambda: ["".join(map(_nt_row, t)) for t in batches], args.number
+            ),
+            bench_time(lambda: [b.to_ntriples() for b in encoded], args.number)
+        ],
+    }
+
+    print(
+        f"documents: {len(batches)}, "
+        f"triples: {sum(map(len, batches))}"
+    )
+    print(f"{'':<20} {'rdflib terms':>13} {'TripleBatch':>12} {'ratio':>7}")
+    print(
+        f"{'pickled KiB':<20} {sizes[0] / 1024:13.0f} {sizes[1] / 1024:12.0f} "
+        f"{sizes[0] / sizes[1]:6.1f}x"
+    )
+    for label, (terms, batch) in times.items():
+        print(
+            f"{label + ' ms':<20} {terms:13.1f} {batch:12.1f} "
+            f"{terms / batch:6.1f}x"
+        )
+
+    encode = bench_time(
+        lambda: [TripleBatch.from_triples(t) for t in batches], args.number
+    )
+    decode = bench_time(lambda: [list(b) for b in encoded], args.number)
+    print(f"{'encode ms':<20} {'':>13} {encode:12.1f}")
+    print(f"{'decode ms':<20} {'':>13} {decode:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark for per-document bindings validation.
+
+Compare pydantic validation (BindingsBaseModel) against the slotted
+records used for trusted bindings (BindingsRecord), on their own
+and together with triple generation in CLSCorGenerator.
+Bindings are extracted from the fixtures and from synthetic documents.
+
+Usage: python benchmarks/bench_validation.py [-n NUMBER] [-d DOCUMENTS]
+"""
+
+import argparse
+import timeit
+
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+from synthetic import generate_document
+
+from eltec2rdf.extractors import ELTeCBindingsExtractor
+from eltec2rdf.extractors.sources import raw_url
+from eltec2rdf.models import BindingsBaseModel, BindingsRecord
+from eltec2rdf.rdfgenerators import CLSCorGenerator
+
+
+fixtures_path = Path(__file__).parent / "fixtures"
+
+
+def load_bindings(documents: int) -> list[dict]:
+    """Extract bindings from the fixtures and synthetic documents."""
+    sources = [
+        (f"ELTeC-{f.stem[:3].lower()}", f.name, f.read_bytes())
+        for f in sorted(fixtures_path.glob("*.xml"))
+    ] + [
+        ("ELTeC-syn", f"SYN{i:06}.xml", generate_document(f"SYN{i:06}", 512))
+        for i in range(1, documents + 1)
+    ]
+
+    return [
+        dict(ELTeCBindingsExtractor(raw_url(repo, "master", name), source=xml))
+        for repo, name, xml in sources
+    ]
+
+
+def bench_time(function: Callable[[Mapping], object],
+               bindings: list[dict],
+               number: int) -> float:
+    """Get the best mean time of function per document in microseconds."""
+    def _run() -> None:
+        for _bindings in bindings:
+            function(_bindings)
+
+    best = min(timeit.Timer(_run).repeat(repeat=5, number=number))
+    return best / (number * len(bindings)) * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=50)
+    parser.add_argument("-d", "--documents", type=int, default=100)
+    args = parser.parse_args()
+
+    bindings = load_bindings(args.documents)
+
+    for _bindings in bindings:
+        assert (
+            list(CLSCorGenerator(**_bindings))
+            == list(CLSCorGenerator(model=BindingsRecord, **_bindings))
+        ), "Trusted bindings must generate the same triples."
+
+    cases: dict[str, Callable[[Mapping], object]] = {
+        "validate": lambda b: BindingsBaseModel(**b),
+        "validate + generate": lambda b: list(CLSCorGenerator(**b)),
+    }
+    trusted_cases: dict[str, Callable[[Mapping], object]] = {
+        "validate": lambda b: BindingsRecord(**b),
+        "validate + generate": (
+            lambda b: list(CLSCorGenerator(model=BindingsRecord, **b))
+        ),
+    }
+
+    print(f"documents: {len(bindings)}")
+    print(f"{'µs/document':<20} {'pydantic':>10} {'records':>10} {'speedup':>8}")
+    for label in cases:
+        full = bench_time(cases[label], bindings, args.number)
+        trusted = bench_time(trusted_cases[label], bindings, args.number)
+        print(f"{label:<20} {full:10.1f} {trusted:10.1f} {full / trusted:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
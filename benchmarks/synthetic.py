@@ -0,0 +1,186 @@
+"""Generator for synthetic TEI documents shaped like ELTeC level1.
+
+Headers vary over the branches of eltec2rdf.extractors.tree_extractors:
+titles from sourceDesc (digitalSource bibl) or only from titleStmt
+(with the various 'ELTeC edition' suffixes), zero to three tei:bibl
+elements with or without tei:ref targets and author names
+with or without @ref. Bodies are padded to a given size.
+
+Usage: python benchmarks/synthetic.py DIRECTORY [-d DOCUMENTS] [-s BODY_SIZE]
+"""
+
+import argparse
+import random
+
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+
+TITLE_SUFFIXES = (
+    " : ELTeC-Ausgabe",
+    " : ELTeC edition",
+    " (ELTeC édition)",
+    " [ELTeC edition]",
+    ""
+)
+
+SOURCE_TYPES = ("digitalSource", "printSource", "firstEdition", "unspecified")
+
+WORK_REFS = (
+    "https://www.wikidata.org/wiki/Q{n}",
+    "https://viaf.org/viaf/{n}",
+    "https://textgridrep.org/textgrid:{n}",
+    "https://gallica.bnf.fr/ark:/12148/bpt6k{n}"
+)
+
+AUTHOR_REFS = ("gnd:{n}", "viaf:{n}", "wikidata:Q{n}", "viaf:{n} wikidata:Q{n}")
+
+WORDS = (
+    "der die das und in den von zu mit sich des auf für ist im dem nicht "
+    "the of and to a in that was he his it with as for had you not be her "
+    "le la de et les des un une il en que qui dans ne pas se au plus par"
+).split()
+
+SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "KB": 1024, "M": 1024 ** 2, "MB": 1024 ** 2}
+
+
+def parse_size(value: str) -> int:
+    """Parse a size like '512', '4K' or '2MB' into bytes."""
+    value = value.strip().upper()
+    number = value.rstrip("KMB")
+    return int(float(number) * SIZE_UNITS[value[len(number):]])
+
+
+def _body(rng: random.Random, size: int) -> str:
+    """Generate a TEI body of roughly size bytes."""
+    chapters = []
+    length = 0
+    chapter = 1
+
+    while length < size or not chapters:
+        paragraphs = [
+            " ".join(rng.choices(WORDS, k=rng.randint(40, 120)))
+            for _ in range(rng.randint(3, 12))
+        ]
+        xml = (
+            f'<div type="chapter"><head>Kapitel {chapter}</head>'
+            + "".join(f"<p>{p}</p>" for p in paragraphs)
+            + "</div>"
+        )
+        chapters.append(xml)
+        length += len(xml)
+        chapter += 1
+
+    return "\n".join(chapters)
+
+
+def _bibl(rng: random.Random, source_type: str, title: str, author: str) -> str:
+    """Generate a tei:bibl for sourceDesc."""
+    parts = [f"<title>{escape(title)}</title>"]
+
+    if rng.random() < 0.5:
+        parts.append(f"<author>{escape(author)}</author>")
+    if rng.random() < 0.8:
+        target = rng.choice(WORK_REFS).format(n=rng.randint(1000, 10 ** 9))
+        parts.append(f"<ref target={quoteattr(target)}/>")
+    parts.append(f"<date>{rng.randint(1840, 1920)}</date>")
+
+    return f'<bibl type="{source_type}">{"".join(parts)}</bibl>'
+
+
+def generate_document(stem: str,
+                      body_size: int = 4096,
+                      seed: int | None = None,
+                      lang: str = "de") -> bytes:
+    """Generate a synthetic ELTeC level1 TEI document.
+
+    Documents are deterministic for a given stem, body_size and seed.
+    """
+    rng = random.Random(f"{seed}/{stem}")
+
+    title = " ".join(rng.choices(WORDS, k=rng.randint(1, 5))).title()
+    author = (
+        f"{rng.choice(WORDS).title()}, {rng.choice(WORDS).title()} "
+        f"({rng.randint(1780, 1880)}-{rng.randint(1881, 1950)})"
+    )
+
+    author_ref = (
+        " ref=" + quoteattr(
+            rng.choice(AUTHOR_REFS).format(n=rng.randint(10 ** 6, 10 ** 9))
+        )
+        if rng.random() < 0.6 else ""
+    )
+
+    source_types = rng.sample(SOURCE_TYPES, k=rng.randint(0, 3))
+    # titles from titleStmt only if there is no digitalSource bibl
+    if rng.random() < 0.5 and "digitalSource" not in source_types:
+        source_types.insert(0, "digitalSource")
+
+    bibls = "".join(
+        _bibl(rng, source_type, title, author) for source_type in source_types
+    )
+
+    header = f"""<teiHeader>
+    <fileDesc>
+      <titleStmt>
+        <title>{escape(title + rng.choice(TITLE_SUFFIXES))}</title>
+        <author{author_ref}>{escape(author)}</author>
+      </titleStmt>
+      <extent><measure unit="words">{body_size // 6}</measure></extent>
+      <publicationStmt>
+        <publisher ref="https://distantreading.net">COST Action "Distant Reading for European Literary History" (CA16204)</publisher>
+      </publicationStmt>
+      <sourceDesc>{bibls}</sourceDesc>
+    </fileDesc>
+    <encodingDesc n="eltec-1"><p/></encodingDesc>
+    <profileDesc><langUsage><language ident="{lang}"/></langUsage></profileDesc>
+  </teiHeader>"""
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<TEI xmlns="http://www.tei-c.org/ns/1.0" xml:id="{stem}" '
+        f'xml:lang="{lang}">\n  {header}\n'
+        f"  <text><body>\n{_body(rng, body_size)}\n</body></text>\n</TEI>\n"
+    ).encode()
+
+
+def write_corpus(directory: Path | str,
+                 repo: str = "ELTeC-syn",
+                 documents: int = 100,
+                 body_size: int = 4096,
+                 seed: int = 0) -> Path:
+    """Write a synthetic corpus as a checkout: directory/repo/level1/*.xml.
+
+    Existing files are kept, so corpora can be grown incrementally.
+    Return the path of the checkout.
+    """
+    level1 = Path(directory) / repo / "level1"
+    level1.mkdir(parents=True, exist_ok=True)
+    prefix = repo.rsplit("-", 1)[-1].upper()[:3]
+
+    for i in range(1, documents + 1):
+        path = level1 / f"{prefix}{i:06}.xml"
+        if not path.exists():
+            path.write_bytes(generate_document(path.stem, body_size, seed))
+
+    return level1.parent
+
+
+def main() -> None:
+    """Write a synthetic corpus."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("-r", "--repo", default="ELTeC-syn")
+    parser.add_argument("-d", "--documents", type=int, default=100)
+    parser.add_argument("-s", "--body-size", type=parse_size, default="4K")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    checkout = write_corpus(
+        args.directory, args.repo, args.documents, args.body_size, args.seed
+    )
+    print(checkout)
+
+
+if __name__ == "__main__":
+    main()
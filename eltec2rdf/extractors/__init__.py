@@ -1,4 +1,16 @@
 """Package entry point for eltec2rdf.extractors."""
 
-from eltec2rdf.extractors.bindings_extractor import ELTeCBindingsExtractor
-from eltec2rdf.extractors.link_extractor import get_eltec_xml_links
+from eltec2rdf.extractors.bindings_extractor import (
+    ELTeCBindingsExtractor,
+    extract_bindings
+)
+from eltec2rdf.extractors.link_extractor import (
+    ELTeCFile,
+    get_eltec_xml_files,
+    get_eltec_xml_links
+)
+from eltec2rdf.extractors.sources import (
+    ArchiveSource,
+    CheckoutSource,
+    GitHubSource
+)
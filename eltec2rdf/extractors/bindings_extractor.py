@@ -1,21 +1,48 @@
 """Functionality for parsing ELTeC XML file links and extracting bindings."""
 
 import collections
+import io
 
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, InitVar
-from urllib.request import urlretrieve
 from urllib.parse import quote
 from pathlib import Path
+from typing import IO
 
 from lxml import etree
 
 
+from eltec2rdf.extractors.fetchers import HTTPFetcher
 from eltec2rdf.extractors.tree_extractors import (
     get_work_title,
     get_author_name,
     get_work_ids,
     get_author_ids
 )
+from eltec2rdf.utils.utils import ordered_map
+
+
+default_fetcher = HTTPFetcher()
+
+TEI_HEADER: str = "{http://www.tei-c.org/ns/1.0}teiHeader"
+
+
+def parse_tei_header(source: IO[bytes]) -> etree._ElementTree:
+    """Parse a TEI document only up to the end of tei:teiHeader.
+
+    Parsing stops once the header is complete, so tei:text is
+    (at most partially) read but never built into the tree.
+    Anything parsed after the header is dropped,
+    the returned tree holds the root element and tei:teiHeader only.
+    """
+    for _, header in etree.iterparse(source, events=("end",), tag=TEI_HEADER):
+        while (sibling := header.getnext()) is not None:
+            header.getparent().remove(sibling)
+
+        return header.getroottree()
+
+    raise ValueError("Unable to find tei:teiHeader.")
 
 
 @dataclass
@@ -36,11 +63,23 @@ class ELTeCPath:
 class ELTeCBindingsExtractor(collections.UserDict):
     """Binding Representation for an ELTeC resource."""
 
-    def __init__(self, eltec_url: str) -> None:
-        """Initialize a BindingExtractor object."""
+    def __init__(self,
+                 eltec_url: str,
+                 source: bytes | IO[bytes] | None = None,
+                 fetcher: HTTPFetcher = default_fetcher,
+                 header_only: bool = True) -> None:
+        """Initialize a BindingExtractor object.
+
+        The XML source can be given as bytes or a binary file object;
+        if no source is given, the resource is fetched from eltec_url.
+        With header_only, only tei:teiHeader is parsed
+        and the download is cut off after the header where possible.
+        """
         self._eltec_url = self._quote_iri(eltec_url)
         self._eltec_path = ELTeCPath(eltec_url)
-        self.data = self._generate_bindings()
+        self._fetcher = fetcher
+        self._header_only = header_only
+        self.data = self._generate_bindings(source)
 
     def _quote_iri(self, eltec_url: str) -> str:
         """Parse and ascii quote IRIs for processing."""
@@ -52,12 +91,22 @@ class ELTeCBindingsExtractor(collections.UserDict):
 
         return quoted_iri
 
-    def _generate_bindings(self) -> dict:
-        """Construct kwarg bindings for RDF generation."""
-        _temp_file_name, _ = urlretrieve(self._eltec_url)
+    def _parse(self, source: IO[bytes]) -> etree._ElementTree:
+        """Parse an XML source according to the header_only setting."""
+        if self._header_only:
+            return parse_tei_header(source)
+        return etree.parse(source)
 
-        with open(_temp_file_name) as f:
-            tree = etree.parse(f)
+    def _generate_bindings(self,
+                           source: bytes | IO[bytes] | None = None) -> dict:
+        """Construct kwarg bindings for RDF generation."""
+        if source is None:
+            with self._fetcher.stream(self._eltec_url) as f:
+                tree = self._parse(f)
+        elif isinstance(source, bytes):
+            tree = self._parse(io.BytesIO(source))
+        else:
+            tree = self._parse(source)
 
         bindings = {
             "resource_uri": self._eltec_path.url,
@@ -72,3 +121,24 @@ class ELTeCBindingsExtractor(collections.UserDict):
         }
 
         return bindings
+
+
+def extract_bindings(eltec_urls: Iterable[str],
+                     workers: int = 8,
+                     fetcher: HTTPFetcher = default_fetcher
+                     ) -> Iterator[ELTeCBindingsExtractor]:
+    """Fetch and parse ELTeC resources concurrently.
+
+    Resources are fetched and parsed by a bounded thread pool;
+    bindings are yielded in the order of eltec_urls.
+    """
+    def _extract(eltec_url: str) -> ELTeCBindingsExtractor:
+        return ELTeCBindingsExtractor(eltec_url, fetcher=fetcher)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from ordered_map(
+            _extract,
+            eltec_urls,
+            executor=executor,
+            window=2 * workers
+        )
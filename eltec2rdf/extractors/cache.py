@@ -0,0 +1,269 @@
+"""Persistent on-disk cache for raw ELTeC XML resources."""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO
+
+from loguru import logger
+
+from eltec2rdf.extractors.fetchers import FetchError, HTTPFetcher, notify
+from eltec2rdf.utils.utils import atomic_write
+
+
+def default_cache_dir() -> Path:
+    """Get the default cache directory, respecting XDG_CACHE_HOME."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "eltec2rdf"
+
+
+@dataclass
+class CacheEntry:
+    """Index record for a cached URL."""
+
+    digest: str
+    size: int
+    etag: str | None = None
+    accessed: float = 0.0
+
+
+class XMLCache:
+    """Content-addressed on-disk cache for raw XML resources.
+
+    Response bodies are stored once per sha256 digest under blobs/;
+    index.json maps URLs to digests, ETags and last access times.
+    If the total size of all blobs exceeds max_bytes,
+    least recently used entries are evicted until the cache
+    is 10% below max_bytes, so eviction does not run on every put.
+
+    The index is kept in memory and saved on close (or when the
+    context is left) and every checkpoint_every stored entries;
+    access times are only saved with the index.
+    """
+
+    def __init__(self,
+                 directory: Path | str | None = None,
+                 max_bytes: int = 2 * 1024 ** 3,
+                 checkpoint_every: int = 100) -> None:
+        """Initialize an XMLCache."""
+        self.directory = (
+            default_cache_dir() if directory is None
+            else Path(directory)
+        )
+        self.max_bytes = max_bytes
+        self.checkpoint_every = checkpoint_every
+
+        self._index_path = self.directory / "index.json"
+        self._blobs_path = self.directory / "blobs"
+        self._lock = threading.RLock()
+        self._index: dict[str, CacheEntry] = self._load_index()
+
+        self._refs: Counter[str] = Counter(
+            entry.digest for entry in self._index.values()
+        )
+        self._size: int = sum(
+            {entry.digest: entry.size for entry in self._index.values()}.values()
+        )
+        self._dirty: bool = False
+        self._pending: int = 0
+
+    def __enter__(self) -> "XMLCache":
+        """Enter an XMLCache context."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Save the index."""
+        self.close()
+
+    def close(self) -> None:
+        """Save the index if it changed."""
+        self.flush()
+
+    def flush(self) -> None:
+        """Save the index if it changed since it was last saved."""
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+
+    def _load_index(self) -> dict[str, CacheEntry]:
+        """Load the URL index from disk."""
+        try:
+            with open(self._index_path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(f"Ignoring corrupt cache index {self._index_path}.")
+            return {}
+
+        return {url: CacheEntry(**entry) for url, entry in data.items()}
+
+    def _save_index(self) -> None:
+        """Persist the URL index to disk."""
+        data = {url: asdict(entry) for url, entry in self._index.items()}
+        atomic_write(self._index_path, json.dumps(data).encode())
+        self._dirty = False
+        self._pending = 0
+
+    def _blob_path(self, digest: str) -> Path:
+        """Get the storage path for a blob digest."""
+        return self._blobs_path / digest[:2] / digest
+
+    def __contains__(self, url: str) -> bool:
+        """Check if a URL is cached."""
+        return self.get(url) is not None
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Get the index entry for url if its blob is present."""
+        with self._lock:
+            entry = self._index.get(url)
+
+            if entry is not None and not self._blob_path(entry.digest).exists():
+                self._drop(url)
+                return None
+
+            return entry
+
+    def read(self, url: str) -> bytes | None:
+        """Read the cached body for url and mark it as recently used.
+
+        None is returned if url is not cached, e.g. if its entry
+        was evicted by another thread since it was looked up.
+        """
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+
+            entry.accessed = time.time()
+            self._dirty = True
+            blob_path = self._blob_path(entry.digest)
+
+        try:
+            return blob_path.read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                if self._index.get(url) is entry:
+                    self._drop(url)
+            return None
+
+    def put(self, url: str, body: bytes, etag: str | None = None) -> None:
+        """Store body for url and evict entries if the cache grew too big."""
+        digest = hashlib.sha256(body).hexdigest()
+
+        with self._lock:
+            blob_path = self._blob_path(digest)
+            if not blob_path.exists():
+                atomic_write(blob_path, body)
+
+            if url in self._index:
+                self._drop(url, keep_blob=digest)
+
+            self._index[url] = CacheEntry(
+                digest=digest,
+                size=len(body),
+                etag=etag,
+                accessed=time.time()
+            )
+            if self._refs[digest] == 0:
+                self._size += len(body)
+            self._refs[digest] += 1
+
+            if self._size > self.max_bytes:
+                self._evict()
+
+            self._dirty = True
+            self._pending += 1
+            if self._pending >= self.checkpoint_every:
+                self._save_index()
+
+    def size(self) -> int:
+        """Get the total size of all cached blobs in bytes."""
+        with self._lock:
+            return self._size
+
+    def _drop(self, url: str, keep_blob: str | None = None) -> None:
+        """Remove the entry for url and its blob if no other URL uses it.
+
+        The blob with the digest keep_blob is never deleted.
+        """
+        entry = self._index.pop(url)
+        self._refs[entry.digest] -= 1
+        self._dirty = True
+
+        if self._refs[entry.digest] == 0:
+            del self._refs[entry.digest]
+            self._size -= entry.size
+            if entry.digest != keep_blob:
+                self._blob_path(entry.digest).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until 90% of max_bytes are used."""
+        lru = sorted(self._index.items(), key=lambda item: item[1].accessed)
+
+        for url, _ in lru:
+            if self._size <= 0.9 * self.max_bytes:
+                break
+            self._drop(url)
+
+
+class CachingFetcher(HTTPFetcher):
+    """HTTPFetcher that serves and revalidates responses via an XMLCache.
+
+    Cached URLs are revalidated with If-None-Match,
+    so unchanged resources cost no body transfer.
+    In offline mode, only cached resources are served.
+    """
+
+    def __init__(self,
+                 cache: XMLCache,
+                 offline: bool = False,
+                 **kwargs) -> None:
+        """Initialize a CachingFetcher."""
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.offline = offline
+
+    def fetch(self, url: str) -> bytes:
+        """Fetch the response body for url, using the cache where possible."""
+        entry = self.cache.get(url)
+
+        if self.offline:
+            if entry is None or (body := self.cache.read(url)) is None:
+                raise FetchError(f"'{url}' is not cached (offline mode).")
+            notify("cache_hits")
+            return body
+
+        headers = (
+            {"If-None-Match": entry.etag}
+            if entry is not None and entry.etag
+            else {}
+        )
+        response = self.request(url, headers)
+
+        if response.status == 304 and entry is not None:
+            if (body := self.cache.read(url)) is not None:
+                notify("cache_hits")
+                return body
+            # evicted since it was looked up: fetch the body again
+            response = self.request(url, {})
+
+        self.cache.put(url, response.body, response.headers.get("ETag"))
+        return response.body
+
+    @contextlib.contextmanager
+    def stream(self, url: str) -> Iterator[IO[bytes]]:
+        """Open the (cached) body for url as a binary file object.
+
+        Bodies are always fetched completely so that they can be cached.
+        """
+        yield io.BytesIO(self.fetch(url))
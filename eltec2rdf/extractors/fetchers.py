@@ -0,0 +1,271 @@
+"""Functionality for fetching ELTeC XML resources over HTTP."""
+
+import contextlib
+import http.client
+import threading
+import time
+
+from collections.abc import Callable, Iterator, Mapping
+from contextvars import ContextVar
+from typing import IO, Any, NamedTuple, TypeVar
+from urllib.parse import urljoin, urlsplit
+
+from loguru import logger
+
+
+T = TypeVar("T")
+
+_observer: ContextVar[Callable[[str, int], None] | None] = ContextVar(
+    "_observer", default=None
+)
+
+
+@contextlib.contextmanager
+def observe_transfers(observer: Callable[[str, int], None]) -> Iterator[None]:
+    """Report transfers in the current thread to observer(name, n).
+
+    Fetchers report "bytes_fetched" for response bytes read
+    from the network and "cache_hits" for responses served from a cache.
+    """
+    token = _observer.set(observer)
+    try:
+        yield
+    finally:
+        _observer.reset(token)
+
+
+def notify(name: str, n: int = 1) -> None:
+    """Report a transfer to the observer of the current thread, if any."""
+    if (observer := _observer.get()) is not None:
+        observer(name, n)
+
+
+class FetchError(Exception):
+    """Exception for indicating a failed fetch."""
+
+    def __init__(self,
+                 *args,
+                 status: int | None = None,
+                 headers: http.client.HTTPMessage | None = None) -> None:
+        """Initialize a FetchError with optional HTTP status and headers."""
+        super().__init__(*args)
+        self.status = status
+        self.headers = headers
+
+
+def retry_after(headers: Mapping[str, str] | None) -> float:
+    """Get the Retry-After delay in seconds from response headers."""
+    try:
+        return max(float(headers["Retry-After"]), 0.0)
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+
+
+class Response(NamedTuple):
+    """Minimal representation of an HTTP response."""
+
+    status: int
+    headers: http.client.HTTPMessage
+    body: bytes
+
+
+class _ObservedReader:
+    """Binary file object wrapper reporting the bytes read."""
+
+    def __init__(self, f: IO[bytes]) -> None:
+        """Initialize an _ObservedReader."""
+        self._f = f
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the wrapped file object."""
+        data = self._f.read(size)
+        notify("bytes_fetched", len(data))
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped file object."""
+        return getattr(self._f, name)
+
+
+class HTTPFetcher:
+    """Thread-safe HTTP client with keep-alive connection reuse and retries.
+
+    Connections are held per thread and per (scheme, host),
+    so every worker of a fetch pool reuses its own connection.
+    Failed requests and retryable status codes are retried
+    with exponential backoff.
+    """
+
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    redirect_statuses: frozenset[int] = frozenset({301, 302, 303, 307, 308})
+
+    def __init__(self,
+                 retries: int = 3,
+                 backoff: float = 0.5,
+                 timeout: float = 30.0,
+                 max_redirects: int = 5) -> None:
+        """Initialize an HTTPFetcher."""
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+
+        self._local = threading.local()
+
+    def _connections(self) -> dict[tuple[str, str], http.client.HTTPConnection]:
+        """Get the connection mapping of the current thread."""
+        try:
+            return self._local.connections
+        except AttributeError:
+            self._local.connections = {}
+            return self._local.connections
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Get or open a keep-alive connection for scheme and netloc."""
+        connections = self._connections()
+
+        if (connection := connections.get((scheme, netloc))) is None:
+            connection_class = (
+                http.client.HTTPSConnection if scheme == "https"
+                else http.client.HTTPConnection
+            )
+            connection = connection_class(netloc, timeout=self.timeout)
+            connections[(scheme, netloc)] = connection
+
+        return connection
+
+    def _drop_connection(self, scheme: str, netloc: str) -> None:
+        """Close and forget the connection for scheme and netloc."""
+        if connection := self._connections().pop((scheme, netloc), None):
+            connection.close()
+
+    def _open(self,
+              url: str,
+              headers: Mapping[str, str]) -> http.client.HTTPResponse:
+        """Send a single GET request and return the unread response."""
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        connection = self._connection(parts.scheme, parts.netloc)
+
+        try:
+            connection.request("GET", path, headers=dict(headers))
+            return connection.getresponse()
+        except (OSError, http.client.HTTPException):
+            self._drop_connection(parts.scheme, parts.netloc)
+            raise
+
+    def _open_following_redirects(
+            self,
+            url: str,
+            headers: Mapping[str, str]
+    ) -> tuple[str, http.client.HTTPResponse]:
+        """GET url and follow up to max_redirects redirects.
+
+        Return the final URL and its unread response.
+        """
+        for _ in range(self.max_redirects + 1):
+            response = self._open(url, headers)
+
+            if response.status in (200, 304):
+                return url, response
+
+            self._read(url, response)
+
+            if (
+                    response.status in self.redirect_statuses
+                    and (location := response.headers.get("Location"))
+            ):
+                url = urljoin(url, location)
+                continue
+
+            raise FetchError(
+                f"HTTP {response.status} for '{url}'.",
+                status=response.status,
+                headers=response.headers
+            )
+
+        raise FetchError(f"Too many redirects for '{url}'.")
+
+    def _read(self, url: str, response: http.client.HTTPResponse) -> bytes:
+        """Read a full response body for url."""
+        try:
+            body = response.read()
+            notify("bytes_fetched", len(body))
+            return body
+        except (OSError, http.client.HTTPException):
+            parts = urlsplit(url)
+            self._drop_connection(parts.scheme, parts.netloc)
+            raise
+
+    def _retry(self, url: str, function: Callable[[], T]) -> T:
+        """Call function and retry on connection errors and retry_statuses.
+
+        Delays grow exponentially but respect Retry-After headers.
+        """
+        error: Exception | None = None
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                delay = max(
+                    self.backoff * 2 ** (attempt - 1),
+                    retry_after(getattr(error, "headers", None))
+                )
+                logger.warning(f"Retrying {url} in {delay}s ({error}).")
+                time.sleep(delay)
+
+            try:
+                return function()
+            except (OSError, http.client.HTTPException) as e:
+                error = e
+            except FetchError as e:
+                if e.status not in self.retry_statuses:
+                    raise
+                error = e
+
+        raise FetchError(
+            f"Failed to fetch '{url}' after {self.retries + 1} attempts.",
+            status=getattr(error, "status", None),
+            headers=getattr(error, "headers", None)
+        ) from error
+
+    def request(self,
+                url: str,
+                headers: Mapping[str, str] | None = None) -> Response:
+        """Send a GET request with retries and return the final response.
+
+        Only 200 and 304 responses count as successful.
+        """
+        headers = {} if headers is None else headers
+
+        def _request() -> Response:
+            final_url, response = self._open_following_redirects(url, headers)
+            body = self._read(final_url, response)
+            return Response(response.status, response.headers, body)
+
+        return self._retry(url, _request)
+
+    def fetch(self, url: str) -> bytes:
+        """Fetch the response body for url."""
+        return self.request(url).body
+
+    @contextlib.contextmanager
+    def stream(self, url: str) -> Iterator[IO[bytes]]:
+        """Open the response body for url as a binary file object.
+
+        The body is read lazily; if it is not consumed completely,
+        the connection is closed instead of being reused.
+        """
+        final_url, response = self._retry(
+            url,
+            lambda: self._open_following_redirects(url, {})
+        )
+
+        try:
+            yield _ObservedReader(response)
+        finally:
+            if not response.isclosed():
+                parts = urlsplit(final_url)
+                self._drop_connection(parts.scheme, parts.netloc)
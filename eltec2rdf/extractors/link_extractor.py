@@ -4,64 +4,120 @@ import re
 import os
 
 from collections.abc import Iterator, Iterable
-from typing import Literal
+from functools import cache
+from typing import Literal, NamedTuple
 
-from github import Github, Auth
 from dotenv import load_dotenv
 
+from eltec2rdf.extractors.cache import default_cache_dir
+from eltec2rdf.extractors.listings import CachedListings, GitHubBackend
 
-# get token
-load_dotenv()
-token = os.getenv("TOKEN")
-auth = Auth.Token(token)
 
-g = Github(auth=auth)
+@cache
+def get_github_backend() -> GitHubBackend:
+    """Get the default GitHubBackend; constructed on first call.
 
+    The token is read from the TOKEN environment variable or a .env file.
+    """
+    load_dotenv()
+    return GitHubBackend(os.getenv("TOKEN"))
 
-def _get_raw_links(repository: str) -> Iterator[str]:
-    """Get raw XML file links from level1 of an ELTeC repo."""
-    repo = g.get_repo(repository)
-    contents = repo.get_contents("")
+
+@cache
+def get_default_listings() -> CachedListings:
+    """Get the default CachedListings; constructed on first call."""
+    return CachedListings(
+        get_github_backend(),
+        cache_path=default_cache_dir() / "listings.json"
+    )
+
+
+class ELTeCFile(NamedTuple):
+    """Raw XML file link and Git blob SHA of an ELTeC resource."""
+
+    url: str
+    sha: str
+
+
+def _get_raw_files(repository: str,
+                   listings: CachedListings
+                   ) -> Iterator[ELTeCFile]:
+    """Get raw XML file links and blob SHAs from level1 of an ELTeC repo."""
+    contents = listings.get(f"/repos/{repository}/contents/")
 
     try:
-        level1_dir = next(filter(lambda x: x.name == "level1", contents))
+        level1_dir = next(filter(lambda x: x["name"] == "level1", contents))
     except StopIteration:
         print(f"INFO: No 'level1' for '{repository}'.")
         return None
 
-    for f in repo.get_contents(level1_dir.path):
-        download_url = f.download_url
+    for f in listings.get(f"/repos/{repository}/contents/{level1_dir['path']}"):
+        download_url = f["download_url"]
         if download_url and download_url.endswith(".xml"):
-            yield download_url
+            yield ELTeCFile(download_url, f["sha"])
+
+
+def _get_raw_links(repository: str,
+                   listings: CachedListings
+                   ) -> Iterator[str]:
+    """Get raw XML file links from level1 of an ELTeC repo."""
+    for eltec_file in _get_raw_files(repository, listings):
+        yield eltec_file.url
 
 
-def _get_user_repos(username: str):
+def _get_user_repos(username: str,
+                    listings: CachedListings,
+                    per_page: int = 100) -> Iterator[dict]:
     """Get all repos given a Github username."""
-    user = g.get_user(username)
-    user_repos = user.get_repos()
+    page = 1
+
+    while user_repos := listings.get(
+            f"/users/{username}/repos?per_page={per_page}&page={page}"
+    ):
+        yield from user_repos
 
-    for repo in user_repos:
-        yield repo
+        if len(user_repos) < per_page:
+            break
+        page += 1
 
 
-def _get_eltec_corpus_repos() -> Iterator[str]:
+def _get_eltec_corpus_repos(listings: CachedListings) -> Iterator[str]:
     """Filter down ELTeC repos for corpora repos.."""
-    eltec_repos = _get_user_repos("COST-ELTeC ")
+    eltec_repos = _get_user_repos("COST-ELTeC", listings)
 
     for repo in eltec_repos:
-        repo_name = repo.name
+        repo_name = repo["name"]
         if re.match(r"ELTeC-.+", repo_name):
             yield repo_name
 
 
-def get_eltec_xml_links(*, repos: Iterable[str] | Literal["all"]) -> Iterator[str]:
-    """Get XML file links from level1 folders across all ELTec repos."""
+def get_eltec_xml_files(
+        *,
+        repos: Iterable[str] | Literal["all"],
+        listings: CachedListings | None = None
+) -> Iterator[ELTeCFile]:
+    """Get XML file links and blob SHAs from level1 folders of ELTeC repos.
+
+    If no listings are given, the default listings are used.
+    """
+    if listings is None:
+        listings = get_default_listings()
+
     corpus_repo_names = (
-        _get_eltec_corpus_repos()
+        _get_eltec_corpus_repos(listings)
         if repos == "all"
         else repos
     )
 
     for repo_name in corpus_repo_names:
         full_repo_name = f"COST-ELTeC/{repo_name}"
-        yield from _get_raw_links(full_repo_name)
+        yield from _get_raw_files(full_repo_name, listings)
+
+
+def get_eltec_xml_links(*,
+                        repos: Iterable[str] | Literal["all"],
+                        listings: CachedListings | None = None
+                        ) -> Iterator[str]:
+    """Get XML file links from level1 folders across all ELTec repos."""
+    for eltec_file in get_eltec_xml_files(repos=repos, listings=listings):
+        yield eltec_file.url
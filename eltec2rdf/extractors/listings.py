@@ -0,0 +1,205 @@
+"""Cached, rate-limit aware access to GitHub API listings."""
+
+import json
+import threading
+import time
+
+from pathlib import Path
+from typing import Any, NamedTuple, Protocol
+
+from loguru import logger
+
+from eltec2rdf.extractors.fetchers import FetchError, HTTPFetcher
+from eltec2rdf.utils.utils import atomic_write
+
+
+class Listing(NamedTuple):
+    """JSON data and ETag of an API response.
+
+    data is None if the response was 304 Not Modified.
+    """
+
+    data: Any
+    etag: str | None
+
+
+class ListingBackend(Protocol):
+    """Protocol for listing backends.
+
+    Backends resolve GitHub REST API paths (e.g. '/repos/{repo}/contents/')
+    to JSON data; a local fake can stand in for GitHub this way.
+    """
+
+    def get(self, path: str, etag: str | None = None) -> Listing:
+        """Get the JSON data for path.
+
+        If etag is given and still current, return Listing(None, etag).
+        """
+        ...
+
+
+class GitHubBackend:
+    """Listing backend for the GitHub REST API.
+
+    Requests are sent conditionally if an ETag is known;
+    304 responses do not count against GitHub's rate limit.
+    If the rate limit is exhausted, requests wait until
+    the reset time given in the x-ratelimit-* response headers.
+    """
+
+    def __init__(self,
+                 token: str | None = None,
+                 base_url: str = "https://api.github.com",
+                 fetcher: HTTPFetcher | None = None,
+                 max_wait: float = 3600.0) -> None:
+        """Initialize a GitHubBackend."""
+        self.token = token
+        self.base_url = base_url.rstrip("/")
+        self.fetcher = HTTPFetcher() if fetcher is None else fetcher
+        self.max_wait = max_wait
+
+        self._reset_at: float = 0.0
+
+    def _headers(self, etag: str | None) -> dict[str, str]:
+        """Construct request headers."""
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "eltec2rdf"
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if etag:
+            headers["If-None-Match"] = etag
+
+        return headers
+
+    def _rate_limit_delay(self, headers) -> float | None:
+        """Get the delay in seconds until the rate limit resets.
+
+        Return None if headers do not indicate an exhausted rate limit.
+        """
+        if headers is None:
+            return None
+
+        if headers.get("x-ratelimit-remaining") == "0":
+            reset = float(headers.get("x-ratelimit-reset", 0))
+            return max(reset - time.time(), 0.0) + 1.0
+
+        if retry_after := headers.get("Retry-After"):
+            return float(retry_after)
+
+        return None
+
+    def _wait(self, delay: float) -> None:
+        """Sleep for delay seconds unless delay exceeds max_wait."""
+        if delay > self.max_wait:
+            raise FetchError(
+                f"GitHub rate limit exhausted for another {delay:.0f}s."
+            )
+
+        logger.warning(f"GitHub rate limit exhausted, waiting {delay:.0f}s.")
+        time.sleep(delay)
+
+    def get(self, path: str, etag: str | None = None) -> Listing:
+        """Get the JSON data for an API path."""
+        if (delay := self._reset_at - time.time()) > 0:
+            self._wait(delay)
+
+        while True:
+            try:
+                response = self.fetcher.request(
+                    f"{self.base_url}{path}",
+                    self._headers(etag)
+                )
+            except FetchError as e:
+                if (
+                        e.status not in (403, 429)
+                        or (delay := self._rate_limit_delay(e.headers)) is None
+                ):
+                    raise
+                self._wait(delay)
+            else:
+                break
+
+        if response.headers.get("x-ratelimit-remaining") == "0":
+            self._reset_at = float(response.headers.get("x-ratelimit-reset", 0))
+
+        if response.status == 304:
+            return Listing(None, etag)
+
+        return Listing(json.loads(response.body), response.headers.get("ETag"))
+
+
+class CachedListings:
+    """TTL cache for listings with conditional revalidation.
+
+    Listings younger than ttl seconds are served without a request;
+    older ones are revalidated with their ETag.
+    In offline mode, cached listings are served whatever their age
+    and the backend is never used.
+    If a cache_path is given, the cache persists across runs.
+    """
+
+    def __init__(self,
+                 backend: ListingBackend,
+                 cache_path: Path | str | None = None,
+                 ttl: float = 3600.0,
+                 offline: bool = False) -> None:
+        """Initialize CachedListings."""
+        self.backend = backend
+        self.cache_path = None if cache_path is None else Path(cache_path)
+        self.ttl = ttl
+        self.offline = offline
+
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = self._load()
+
+    def _load(self) -> dict[str, dict]:
+        """Load cached listings from cache_path."""
+        if self.cache_path is None:
+            return {}
+
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(f"Ignoring corrupt listing cache {self.cache_path}.")
+            return {}
+
+    def _save(self) -> None:
+        """Persist cached listings to cache_path."""
+        if self.cache_path is not None:
+            atomic_write(self.cache_path, json.dumps(self._entries).encode())
+
+    def get(self, path: str) -> Any:
+        """Get the JSON data for an API path."""
+        with self._lock:
+            entry = self._entries.get(path)
+
+            if self.offline:
+                if entry is None:
+                    raise FetchError(f"'{path}' is not cached (offline mode).")
+                return entry["data"]
+
+            if entry is not None and time.time() - entry["fetched"] < self.ttl:
+                return entry["data"]
+
+            listing = self.backend.get(
+                path,
+                etag=None if entry is None else entry["etag"]
+            )
+
+            if listing.data is None and entry is not None:
+                entry["fetched"] = time.time()
+            else:
+                entry = {
+                    "data": listing.data,
+                    "etag": listing.etag,
+                    "fetched": time.time()
+                }
+                self._entries[path] = entry
+
+            self._save()
+            return entry["data"]
@@ -0,0 +1,222 @@
+"""Sources of ELTeC XML resources: GitHub, repository archives and checkouts.
+
+Every source lists its level1 XML files as ELTeCFile(url, sha) and
+extracts bindings for a selection of those URLs. Files read from
+archives and checkouts get the raw.githubusercontent.com URL they
+would have on GitHub and their Git blob SHA, so bindings and
+manifest records are the same regardless of the source.
+"""
+
+import hashlib
+import tarfile
+import tempfile
+import zipfile
+
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import IO, Protocol
+
+from eltec2rdf.extractors.bindings_extractor import (
+    ELTeCBindingsExtractor,
+    default_fetcher,
+    extract_bindings
+)
+from eltec2rdf.extractors.fetchers import HTTPFetcher
+from eltec2rdf.extractors.link_extractor import (
+    ELTeCFile,
+    get_eltec_xml_files
+)
+from eltec2rdf.extractors.listings import CachedListings
+
+
+def raw_url(repo: str, ref: str, name: str) -> str:
+    """Construct the raw.githubusercontent.com URL of a level1 file."""
+    return (
+        "https://raw.githubusercontent.com/"
+        f"COST-ELTeC/{repo}/{ref}/level1/{name}"
+    )
+
+
+def git_blob_sha(f: IO[bytes], size: int, chunk_size: int = 1 << 16) -> str:
+    """Compute the Git blob SHA of a file object of a given size."""
+    sha = hashlib.sha1(f"blob {size}\0".encode())
+
+    while chunk := f.read(chunk_size):
+        sha.update(chunk)
+
+    return sha.hexdigest()
+
+
+def _is_level1_xml(member_name: str) -> bool:
+    """Check if an archive member is a level1 XML file.
+
+    Members are expected at level1/ or <top-level dir>/level1/.
+    """
+    path = PurePosixPath(member_name)
+    return (
+        path.suffix == ".xml"
+        and len(path.parts) in (2, 3)
+        and path.parts[-2] == "level1"
+    )
+
+
+class ELTeCSource(Protocol):
+    """Protocol for sources of ELTeC XML resources."""
+
+    def files(self) -> Iterator[ELTeCFile]:
+        """List the level1 XML files of the source."""
+        ...
+
+    def extract(self, urls: Iterable[str]) -> Iterator[Mapping]:
+        """Extract bindings for urls (as listed by files) in order."""
+        ...
+
+
+class GitHubSource:
+    """Source reading level1 files via raw GitHub URLs."""
+
+    def __init__(self,
+                 repo: str,
+                 listings: CachedListings | None = None,
+                 fetcher: HTTPFetcher = default_fetcher,
+                 workers: int = 8) -> None:
+        """Initialize a GitHubSource."""
+        self.repo = repo
+        self.listings = listings
+        self.fetcher = fetcher
+        self.workers = workers
+
+    def files(self) -> Iterator[ELTeCFile]:
+        """List level1 XML files via the GitHub API."""
+        return get_eltec_xml_files(repos=[self.repo], listings=self.listings)
+
+    def extract(self, urls: Iterable[str]) -> Iterator[Mapping]:
+        """Fetch and parse urls concurrently."""
+        return extract_bindings(
+            urls,
+            workers=self.workers,
+            fetcher=self.fetcher
+        )
+
+
+class CheckoutSource:
+    """Source reading level1 files from a local clone of an ELTeC repo."""
+
+    def __init__(self,
+                 directory: Path | str,
+                 repo: str | None = None,
+                 ref: str = "master") -> None:
+        """Initialize a CheckoutSource.
+
+        The repo name defaults to the name of the directory.
+        """
+        self.directory = Path(directory)
+        self.repo = self.directory.name if repo is None else repo
+        self.ref = ref
+
+    def _paths(self) -> dict[str, Path]:
+        """Map raw URLs to level1 XML paths."""
+        return {
+            raw_url(self.repo, self.ref, path.name): path
+            for path in sorted((self.directory / "level1").glob("*.xml"))
+        }
+
+    def files(self) -> Iterator[ELTeCFile]:
+        """List level1 XML files with their Git blob SHAs."""
+        for url, path in self._paths().items():
+            with open(path, "rb") as f:
+                yield ELTeCFile(url, git_blob_sha(f, path.stat().st_size))
+
+    def extract(self, urls: Iterable[str]) -> Iterator[Mapping]:
+        """Parse the files for urls."""
+        paths = self._paths()
+
+        for url in urls:
+            with open(paths[url], "rb") as f:
+                yield ELTeCBindingsExtractor(url, source=f)
+
+
+class ArchiveSource:
+    """Source reading level1 files from a tarball or zipball of an ELTeC repo.
+
+    Members are streamed from the archive into the parser;
+    nothing is extracted to disk.
+    """
+
+    def __init__(self,
+                 archive: Path | str,
+                 repo: str,
+                 ref: str = "master") -> None:
+        """Initialize an ArchiveSource."""
+        self.archive = Path(archive)
+        self.repo = repo
+        self.ref = ref
+
+    def _members(self) -> Iterator[tuple[str, int, IO[bytes]]]:
+        """Iterate over (name, size, file object) of level1 XML members.
+
+        File objects are only valid until the next member is requested.
+        """
+        if zipfile.is_zipfile(self.archive):
+            with zipfile.ZipFile(self.archive) as archive:
+                for info in archive.infolist():
+                    if _is_level1_xml(info.filename):
+                        with archive.open(info) as f:
+                            yield info.filename, info.file_size, f
+            return
+
+        with tarfile.open(self.archive, mode="r|*") as archive:
+            for member in archive:
+                if member.isfile() and _is_level1_xml(member.name):
+                    yield member.name, member.size, archive.extractfile(member)
+
+    def _url(self, member_name: str) -> str:
+        """Get the raw URL for an archive member."""
+        return raw_url(self.repo, self.ref, PurePosixPath(member_name).name)
+
+    def files(self) -> Iterator[ELTeCFile]:
+        """List level1 XML files with their Git blob SHAs, sorted by URL."""
+        files = [
+            ELTeCFile(self._url(name), git_blob_sha(f, size))
+            for name, size, f in self._members()
+        ]
+
+        return iter(sorted(files))
+
+    def extract(self, urls: Iterable[str]) -> Iterator[Mapping]:
+        """Parse the members for urls in a single pass over the archive.
+
+        Only headers are parsed; bindings are buffered
+        so that they can be yielded in the order of urls.
+        """
+        urls = list(urls)
+        wanted = set(urls)
+        bindings: dict[str, Mapping] = {}
+
+        for name, _, f in self._members():
+            if (url := self._url(name)) in wanted:
+                bindings[url] = ELTeCBindingsExtractor(url, source=f)
+
+        for url in urls:
+            yield bindings[url]
+
+
+@contextmanager
+def download_archive(repo: str,
+                     ref: str = "master",
+                     fetcher: HTTPFetcher = default_fetcher
+                     ) -> Iterator[ArchiveSource]:
+    """Download the tarball of an ELTeC repo to a temporary file.
+
+    The tarball is removed when the context is left.
+    """
+    url = f"https://codeload.github.com/COST-ELTeC/{repo}/tar.gz/{ref}"
+
+    with tempfile.NamedTemporaryFile(suffix=".tar.gz") as temp_file:
+        with fetcher.stream(url) as response:
+            while chunk := response.read(1 << 20):
+                temp_file.write(chunk)
+        temp_file.flush()
+
+        yield ArchiveSource(temp_file.name, repo=repo, ref=ref)
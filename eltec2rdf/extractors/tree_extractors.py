@@ -3,7 +3,7 @@
 import re
 
 from collections.abc import Sequence
-from functools import partial
+from functools import cache
 from typing import Any, Literal, TypeVar
 
 from lxml import etree
@@ -14,12 +14,19 @@ from eltec2rdf.utils.utils import first, trim
 
 T = TypeVar("T")
 
-TEIXPath = partial(
-    etree.XPath,
-    namespaces={
-        "tei": "http://www.tei-c.org/ns/1.0"
-    }
-)
+tei_namespaces: dict[str, str] = {
+    "tei": "http://www.tei-c.org/ns/1.0"
+}
+
+
+@cache
+def TEIXPath(path: str) -> etree.XPath:
+    """Get a compiled XPath evaluator with the TEI namespace bound.
+
+    Evaluators are compiled once per expression and kept
+    in a module-level registry shared by all extractors.
+    """
+    return etree.XPath(path, namespaces=tei_namespaces)
 
 
 def _trim_title_stmt(value: str) -> str:
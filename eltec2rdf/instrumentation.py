@@ -0,0 +1,170 @@
+"""Stage timers, counters and profiling for conversion runs."""
+
+import contextlib
+import cProfile
+import io
+import pstats
+import threading
+import time
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any, TypeVar
+
+from eltec2rdf.extractors.fetchers import HTTPFetcher, observe_transfers
+
+
+T = TypeVar("T")
+
+
+class Metrics:
+    """Thread-safe stage timers and counters for a conversion run.
+
+    Stage times are cumulative over all threads (and worker processes)
+    working on a stage, so concurrent stages can add up
+    to more than the wall time of the run.
+    """
+
+    def __init__(self) -> None:
+        """Initialize Metrics."""
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+        self.seconds: defaultdict[str, float] = defaultdict(float)
+        self.calls: defaultdict[str, int] = defaultdict(int)
+        self.counters: defaultdict[str, int] = defaultdict(int)
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        """Record seconds spent in stage."""
+        with self._lock:
+            self.seconds[stage] += seconds
+            self.calls[stage] += 1
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Increment the counter name by n."""
+        with self._lock:
+            self.counters[name] += n
+
+    @contextlib.contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start)
+
+    def timed(self, iterable: Iterable[T], stage: str) -> Iterator[T]:
+        """Iterate over iterable and time every step as stage."""
+        iterator = iter(iterable)
+
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            self.add_time(stage, time.perf_counter() - start)
+            yield item
+
+    def summary(self, **labels: Any) -> dict[str, Any]:
+        """Get a JSON-serializable summary of the run so far.
+
+        labels (e.g. the repo name) are included as top-level keys.
+        """
+        with self._lock:
+            wall = time.perf_counter() - self._start
+            documents = self.counters.get("documents", 0)
+
+            return {
+                **labels,
+                "wall_seconds": round(wall, 6),
+                "stages": {
+                    stage: {
+                        "seconds": round(seconds, 6),
+                        "calls": self.calls[stage]
+                    }
+                    for stage, seconds in self.seconds.items()
+                },
+                "counters": dict(self.counters),
+                "documents_per_second": (
+                    round(documents / wall, 3) if wall else None
+                )
+            }
+
+
+class _TimedReader:
+    """Binary file object wrapper timing reads."""
+
+    def __init__(self, f: IO[bytes], metrics: Metrics) -> None:
+        """Initialize a _TimedReader."""
+        self._f = f
+        self._metrics = metrics
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the wrapped file object."""
+        with self._metrics.timer("fetch"):
+            return self._f.read(size)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped file object."""
+        return getattr(self._f, name)
+
+
+class InstrumentedFetcher:
+    """Fetcher wrapper recording fetch times and transfers.
+
+    Bytes read from the network are counted as "bytes_fetched",
+    responses served from a cache (see CachingFetcher) as "cache_hits".
+    """
+
+    def __init__(self, fetcher: HTTPFetcher, metrics: Metrics) -> None:
+        """Initialize an InstrumentedFetcher."""
+        self.fetcher = fetcher
+        self.metrics = metrics
+
+    def fetch(self, url: str) -> bytes:
+        """Fetch the response body for url."""
+        with observe_transfers(self.metrics.count), self.metrics.timer("fetch"):
+            return self.fetcher.fetch(url)
+
+    @contextlib.contextmanager
+    def stream(self, url: str) -> Iterator[IO[bytes]]:
+        """Open the response body for url as a binary file object."""
+        with observe_transfers(self.metrics.count), contextlib.ExitStack() as stack:
+            with self.metrics.timer("fetch"):
+                f = stack.enter_context(self.fetcher.stream(url))
+
+            yield _TimedReader(f, self.metrics)
+
+
+def profile(function: Callable,
+            *args: Any,
+            output: Path | str,
+            profiler: str = "cprofile",
+            **kwargs: Any) -> str:
+    """Run function under a profiler and write the profile to output.
+
+    With "cprofile", pstats data is written to output; with "pyinstrument"
+    (optional dependency), an HTML report is written.
+    A text report is returned in both cases.
+    """
+    if profiler == "pyinstrument":
+        from pyinstrument import Profiler
+
+        with Profiler() as _profiler:
+            function(*args, **kwargs)
+        Path(output).write_text(_profiler.output_html())
+        return _profiler.output_text()
+
+    if profiler != "cprofile":
+        raise ValueError(f"Unknown profiler '{profiler}'.")
+
+    _profiler = cProfile.Profile()
+    _profiler.runcall(function, *args, **kwargs)
+    _profiler.dump_stats(output)
+
+    stream = io.StringIO()
+    pstats.Stats(_profiler, stream=stream).sort_stats("cumulative").print_stats(25)
+    return stream.getvalue()
@@ -1,17 +1,72 @@
 """Public entry point for the eltec2rdf script."""
 
-from collections.abc import Iterator
+import argparse
+import contextlib
+import itertools
+import json
+import time
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
 
 from clisn import CLSInfraNamespaceManager
 from lodkit.graph import Graph
+from lodkit.types import _Triple
 from loguru import logger
+from rdflib import URIRef
+
 
+from eltec2rdf.batches import TripleBatch
+from eltec2rdf.extractors.bindings_extractor import (
+    ELTeCBindingsExtractor,
+    ELTeCPath,
+    default_fetcher
+)
+from eltec2rdf.extractors.cache import (
+    CachingFetcher,
+    XMLCache,
+    default_cache_dir
+)
+from eltec2rdf.extractors.fetchers import HTTPFetcher
+from eltec2rdf.extractors.link_extractor import (
+    ELTeCFile,
+    get_github_backend
+)
+from eltec2rdf.extractors.listings import CachedListings
+from eltec2rdf.extractors.sources import (
+    ArchiveSource,
+    CheckoutSource,
+    ELTeCSource,
+    GitHubSource,
+    download_archive
+)
+from eltec2rdf.instrumentation import InstrumentedFetcher, Metrics, profile
+from eltec2rdf.manifest import (
+    Manifest,
+    ManifestRecord,
+    bindings_hash,
+    to_ntriples
+)
+from eltec2rdf.parallel import (
+    generate_document_triples,
+    generate_triples_parallel
+)
+from eltec2rdf.rdfgenerators import ELTeCActorGenerator, ELTeCCorpusGenerator
+from eltec2rdf.registry import ActorRecord, EntityRegistry, RegistryTurn
+from eltec2rdf.utils.utils import add_triples
+from eltec2rdf.writers import (
+    OUTPUT_FORMATS,
+    SHARD_INDEX,
+    NTriplesWriter,
+    ShardedWriter,
+    open_output
+)
 
-from eltec2rdf.extractors.bindings_extractor import ELTeCBindingsExtractor
-from eltec2rdf.extractors.link_extractor import get_eltec_xml_links
-from eltec2rdf.rdfgenerators import CLSCorGenerator
 
+# rdflib store plugins that keep the graph in memory
+MEMORY_STORES: set[str] = {"default", "Memory", "SimpleMemory"}
 
 REPOS: list[str] = [
     "ELTeC-eng",
@@ -22,29 +77,887 @@ REPOS: list[str] = [
 ]
 
 
-def generate_graph(repo: str) -> Graph:
-    """Process an ELTeC repo, generate a graph and serialize to output file."""
-    uris: Iterator[str] = get_eltec_xml_links(repos=[repo])
+def _generate_batches(
+        bindings: Iterable[Mapping],
+        executor: ProcessPoolExecutor | None,
+        jobs: int,
+        max_in_flight: int = 16,
+        metrics: Metrics | None = None,
+        trusted: bool = False
+) -> Iterator[tuple[str, Iterable[_Triple]]]:
+    """Generate (resource_uri, triples) pairs for every bindings mapping.
 
-    _output_file_name: str = f'{repo.lower().replace("-", "_")}.ttl'
-    output_file = Path(f"./output/{_output_file_name}")
+    Extraction (fetching and parsing), triple generation and
+    the consumer of the pairs (the writer) run as overlapping stages
+    of a pipeline (see generate_triples_parallel).
+    Without an executor, triples are generated in threads
+    of the calling process.
+    """
+    batches = generate_triples_parallel(
+        bindings,
+        executor,
+        jobs,
+        max_in_flight=max_in_flight,
+        metrics=metrics,
+        trusted=trusted
+    )
 
-    g = Graph()
-    CLSInfraNamespaceManager(g)
+    for resource_uri, triples in batches:
+        logger.info(f"Generating triples for {Path(resource_uri).stem}")
+        yield resource_uri, triples
 
-    for uri in uris:
-        bindings = ELTeCBindingsExtractor(uri)
-        triples = CLSCorGenerator(**bindings)
 
-        logger.info(f"Generating triples for {Path(uri).stem}")
+def _corpus_batch(repo: str) -> tuple[str, list[_Triple]]:
+    """Generate the (repo URL, triples) pair for the corpus-level entities."""
+    return (
+        f"https://github.com/COST-ELTeC/{repo}",
+        list(ELTeCCorpusGenerator(repo_id=repo.lower()))
+    )
 
-        for triple in triples:
-            g.add(triple)
 
-    with open(output_file, "w") as f:
-        f.write(g.serialize())
+def _registered(bindings: Iterable[Mapping],
+                registry: EntityRegistry,
+                repo: str | None = None,
+                resolved: Callable[[], object] | None = None) -> Iterator[Mapping]:
+    """Resolve the canonical actor URI for every bindings mapping.
 
+    resolved is called once all bindings are resolved.
+    """
+    for _bindings in bindings:
+        actor_uri = registry.resolve(
+            _bindings["resource_uri"],
+            _bindings["author_name"],
+            _bindings["author_ids"] or (),
+            repo=repo
+        )
+        yield {**_bindings, "actor_uri": str(actor_uri)}
 
-if __name__ == "__main__":
+    if resolved is not None:
+        resolved()
+
+
+def _actor_batches(
+        repo: str,
+        actors: Callable[[], list[ActorRecord]],
+        metrics: Metrics | None = None
+) -> Iterator[tuple[str, list[_Triple]]]:
+    """Generate the (repo URL, triples) pair for the actors of repo.
+
+    This is a generator, so the actors are only looked up
+    once all documents before it have been registered.
+    """
+    actors = actors()
+    if metrics is not None:
+        metrics.count("actors", len(actors))
+
+    yield (
+        f"https://github.com/COST-ELTeC/{repo}#actors",
+        [
+            triple
+            for actor in actors
+            for triple in ELTeCActorGenerator(**asdict(actor))
+        ]
+    )
+
+
+def _incremental_batches(
+        files: Iterable[ELTeCFile],
+        repo: str,
+        manifest: Manifest,
+        extract: Callable[[Iterable[str]], Iterable[Mapping]],
+        generate: Callable[[Iterable[Mapping]], Iterator[tuple[str, Iterable[_Triple]]]],
+        rebuild: bool = False,
+        metrics: Metrics | None = None,
+        registry: EntityRegistry | None = None,
+        checkpoint_every: int = 50
+) -> Iterator[tuple[str, Iterable[_Triple]]]:
+    """Reuse stored triples for unchanged files and convert the rest.
+
+    A file is unchanged if its blob SHA matches the manifest record
+    (and its author is known to the registry, if one is given).
+    Newly generated triples are recorded in the manifest;
+    records of files that vanished from the repo are pruned.
+    Stored triples are yielded as TripleBatches, so they are
+    only parsed into rdflib terms if the output needs a Graph.
+
+    Records are committed (and the registry saved) every
+    checkpoint_every documents, so an interrupted run loses
+    at most that many converted documents.
+    """
+    files = list(files)
+    stored: dict[str, ManifestRecord] = {}
+
+    if not rebuild:
+        for eltec_file in files:
+            record = manifest.get(eltec_file.url)
+            if (
+                    record is not None
+                    and record.source_sha == eltec_file.sha
+                    and (registry is None or eltec_file.url in registry)
+            ):
+                stored[eltec_file.url] = record
+
+    hashes: dict[str, str] = {}
+
+    def _hashed(bindings: Iterable[Mapping]) -> Iterator[Mapping]:
+        for _bindings in bindings:
+            hashes[_bindings["resource_uri"]] = bindings_hash(_bindings)
+            yield _bindings
+
+    changed = (f.url for f in files if f.url not in stored)
+    generated = generate(_hashed(extract(changed)))
+    pending = 0
+
+    def _checkpoint() -> None:
+        with (
+                contextlib.nullcontext() if metrics is None
+                else metrics.timer("checkpoint")
+        ):
+            manifest.commit()
+            if registry is not None:
+                registry.save()
+
+    for eltec_file in files:
+        if (record := stored.get(eltec_file.url)) is not None:
+            logger.info(f"Reusing triples for {Path(eltec_file.url).stem}")
+            if metrics is not None:
+                metrics.count("documents_reused")
+            yield eltec_file.url, TripleBatch.from_ntriples(record.triples)
+            continue
+
+        resource_uri, triples = next(generated)
+        if not isinstance(triples, TripleBatch):
+            triples = list(triples)
+
+        manifest.put(
+            ManifestRecord(
+                resource_uri=resource_uri,
+                repo=repo,
+                source_sha=eltec_file.sha,
+                bindings_hash=hashes.pop(resource_uri),
+                triples=to_ntriples(triples)
+            ),
+            commit=False
+        )
+
+        pending += 1
+        if pending >= checkpoint_every:
+            _checkpoint()
+            pending = 0
+
+        yield resource_uri, triples
+
+    _checkpoint()
+    manifest.prune(repo, keep=(f.url for f in files))
+
+
+def generate_graph(repo: str,
+                   workers: int = 8,
+                   fetcher: HTTPFetcher = default_fetcher,
+                   executor: ProcessPoolExecutor | None = None,
+                   jobs: int = 1,
+                   output_format: str = "turtle",
+                   compress: bool = False,
+                   manifest_path: Path | None = None,
+                   rebuild: bool = False,
+                   listings: CachedListings | None = None,
+                   source: ELTeCSource | None = None,
+                   batch_size: int = 10_000,
+                   store: str = "default",
+                   store_path: Path | None = None,
+                   max_in_flight: int = 16,
+                   metrics: Metrics | None = None,
+                   trusted: bool = False,
+                   registry: EntityRegistry | None = None,
+                   checkpoint_every: int = 50,
+                   shard_size: int | None = None,
+                   turn: RegistryTurn | None = None
+                   ) -> Graph | None:
+    """Process an ELTeC repo, generate a graph and serialize to output file.
+
+    XML resources are fetched concurrently by a pool of worker threads.
+    If a process pool executor is given, bindings validation and
+    triple generation run in its worker processes.
+    Fetching, generation and writing overlap;
+    at most max_in_flight documents are in flight between them.
+
+    For the "nt" and "nq" output formats, triples are streamed
+    to the output file without building a Graph; None is returned.
+    For Turtle output, triples are added to the Graph
+    in batches of batch_size.
+
+    The Graph is backed by the rdflib store plugin store, e.g. an
+    on-disk store like "BerkeleyDB" or "Oxigraph" (via oxrdflib) opened
+    at store_path; with a store_path, triples are deduplicated in the
+    store for all output formats and None is returned. Only "nt" and "nq"
+    output is then written with flat memory use; rdflib's Turtle
+    serializer indexes the whole graph in memory. A store_path
+    for an in-memory store (see MEMORY_STORES) raises a ValueError.
+
+    If a shard_size is given, the output is written as one shard per
+    shard_size documents to ./output/<repo>/, along with an index of
+    the shards' triple counts, sizes and hashes (see ShardedWriter);
+    no Graph (or store) is used and None is returned.
+
+    If a manifest_path is given, only documents whose source changed
+    since the last run are converted (unless rebuild is set);
+    stored triples are reused for all others. Converted documents
+    are checkpointed to the manifest every checkpoint_every documents.
+
+    By default, XML resources are read from GitHub (see GitHubSource);
+    a repository archive or local checkout can be given as source instead.
+
+    Triples for entities shared by all documents of the repo
+    (see ELTeCCorpusGenerator) are written once, before any document.
+
+    Authors are resolved to canonical actors in registry (see
+    EntityRegistry) and actor triples are written once per actor cluster,
+    after all documents. Without a registry, the manifest database
+    is used as registry if given, else an in-memory registry.
+    If the registry is shared with concurrent repos, the repo resolves
+    its authors in its turn (see RegistryTurn); the turn ends once all
+    documents are resolved, the actors are looked up and documents
+    that vanished from the repo are pruned from the registry.
+    The registry is saved once the output is written (or on failure).
+
+    Stage times and counters are recorded in metrics; a JSON summary
+    is logged and written to ./output/<repo>.metrics.json.
+
+    If trusted is set, pydantic validation of the extracted bindings
+    is skipped (see eltec2rdf.models.BindingsRecord).
+    """
+    if store_path is not None and store in MEMORY_STORES:
+        raise ValueError(f"The {store} store cannot be opened at a store_path.")
+
+    metrics = Metrics() if metrics is None else metrics
+
+    if source is None:
+        source = GitHubSource(
+            repo, listings, InstrumentedFetcher(fetcher, metrics), workers
+        )
+
+    if registry is None:
+        registry = EntityRegistry(manifest_path)
+    if turn is None:
+        turn = RegistryTurn()
+
+    with contextlib.ExitStack() as stack:
+        # saved after the manifest committed pending records on exit
+        stack.callback(registry.save)
+        # ended on failure as well, so that later turns do not wait forever
+        stack.callback(turn.end)
+
+        with metrics.timer("list"):
+            files: list[ELTeCFile] = list(source.files())
+
+        urls = [f.url for f in files]
+        actors: list[ActorRecord] = []
+
+        def _look_up_actors() -> None:
+            actors.extend(registry.actors(urls))
+            registry.prune(repo, keep=urls)
+
+        def _end_turn() -> list[ActorRecord]:
+            turn.end(_look_up_actors)
+            return actors
+
+        turn.wait()
+
+        def _generate(
+                bindings: Iterable[Mapping]
+        ) -> Iterator[tuple[str, Iterable[_Triple]]]:
+            return _generate_batches(
+                _registered(bindings, registry, repo, resolved=_end_turn),
+                executor, jobs, max_in_flight, metrics, trusted
+            )
+
+        if manifest_path is None:
+            batches = _generate(source.extract(urls))
+        else:
+            manifest = stack.enter_context(Manifest(manifest_path))
+            batches = _incremental_batches(
+                files, repo, manifest, source.extract, _generate,
+                rebuild=rebuild,
+                metrics=metrics,
+                registry=registry,
+                checkpoint_every=checkpoint_every
+            )
+
+        graph = _write_output(
+            itertools.chain(
+                [_corpus_batch(repo)],
+                batches,
+                _actor_batches(repo, _end_turn, metrics)
+            ),
+            repo,
+            output_format,
+            compress,
+            batch_size,
+            store,
+            store_path,
+            metrics,
+            shard_size
+        )
+
+    summary = metrics.summary(repo=repo, output_format=output_format)
+    logger.info(f"Metrics: {json.dumps(summary)}")
+    Path(f"./output/{_output_stem(repo)}.metrics.json").write_text(
+        json.dumps(summary, indent=2)
+    )
+
+    return graph
+
+
+@contextlib.contextmanager
+def _open_graph(store: str = "default",
+                store_path: Path | None = None) -> Iterator[Graph]:
+    """Open a Graph backed by an rdflib store plugin.
+
+    If a store_path is given, the store is opened (and created if necessary)
+    at store_path, emptied and closed when the context is left.
+    """
+    g = Graph(store=store)
+
+    if store_path is None:
+        yield g
+        return
+
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    g.open(str(store_path), create=not store_path.exists())
+
+    try:
+        g.remove((None, None, None))
+        yield g
+    finally:
+        g.close()
+
+
+def _output_stem(repo: str) -> str:
+    """Get the stem of output file names for repo."""
+    return repo.lower().replace("-", "_")
+
+
+def _output_file(repo: str,
+                 output_format: str,
+                 compress: bool,
+                 sharded: bool = False) -> Path:
+    """Get the path of the output file of repo.
+
+    For sharded output, this is the path of the shard index.
+    """
+    if sharded:
+        return Path(f"./output/{_output_stem(repo)}/{SHARD_INDEX}")
+    return Path(
+        f"./output/{_output_stem(repo)}.{OUTPUT_FORMATS[output_format]}"
+        f'{".gz" if compress else ""}'
+    )
+
+
+def _write_output(batches: Iterable[tuple[str, Iterable[_Triple]]],
+                  repo: str,
+                  output_format: str,
+                  compress: bool,
+                  batch_size: int = 10_000,
+                  store: str = "default",
+                  store_path: Path | None = None,
+                  metrics: Metrics | None = None,
+                  shard_size: int | None = None) -> Graph | None:
+    """Write triple batches to the output file of repo.
+
+    Without a store_path, "nt" and "nq" output is streamed
+    without deduplication. Otherwise triples are loaded into a Graph
+    (backed by store) and serialized from there.
+
+    With a shard_size, batches are written as shards of shard_size
+    documents; repo-level batches (corpus entities and actors)
+    are written to shards of their own.
+
+    Time spent waiting for batches is recorded as "wait",
+    the remaining time as "write" (and "serialize").
+    """
+    metrics = Metrics() if metrics is None else metrics
+    output_file = _output_file(
+        repo, output_format, compress, sharded=shard_size is not None
+    )
+
+    batches = metrics.timed(batches, "wait")
+    waited = metrics.seconds["wait"]
+    start = time.perf_counter()
+
+    def _record_write() -> None:
+        metrics.add_time(
+            "write",
+            time.perf_counter() - start - (metrics.seconds["wait"] - waited)
+        )
+
+    graph_name = (
+        URIRef(f"https://github.com/COST-ELTeC/{repo}")
+        if output_format == "nq"
+        else None
+    )
+
+    if shard_size is not None:
+        repo_shards = {
+            f"https://github.com/COST-ELTeC/{repo}": "corpus",
+            f"https://github.com/COST-ELTeC/{repo}#actors": "actors"
+        }
+
+        with ShardedWriter(
+                output_file.parent, output_format, graph_name,
+                compress, shard_size
+        ) as writer:
+            for url, triples in batches:
+                metrics.count(
+                    "triples",
+                    writer.write_shard(repo_shards[url], triples)
+                    if url in repo_shards
+                    else writer.write(ELTeCPath(url).stem, triples)
+                )
+
+        metrics.count("shards", len(writer.shards))
+        metrics.count("shards_unchanged", writer.unchanged)
+        _record_write()
+        return None
+
+    if output_format != "turtle" and store_path is None:
+        with NTriplesWriter(output_file, graph_name, compress) as writer:
+            for _, triples in batches:
+                metrics.count("triples", writer.write(triples))
+
+        _record_write()
+        return None
+
+    with _open_graph(store, store_path) as g:
+        CLSInfraNamespaceManager(g)
+
+        count = add_triples(
+            g,
+            (triple for _, triples in batches for triple in triples),
+            batch_size=batch_size
+        )
+        metrics.count("triples", count)
+        _record_write()
+
+        with metrics.timer("serialize"):
+            if output_format == "turtle":
+                with open_output(output_file, compress, binary=True) as f:
+                    g.serialize(destination=f, format="turtle", encoding="utf-8")
+            else:
+                with NTriplesWriter(output_file, graph_name, compress) as writer:
+                    writer.write(g.triples((None, None, None)))
+
+        return g if store_path is None else None
+
+
+def profile_document(url: str,
+                     source: ELTeCSource | None = None,
+                     fetcher: HTTPFetcher = default_fetcher,
+                     profiler: str = "cprofile") -> str:
+    """Profile extraction and triple generation for a single document.
+
+    The document is read from source or fetched from url;
+    everything runs in the calling thread, so the profile is complete.
+    The profile is written to ./output/<stem>.prof (cprofile)
+    or ./output/<stem>.html (pyinstrument); a text report is returned.
+    """
+    def _convert() -> None:
+        bindings = (
+            ELTeCBindingsExtractor(url, fetcher=fetcher) if source is None
+            else next(iter(source.extract([url])))
+        )
+        generate_document_triples(dict(bindings))
+
+    suffix = ".html" if profiler == "pyinstrument" else ".prof"
+    output = Path(f"./output/{Path(url).stem.lower()}{suffix}")
+    report = profile(_convert, output=output, profiler=profiler)
+
+    logger.info(f"Profile written to {output}")
+    return report
+
+
+def _local_source(directory: Path, repo: str) -> ELTeCSource:
+    """Get a source for repo from a local checkout or archive in directory."""
+    for suffix in (".tar.gz", ".tgz", ".zip"):
+        if (archive := directory / f"{repo}{suffix}").exists():
+            return ArchiveSource(archive, repo=repo)
+
+    return CheckoutSource(directory / repo, repo=repo)
+
+
+def _pending_repos(manifest_path: Path | None,
+                   resume: bool,
+                   output_format: str,
+                   compress: bool,
+                   sharded: bool = False) -> list[str]:
+    """Get the REPOS to convert and reset the journal of a new run.
+
+    When resuming, repos whose output file was completed
+    in the interrupted run (see Manifest.finish_repo) are skipped.
+    """
+    if manifest_path is None:
+        return REPOS
+
+    with Manifest(manifest_path) as manifest:
+        if not resume:
+            manifest.clear_journal()
+            return REPOS
+
+        finished = manifest.finished_repos()
+
+    repos = []
     for repo in REPOS:
-        generate_graph(repo)
+        output_file = _output_file(repo, output_format, compress, sharded)
+        if finished.get(repo) == output_file and output_file.exists():
+            logger.info(f"Skipping {repo}, finished in the interrupted run")
+        else:
+            repos.append(repo)
+
+    return repos
+
+
+def main() -> None:
+    """Parse CLI arguments and run the conversion for all REPOS."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of concurrent XML downloads per repo (default: 8)."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes for triple generation (default: 1). "
+            "With more than one job, all repos are converted concurrently."
+        )
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=16,
+        metavar="N",
+        help=(
+            "Maximum number of documents between the fetch, generate "
+            "and write stages of a repo (default: 16)."
+        )
+    )
+    parser.add_argument(
+        "--trusted",
+        action="store_true",
+        help=(
+            "Skip pydantic validation of the bindings extracted "
+            "from the XML resources."
+        )
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="turtle",
+        help=(
+            "Output format (default: turtle). "
+            "nt and nq are streamed to disk without an in-memory graph."
+        )
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10_000,
+        metavar="N",
+        help=(
+            "Number of triples per bulk insert into the graph "
+            "for Turtle output (default: 10000)."
+        )
+    )
+    parser.add_argument(
+        "--store",
+        default="default",
+        metavar="NAME",
+        help=(
+            "rdflib store plugin for the graph (default: in-memory), "
+            "e.g. BerkeleyDB or Oxigraph (requires oxrdflib)."
+        )
+    )
+    parser.add_argument(
+        "--store-path",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help=(
+            "Open the store on disk at DIR/<repo>; "
+            "also deduplicates nt and nq output."
+        )
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Write one output file per N documents to output/<repo>/, "
+            "with an index.json of triple counts, sizes and hashes."
+        )
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip-compress the output files."
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory of the XML cache (default: ~/.cache/eltec2rdf)."
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=2048,
+        help="Maximum size of the XML cache in MiB (default: 2048)."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download XML files and bypass the cache."
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve XML files and GitHub directory listings from the cache only."
+    )
+    parser.add_argument(
+        "--listing-ttl",
+        type=float,
+        default=3600,
+        help=(
+            "Seconds for which cached GitHub directory listings are used "
+            "without revalidation (default: 3600)."
+        )
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=None,
+        help=(
+            "SQLite manifest for incremental runs, e.g. output/manifest.db. "
+            "Only documents whose source changed since the last run "
+            "are converted."
+        )
+    )
+    parser.add_argument(
+        "--registry",
+        type=Path,
+        default=None,
+        help=(
+            "SQLite registry of actors shared across documents and repos, "
+            "reused by later runs (default: the manifest if given, "
+            "else in memory)."
+        )
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Convert all documents and refresh the manifest and the registry."
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Resume an interrupted run: skip repos whose output was "
+            "completed and reuse checkpointed documents (requires --manifest)."
+        )
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=50,
+        metavar="N",
+        help=(
+            "Commit converted documents to the manifest "
+            "every N documents (default: 50)."
+        )
+    )
+    parser.add_argument(
+        "--archives",
+        action="store_true",
+        help=(
+            "Read XML files from one tarball download per repo "
+            "instead of fetching every file separately."
+        )
+    )
+    parser.add_argument(
+        "--local",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help=(
+            "Read XML files from local checkouts (DIR/<repo>/) "
+            "or archives (DIR/<repo>.tar.gz, .tgz or .zip)."
+        )
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        metavar="URL",
+        help=(
+            "Profile the conversion of a single document "
+            "(raw GitHub URL of a level1 file) instead of converting repos."
+        )
+    )
+    parser.add_argument(
+        "--profiler",
+        choices=("cprofile", "pyinstrument"),
+        default="cprofile",
+        help="Profiler for --profile (default: cprofile)."
+    )
+    args = parser.parse_args()
+
+    if args.archives and args.local:
+        parser.error("--archives and --local are mutually exclusive.")
+    if args.no_cache and args.offline:
+        parser.error("--offline requires the cache.")
+    if args.resume and args.manifest is None:
+        parser.error("--resume requires --manifest.")
+    if args.resume and args.rebuild:
+        parser.error("--resume and --rebuild are mutually exclusive.")
+    if args.shard_size is not None and args.shard_size < 1:
+        parser.error("--shard-size must be at least 1.")
+    if args.shard_size is not None and args.store_path is not None:
+        parser.error("--shard-size and --store-path are mutually exclusive.")
+    if args.store_path is not None and args.store in MEMORY_STORES:
+        parser.error(
+            "--store-path requires a persistent --store, e.g. BerkeleyDB."
+        )
+
+    cache = (
+        None if args.no_cache
+        else XMLCache(args.cache_dir, max_bytes=args.cache_size * 1024 ** 2)
+    )
+    # the cache index is saved when the run ends
+    cache_context = contextlib.nullcontext() if cache is None else cache
+    fetcher = (
+        default_fetcher if cache is None
+        else CachingFetcher(cache, offline=args.offline)
+    )
+
+    listings = CachedListings(
+        get_github_backend(),
+        cache_path=(args.cache_dir or default_cache_dir()) / "listings.json",
+        ttl=args.listing_ttl,
+        offline=args.offline
+    )
+
+    registry = EntityRegistry(args.registry or args.manifest)
+    if args.rebuild:
+        registry.clear()
+
+    options = {
+        "workers": args.workers,
+        "fetcher": fetcher,
+        "output_format": args.format,
+        "compress": args.gzip,
+        "batch_size": args.batch_size,
+        "max_in_flight": args.max_in_flight,
+        "trusted": args.trusted,
+        "store": args.store,
+        "manifest_path": args.manifest,
+        "rebuild": args.rebuild,
+        "checkpoint_every": args.checkpoint_every,
+        "shard_size": args.shard_size,
+        "listings": listings,
+        "registry": registry
+    }
+
+    @contextlib.contextmanager
+    def _open_source(repo: str) -> Iterator[ELTeCSource | None]:
+        if args.archives:
+            with download_archive(repo, fetcher=HTTPFetcher()) as source:
+                yield source
+        elif args.local:
+            yield _local_source(args.local, repo)
+        else:
+            yield None
+
+    def _convert(repo: str,
+                 turn: RegistryTurn | None = None,
+                 **kwargs) -> None:
+        store_path = None if args.store_path is None else args.store_path / repo
+        metrics = Metrics()
+
+        try:
+            with _open_source(repo) as source:
+                generate_graph(
+                    repo,
+                    source=source,
+                    store_path=store_path,
+                    metrics=metrics,
+                    turn=turn,
+                    **{**options, **kwargs}
+                )
+        finally:
+            if turn is not None:
+                turn.end()
+
+        if args.manifest is not None:
+            with Manifest(args.manifest) as manifest:
+                manifest.finish_repo(
+                    repo,
+                    _output_file(
+                        repo, args.format, args.gzip,
+                        sharded=args.shard_size is not None
+                    ),
+                    metrics.counters["documents"]
+                    + metrics.counters["documents_reused"]
+                )
+
+    if args.profile:
+        with cache_context, _open_source(Path(args.profile).parts[3]) as source:
+            print(
+                profile_document(
+                    args.profile,
+                    source=source,
+                    fetcher=fetcher,
+                    profiler=args.profiler
+                )
+            )
+        return
+
+    repos = _pending_repos(
+        args.manifest, args.resume, args.format, args.gzip,
+        sharded=args.shard_size is not None
+    )
+
+    if args.jobs <= 1:
+        with cache_context, registry:
+            for repo in repos:
+                _convert(repo)
+        return
+
+    # repos take turns resolving authors in the order of repos,
+    # so that the output is the same as for a serial run
+    turns = RegistryTurn.chain(repos)
+
+    with (
+            cache_context,
+            registry,
+            ProcessPoolExecutor(max_workers=args.jobs) as executor,
+            ThreadPoolExecutor(max_workers=len(REPOS)) as repo_executor
+    ):
+        futures = [
+            repo_executor.submit(
+                _convert,
+                repo,
+                executor=executor,
+                jobs=args.jobs,
+                turn=turns[repo]
+            )
+            for repo in repos
+        ]
+
+        for future in futures:
+            future.result()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""SQLite-backed manifest for incremental conversion of ELTeC documents."""
+
+import hashlib
+import json
+import sqlite3
+import time
+
+from collections.abc import Iterable, Mapping
+from dataclasses import astuple, dataclass
+from pathlib import Path
+
+from lodkit.types import _Triple
+from rdflib.plugins.serializers.nt import _nt_row
+
+from eltec2rdf.batches import TripleBatch
+
+
+def bindings_hash(bindings: Mapping) -> str:
+    """Compute a stable sha256 hash for a bindings mapping."""
+    data = json.dumps(dict(bindings), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def to_ntriples(triples: Iterable[_Triple] | TripleBatch) -> str:
+    """Serialize triples to an N-Triples string."""
+    if isinstance(triples, TripleBatch):
+        return triples.to_ntriples()
+    return "".join(map(_nt_row, triples))
+
+
+@dataclass
+class ManifestRecord:
+    """Manifest entry for a converted ELTeC document."""
+
+    resource_uri: str
+    repo: str
+    source_sha: str
+    bindings_hash: str
+    triples: str
+
+
+class Manifest:
+    """Record of converted documents, their source SHAs and triples.
+
+    Documents whose source SHA is unchanged since the last run
+    can be skipped and their stored triples reused.
+
+    A journal records the repos whose output was completely written,
+    so an interrupted run can be resumed (see eltec2rdf.main).
+
+    Uncommitted records are held in memory and written in a single
+    short transaction on commit, so several manifests (e.g. of repos
+    converted concurrently) and the registry can share a database
+    without waiting for each other's pending records.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Initialize a Manifest and create the database if necessary."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(self.path, timeout=60)
+        self._pending: dict[str, ManifestRecord] = {}
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS documents (
+                resource_uri TEXT PRIMARY KEY,
+                repo TEXT NOT NULL,
+                source_sha TEXT NOT NULL,
+                bindings_hash TEXT NOT NULL,
+                triples TEXT NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS journal (
+                repo TEXT PRIMARY KEY,
+                output TEXT NOT NULL,
+                documents INTEGER NOT NULL,
+                finished REAL NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+
+    def __enter__(self) -> "Manifest":
+        """Enter a Manifest context."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the database connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Persist pending records and close the database connection."""
+        self.commit()
+        self._connection.close()
+
+    def get(self, resource_uri: str) -> ManifestRecord | None:
+        """Get the record for resource_uri."""
+        if (record := self._pending.get(resource_uri)) is not None:
+            return record
+
+        row = self._connection.execute(
+            "SELECT * FROM documents WHERE resource_uri = ?",
+            (resource_uri,)
+        ).fetchone()
+
+        return None if row is None else ManifestRecord(*row)
+
+    def put(self, record: ManifestRecord, commit: bool = True) -> None:
+        """Insert or replace a record.
+
+        Unless commit is set, the record is only persisted
+        with the next call to Manifest.commit.
+        """
+        self._pending[record.resource_uri] = record
+        if commit:
+            self.commit()
+
+    def commit(self) -> None:
+        """Persist all pending records."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?)",
+                map(astuple, self._pending.values())
+            )
+        self._pending.clear()
+
+    def finish_repo(self, repo: str, output: Path | str, documents: int) -> None:
+        """Record in the journal that the output of repo is complete."""
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO journal VALUES (?, ?, ?, ?)",
+                (repo, str(output), documents, time.time())
+            )
+
+    def finished_repos(self) -> dict[str, Path]:
+        """Get the repos recorded in the journal and their output files."""
+        return {
+            repo: Path(output)
+            for repo, output in self._connection.execute(
+                "SELECT repo, output FROM journal"
+            )
+        }
+
+    def clear_journal(self) -> None:
+        """Clear the journal at the start of a new run."""
+        with self._connection:
+            self._connection.execute("DELETE FROM journal")
+
+    def prune(self, repo: str, keep: Iterable[str]) -> int:
+        """Delete records of repo whose resource_uri is not in keep.
+
+        Return the number of deleted records.
+        """
+        keep = set(keep)
+        stale = [
+            (resource_uri,)
+            for (resource_uri,) in self._connection.execute(
+                "SELECT resource_uri FROM documents WHERE repo = ?",
+                (repo,)
+            )
+            if resource_uri not in keep
+        ]
+
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM documents WHERE resource_uri = ?",
+                stale
+            )
+
+        return len(stale)
@@ -1,19 +1,20 @@
-"""Pydantic models for RDFGenerator bindings validation."""
+"""Pydantic models for RDFGenerator bindings validation.
+
+The slotted records at the end of the module mirror the pydantic models
+without validation; they are meant for trusted bindings,
+i.e. bindings produced by eltec2rdf.extractors.
+"""
 
 from collections.abc import Iterator
-from typing import Literal
+from dataclasses import dataclass
+from typing import Any, Literal
 
-from rdflib.namespace import RDFS
 from pydantic import BaseModel, ConfigDict
 
-import lodkit.importer
-from eltec2rdf.vocabs import identifier
+from eltec2rdf.vocabs.vocabs import vocab_labels
 
 
-# better list cast here, else the iterator will likely be exhausted somewhere
-vocab_id_types: tuple[str, ...] = tuple(
-    map(str, identifier.objects(None, RDFS.label))
-)
+vocab_id_types: tuple[str, ...] = tuple(vocab_labels("identifier.ttl"))
 
 source_types: tuple[str, ...] = (
     "firstEdition",
@@ -36,6 +37,23 @@ class SourceData(IDMapping):
     source_type: Literal[source_types]  # type: ignore
 
 
+class CorpusBindingsModel(BaseModel):
+    """Bindings model schema for corpus-level CLSCor conversion."""
+
+    repo_id: str
+
+
+class ActorBindingsModel(BaseModel):
+    """Bindings model schema for actor clusters (see EntityRegistry)."""
+
+    actor_uri: str
+    author_name: str
+
+    names: list[str]
+    ids: list[IDMapping]
+    aliases: list[str] = []
+
+
 class BindingsBaseModel(BaseModel):
     """Bindings model schema for basic CLSCor conversion."""
 
@@ -47,3 +65,68 @@ class BindingsBaseModel(BaseModel):
 
     author_ids: list[IDMapping] | None = None
     work_ids: list[SourceData] | None = None
+
+    # canonical actor URI from an EntityRegistry
+    actor_uri: str | None = None
+
+
+@dataclass(slots=True)
+class IDRecord:
+    """Unvalidated counterpart of IDMapping."""
+
+    id_type: str | None
+    id_value: str | None = None
+
+
+@dataclass(slots=True)
+class SourceRecord(IDRecord):
+    """Unvalidated counterpart of SourceData."""
+
+    source_type: str = "unspecified"
+
+
+@dataclass(slots=True)
+class BindingsRecord:
+    """Unvalidated counterpart of BindingsBaseModel for trusted bindings.
+
+    Nested author_ids/work_ids mappings are converted to records,
+    no values are checked. Unlike BindingsBaseModel, extra bindings
+    other than file_stem, repo_id and actor_uri are dropped.
+    """
+
+    resource_uri: str
+    work_title: str
+    author_name: str
+
+    author_ids: list[IDRecord] | None = None
+    work_ids: list[SourceRecord] | None = None
+
+    file_stem: str | None = None
+    repo_id: str | None = None
+    actor_uri: str | None = None
+
+    def __init__(self,
+                 resource_uri: str,
+                 work_title: str,
+                 author_name: str,
+                 author_ids: list[dict] | None = None,
+                 work_ids: list[dict] | None = None,
+                 file_stem: str | None = None,
+                 repo_id: str | None = None,
+                 actor_uri: str | None = None,
+                 **_: Any) -> None:
+        """Initialize a BindingsRecord from (trusted) bindings."""
+        self.resource_uri = resource_uri
+        self.work_title = work_title
+        self.author_name = author_name
+        self.author_ids = (
+            None if author_ids is None
+            else [IDRecord(**ids) for ids in author_ids]
+        )
+        self.work_ids = (
+            None if work_ids is None
+            else [SourceRecord(**ids) for ids in work_ids]
+        )
+        self.file_stem = file_stem
+        self.repo_id = repo_id
+        self.actor_uri = actor_uri
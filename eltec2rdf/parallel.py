@@ -0,0 +1,99 @@
+"""Functionality for pipelined and process-based parallel triple generation."""
+
+import time
+
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Executor
+
+from lodkit.types import _Triple
+
+from eltec2rdf.batches import TripleBatch
+from eltec2rdf.instrumentation import Metrics
+from eltec2rdf.models import BindingsBaseModel, BindingsRecord
+from eltec2rdf.pipeline import Stage, pipeline
+from eltec2rdf.rdfgenerators import CLSCorGenerator
+
+
+def generate_document_triples(
+        bindings: dict,
+        trusted: bool = False,
+        encode: bool = False
+) -> tuple[str, list[_Triple] | TripleBatch, dict[str, float]]:
+    """Validate bindings and generate the triples for a single document.
+
+    This runs in worker processes, so bindings and the returned
+    (resource_uri, triple batch, stage times) triple must be picklable.
+    Stage times are seconds spent on bindings validation and generation.
+
+    If trusted is set, pydantic validation is skipped
+    and bindings are only converted to slotted records.
+
+    If encode is set, the triples are returned as a TripleBatch,
+    which is much cheaper to pickle than rdflib terms;
+    the time spent encoding is recorded as "encode".
+    """
+    start = time.perf_counter()
+    generator = CLSCorGenerator(
+        model=BindingsRecord if trusted else BindingsBaseModel,
+        **bindings
+    )
+    validated = time.perf_counter()
+    triples = list(generator)
+    generated = time.perf_counter()
+    seconds = {
+        "validate": validated - start,
+        "generate": generated - validated
+    }
+
+    if encode:
+        triples = TripleBatch.from_triples(triples)
+        seconds["encode"] = time.perf_counter() - generated
+
+    return bindings["resource_uri"], triples, seconds
+
+
+def generate_triples_parallel(
+        bindings: Iterable[Mapping],
+        executor: Executor | None = None,
+        jobs: int = 1,
+        max_in_flight: int = 16,
+        metrics: Metrics | None = None,
+        trusted: bool = False
+) -> Iterator[tuple[str, list[_Triple] | TripleBatch]]:
+    """Generate per-document triple batches in a staged pipeline.
+
+    bindings are consumed in a feeder thread, so fetching and parsing
+    overlap with generation and with the consumer of the batches.
+    jobs threads generate triples, in worker processes if an executor
+    is given; batches from worker processes are transferred
+    as dictionary-encoded TripleBatches. Batches are yielded
+    in the order of bindings; at most max_in_flight documents
+    are in flight at any time.
+
+    If metrics are given, the time spent waiting for bindings
+    is recorded as "extract", along with "validate" and "generate"
+    (and "encode") times and a "documents" count.
+
+    If trusted is set, bindings validation is skipped
+    (see generate_document_triples).
+    """
+    def _generate(_bindings: Mapping) -> tuple[str, list[_Triple] | TripleBatch]:
+        resource_uri, triples, seconds = (
+            generate_document_triples(dict(_bindings), trusted) if executor is None
+            else executor.submit(
+                generate_document_triples, dict(_bindings), trusted, True
+            ).result()
+        )
+
+        if metrics is not None:
+            for stage, _seconds in seconds.items():
+                metrics.add_time(stage, _seconds)
+            metrics.count("documents")
+
+        return resource_uri, triples
+
+    yield from pipeline(
+        bindings if metrics is None else metrics.timed(bindings, "extract"),
+        Stage(_generate, workers=jobs),
+        max_in_flight=max_in_flight
+    )
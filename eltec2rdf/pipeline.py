@@ -0,0 +1,129 @@
+"""Threaded pipeline with bounded queues between stages.
+
+Items are read from an iterable by a feeder thread and passed through
+a sequence of stages, each run by its own pool of worker threads;
+results are yielded in the order of the input.
+
+Backpressure: queues between stages are bounded, and an admission
+semaphore bounds the number of items in flight (including results
+waiting in the reorder buffer), so a slow consumer throttles all stages.
+"""
+
+import queue
+import threading
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, NamedTuple
+
+
+_DONE = object()
+
+
+class Stage(NamedTuple):
+    """Pipeline stage applying function to items in workers threads."""
+
+    function: Callable[[Any], Any]
+    workers: int = 1
+
+
+class _Failure(NamedTuple):
+    """Exception raised for an item; re-raised in the consumer."""
+
+    exception: BaseException
+
+
+def pipeline(items: Iterable[Any],
+             *stages: Stage,
+             max_in_flight: int = 16) -> Iterator[Any]:
+    """Run items through stages concurrently and yield results in order.
+
+    The first exception raised by the items iterable or a stage function
+    is re-raised when its position is reached. If the consumer stops
+    early, remaining items are drained without calling stage functions.
+    """
+    stop = threading.Event()
+    admission = threading.Semaphore(max_in_flight)
+    lock = threading.Lock()
+
+    queues: list[queue.Queue] = [
+        queue.Queue(maxsize=max_in_flight) for _ in range(len(stages) + 1)
+    ]
+    remaining: list[int] = [stage.workers for stage in stages]
+
+    def _readers(k: int) -> int:
+        """Get the number of threads reading from queues[k]."""
+        return stages[k].workers if k < len(stages) else 1
+
+    def _admit() -> bool:
+        """Wait for admission of an item unless the pipeline is stopped."""
+        while not admission.acquire(timeout=0.1):
+            if stop.is_set():
+                return False
+        return not stop.is_set()
+
+    def _feed() -> None:
+        count = 0
+        try:
+            for item in items:
+                if not _admit():
+                    return
+                queues[0].put((count, item))
+                count += 1
+        except BaseException as e:
+            if _admit():
+                queues[0].put((count, _Failure(e)))
+        finally:
+            for _ in range(_readers(0)):
+                queues[0].put(_DONE)
+
+    def _work(k: int) -> None:
+        function = stages[k].function
+
+        while (entry := queues[k].get()) is not _DONE:
+            index, item = entry
+            if not isinstance(item, _Failure) and not stop.is_set():
+                try:
+                    item = function(item)
+                except BaseException as e:
+                    item = _Failure(e)
+            queues[k + 1].put((index, item))
+
+        with lock:
+            remaining[k] -= 1
+            last = remaining[k] == 0
+
+        if last:
+            for _ in range(_readers(k + 1)):
+                queues[k + 1].put(_DONE)
+
+    threads = [threading.Thread(target=_feed, daemon=True)] + [
+        threading.Thread(target=_work, args=(k,), daemon=True)
+        for k, stage in enumerate(stages)
+        for _ in range(stage.workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    buffer: dict[int, Any] = {}
+    next_index = 0
+    entry = None
+
+    try:
+        while (entry := queues[-1].get()) is not _DONE:
+            index, result = entry
+            buffer[index] = result
+
+            while next_index in buffer:
+                result = buffer.pop(next_index)
+                next_index += 1
+                admission.release()
+
+                if isinstance(result, _Failure):
+                    raise result.exception
+                yield result
+    finally:
+        stop.set()
+        while entry is not _DONE:
+            entry = queues[-1].get()
+        for thread in threads:
+            thread.join()
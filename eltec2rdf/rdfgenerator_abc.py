@@ -8,38 +8,60 @@ from typing import Any
 from lodkit.types import _Triple
 from rdflib import Graph as RDFLibGraph
 
-from eltec2rdf.models import BindingsBaseModel
+from eltec2rdf.models import BindingsBaseModel, BindingsRecord
+from eltec2rdf.utils.utils import add_triples
 
 
 class RDFGenerator(abc.ABC):
     """RDFGenerator ABC."""
 
     def __init__(self,
-                 model: type[BindingsBaseModel] = BindingsBaseModel,
+                 model: type[BindingsBaseModel | BindingsRecord] = BindingsBaseModel,
                  graph: RDFLibGraph | None = None,
                  **bindings: Any) -> None:
-        """Initialize an RDFGenerator."""
+        """Initialize an RDFGenerator.
+
+        bindings are validated against the pydantic model;
+        for trusted bindings, pass model=BindingsRecord to skip validation.
+        """
         self.bindings = model(**bindings)
 
-        self._triples = self.generate_triples()
-        self._graph = RDFLibGraph() if graph is None else graph
+        self._triples: Iterator[_Triple] | None = None
+        self._graph = graph
 
-    def to_graph(self):
-        """Add triples to an rdflib.Graph instance and return."""
-        for triple in self._triples:
-            self._graph.add(triple)
+    def to_graph(self, batch_size: int = 10_000):
+        """Add triples to an rdflib.Graph instance and return.
 
-        return self._graph
+        Triples are inserted in batches of batch_size using Graph.addN.
+        """
+        add_triples(self.graph, self.triples, batch_size=batch_size)
+        return self.graph
 
     @property
     def graph(self):
         """Getter for the rdflib.Graph component.
 
+        The Graph is created on first access.
         For updating (i.e. adding triples to) the Graph component,
         run the RDFGenerator.to_graph method.
         """
+        if self._graph is None:
+            self._graph = RDFLibGraph()
+
         return self._graph
 
+    @property
+    def triples(self) -> Iterator[_Triple]:
+        """Getter for the triple iterator.
+
+        generate_triples is called on first access,
+        so initialization only validates the bindings.
+        """
+        if self._triples is None:
+            self._triples = self.generate_triples()
+
+        return self._triples
+
     @abc.abstractmethod
     def generate_triples(self) -> Iterator[_Triple]:
         """Generate an iterator of triples.
@@ -51,7 +73,7 @@ class RDFGenerator(abc.ABC):
 
     def __iter__(self):
         """Return an iterator object."""
-        return self._triples
+        return self.triples
 
     def __next__(self):
         """Return the next item from the iterator."""
@@ -3,35 +3,227 @@
 import itertools
 
 from collections.abc import Iterator
-from contextlib import suppress
 from types import SimpleNamespace
 
-from lodkit.types import _Triple
-from eltec2rdf.utils.utils import plist
+import clisn
 
-from rdflib import Literal, URIRef
-from rdflib.namespace import RDF, RDFS, OWL
-from clisn import crm, crmcls, lrm
+from lodkit.types import _Triple
+from rdflib import Graph, Literal, URIRef, namespace
 
 from eltec2rdf.rdfgenerator_abc import RDFGenerator
-from eltec2rdf.utils.utils import mkuri, uri_ns, resolve_source_type
-from eltec2rdf.vocabs.vocabs import vocab, VocabLookupException
-from eltec2rdf.models import SourceData
+from eltec2rdf.utils.utils import (
+    InternedNamespace,
+    literal,
+    mkuri,
+    resolve_source_type,
+    ttl_triples,
+    uri_ns
+)
+from eltec2rdf.vocabs.vocabs import vocab, vocab_lookup
+from eltec2rdf.models import (
+    ActorBindingsModel,
+    CorpusBindingsModel,
+    IDMapping,
+    SourceData
+)
+
+
+# attribute access on rdflib namespaces creates a new URIRef every time
+RDF, RDFS, OWL = (
+    InternedNamespace(ns) for ns in (namespace.RDF, namespace.RDFS, namespace.OWL)
+)
+crm, crmcls, lrm = (
+    InternedNamespace(ns) for ns in (clisn.crm, clisn.crmcls, clisn.lrm)
+)
+
+schema_level1: str = (
+    "https://raw.githubusercontent.com/COST-ELTeC/"
+    "Schemas/master/eltec-1.rng"
+)
+
+
+def corpus_uris(repo_id: str) -> SimpleNamespace:
+    """Get the URIs of entities shared by all documents of an ELTeC repo."""
+    return SimpleNamespace(
+        x1=mkuri(repo_id),
+        x1_eltec=mkuri("ELTeC"),
+        x8=mkuri("ELTeC Level 1 Schema"),
+        schema=mkuri(schema_level1),
+        e55_eltec_title=mkuri("ELTeC Title"),
+        e55_eltec_id=mkuri("ELTeC ID"),
+        e55_eltec_author_name=mkuri("ELTeC Author Name")
+    )
+
+
+class ELTeCCorpusGenerator(RDFGenerator):
+    """RDFGenerator for the entities shared by all documents of an ELTeC repo.
+
+    These triples are generated once per repo
+    and not repeated for every document by CLSCorGenerator.
+    """
+
+    def __init__(self, graph: Graph | None = None, **bindings) -> None:
+        """Initialize an ELTeCCorpusGenerator."""
+        super().__init__(model=CorpusBindingsModel, graph=graph, **bindings)
+
+    def generate_triples(self) -> Iterator[_Triple]:
+        """Generate triples for the corpus-level entities of an ELTeC repo."""
+        uris: SimpleNamespace = corpus_uris(self.bindings.repo_id)
+
+        x1_eltec_triples = ttl_triples(
+            uris.x1_eltec,
+            (RDF.type, crmcls.X1_Corpus),
+            (crmcls.Y4_has_subcorpus, uris.x1)
+        )
+
+        x1_triples = ttl_triples(
+            uris.x1,
+            (RDF.type, crmcls.X1_Corpus),
+            (crmcls.Y4i_is_subcorpus_of, uris.x1_eltec)
+        )
+
+        x8_triples = ttl_triples(
+            uris.x8,
+            (RDF.type, crmcls.X8_Schema),
+            (RDFS.label, Literal("ELTeC Level 1 RNG Schema")),
+            (crm.P1_is_identified_by, uris.schema)
+        )
+
+        eltec_schema_triples = ttl_triples(
+            uris.schema,
+            (RDF.type, crm.E42_Identifier),
+            (RDFS.label, Literal("Link to ELTeC Level 1 RNG Schema")),
+            (crm.P190_has_symbolic_content, Literal(schema_level1))
+        )
+
+        e55_eltec_title_triples = ttl_triples(
+            uris.e55_eltec_title,
+            (RDF.type, crm.E55_Type),
+            (RDFS.label, Literal("ELTeC Work Title"))
+        )
+
+        e55_eltec_id_triples = ttl_triples(
+            uris.e55_eltec_id,
+            (RDF.type, crm.E55_Type),
+            (RDFS.label, Literal("ELTeC Corpus Document ID"))
+        )
+
+        e55_eltec_author_name_triples = ttl_triples(
+            uris.e55_eltec_author_name,
+            (RDF.type, crm.E55_Type),
+            (RDFS.label, Literal("ELTeC Author Name"))
+        )
+
+        return itertools.chain(
+            x1_eltec_triples,
+            x1_triples,
+            x8_triples,
+            eltec_schema_triples,
+            e55_eltec_title_triples,
+            e55_eltec_id_triples,
+            e55_eltec_author_name_triples
+        )
+
+
+class ELTeCActorGenerator(RDFGenerator):
+    """RDFGenerator for an actor cluster of an EntityRegistry.
+
+    Actor, appellation and identifier triples are generated once
+    per cluster; CLSCorGenerator only links documents to the actor
+    if a registered actor_uri is given.
+    """
+
+    def __init__(self, graph: Graph | None = None, **bindings) -> None:
+        """Initialize an ELTeCActorGenerator."""
+        super().__init__(model=ActorBindingsModel, graph=graph, **bindings)
+
+    def generate_triples(self) -> Iterator[_Triple]:
+        """Generate triples for an actor cluster."""
+        actor_uri = URIRef(self.bindings.actor_uri)
+        # see corpus_uris
+        e55_eltec_author_name = mkuri("ELTeC Author Name")
+
+        e41_uris: dict[URIRef, str] = {
+            mkuri(f"{name} [E41]"): name
+            for name in self.bindings.names
+        }
+        e42_uris: dict[URIRef, IDMapping] = {
+            mkuri(f"{author_id.id_value} [E42]"): author_id
+            for author_id in self.bindings.ids
+        }
+
+        e39_triples = ttl_triples(
+            actor_uri,
+            (RDF.type, crm.E39_Actor),
+            (RDFS.label, Literal(f"{self.bindings.author_name} [Actor]")),
+            (crm.P1_is_identified_by, (*e41_uris, *e42_uris))
+        )
+
+        e39_same_as = (
+            (actor_uri, OWL.sameAs, same_as)
+            for same_as in (
+                *(mkuri(author_id.id_value) for author_id in self.bindings.ids),
+                *map(URIRef, self.bindings.aliases)
+            )
+        )
+
+        def e41_triples() -> Iterator[_Triple]:
+            for e41_uri, name in e41_uris.items():
+                yield from ttl_triples(
+                    e41_uri,
+                    (RDF.type, crm.E41_Appellation),
+                    (RDFS.label, Literal("ELTeC Author Name [Appellation]")),
+                    (
+                        crm.P190_has_symbolic_content,
+                        Literal(f"{name} [ELTeC Author Name]")
+                    ),
+                    (crm.P2_has_type, e55_eltec_author_name)
+                )
+                yield (e41_uri, crm.P1i_identifies, actor_uri)
+                yield (e55_eltec_author_name, crm.P2i_is_type_of, e41_uri)
+
+        def e42_triples() -> Iterator[_Triple]:
+            for e42_uri, author_id in e42_uris.items():
+                if (vocab_uri := vocab_lookup(author_id.id_type)) is not None:
+                    yield (e42_uri, crm.P2_has_type, vocab_uri)
+
+                yield from ttl_triples(
+                    e42_uri,
+                    (RDF.type, crm.E42_Identifier),
+                    (RDFS.label, Literal(f"{self.bindings.author_name} [ID]")),
+                    (crm.P190_has_symbolic_content, Literal(f"{author_id.id_value}"))
+                )
+
+        return itertools.chain(
+            e39_triples,
+            e39_same_as,
+            e41_triples(),
+            e42_triples()
+        )
 
 
 class CLSCorGenerator(RDFGenerator):
-    """Basic RDFGenerator for the CLSCor model."""
+    """Basic RDFGenerator for the CLSCor model.
+
+    Only document-specific triples are generated;
+    see ELTeCCorpusGenerator for the entities shared by all documents.
+    If bindings hold the actor_uri of a registered actor cluster,
+    actor triples are left to ELTeCActorGenerator.
+    """
 
     def generate_triples(self) -> Iterator[_Triple]:
         """Generate triples from an ELTeC resource."""
+        # seed for deterministic URIs of document-specific entities
+        seed: str = f"{self.bindings.repo_id}/{self.bindings.file_stem}"
+
         work_ids: dict[URIRef, SourceData] = {
-            mkuri(): ids
-            for ids in self.bindings.work_ids
+            mkuri(f"{seed}/work_id_e42/{i}"): ids
+            for i, ids in enumerate(self.bindings.work_ids)
         }
 
         f3_uris: list[URIRef] = [
-            mkuri()
-            for ids in self.bindings.work_ids
+            mkuri(f"{seed}/f3/{i}")
+            for i, _ in enumerate(self.bindings.work_ids)
         ]
 
         author_ids: dict[URIRef, dict] = {
@@ -43,26 +235,14 @@ class CLSCorGenerator(RDFGenerator):
             "e39", "e35",
             ("e39_e41", f"{self.bindings.author_name} [E41]"),
             "x2", "x2_e42",
-            ("x1_eltec", "ELTeC"),
             ("x11_eltec", "ELTeC [X11]"),
-            "f1", "f2", "f3", "f27", "f28"
-        )
-
-        # todo: singleton (type)
-        schema_level1: str = (
-            "https://raw.githubusercontent.com/COST-ELTeC/"
-            "Schemas/master/eltec-1.rng"
+            "f1", "f2", "f3", "f27", "f28",
+            seed=seed
         )
-        schema_uri: URIRef = mkuri(schema_level1)
 
-        e55_eltec_title_uri: URIRef = mkuri("ELTeC Title")
-        e55_eltec_id_uri: URIRef = mkuri("ELTeC ID")
-        e55_eltec_author_name_uri: URIRef = mkuri("ELTeC Author Name")
+        corpus: SimpleNamespace = corpus_uris(self.bindings.repo_id)
 
-        x1_uri: URIRef = mkuri(self.bindings.repo_id)
-        x8_uri: URIRef = mkuri("ELTeC Level 1 Schema")
-
-        f1_triples = plist(
+        f1_triples = ttl_triples(
             uris.f1,
             (RDF.type, lrm.F1_Work),
             (RDFS.label, Literal(f"{self.bindings.work_title} [Work]")),
@@ -71,7 +251,7 @@ class CLSCorGenerator(RDFGenerator):
             (lrm.R74i_has_expression_used_in, uris.f1)
         )
 
-        f2_triples = plist(
+        f2_triples = ttl_triples(
             uris.f2,
             (RDF.type, lrm.F2_Expression),
             (RDFS.label, Literal(f"{self.bindings.work_title} [Expression]")),
@@ -81,54 +261,49 @@ class CLSCorGenerator(RDFGenerator):
             (lrm.R4i_is_embodied_in, (uris.x2, *f3_uris))  # and f3s (todo)
         )
 
-        x1_triples = plist(
-            x1_uri,
-            (RDF.type, crmcls.X1_Corpus),
-            (lrm.R71_has_part, uris.x2),
-            (crmcls.Y4i_is_subcorpus_of, uris.x1_eltec)
+        x1_triples = ttl_triples(
+            corpus.x1,
+            (lrm.R71_has_part, uris.x2)
         )
 
-        x1_eltec_triples = plist(
-            uris.x1_eltec,
-            (RDF.type, crmcls.X1_Corpus),
-            (crmcls.Y4_has_subcorpus, x1_uri),
+        x1_eltec_triples = ttl_triples(
+            corpus.x1_eltec,
             # X1 -> P148 -> X2
             (crm.P148_has_component, uris.x2)
         )
 
-        x2_triples = plist(
+        x2_triples = ttl_triples(
             uris.x2,
             (RDF.type, crmcls.X2_Corpus_Document),
             (RDFS.label, Literal(f"{self.bindings.work_title} [TEI Document]")),
             (crm.P1_is_identified_by, uris.x2_e42),
             (lrm.R4_embodies, uris.f2),
-            (lrm.R71i_is_part_of, x1_uri),
+            (lrm.R71i_is_part_of, corpus.x1),
             (crmcls.Y2_has_format, vocab("TEI")),
-            (crmcls.Y3_adheres_to_schema, x8_uri),
+            (crmcls.Y3_adheres_to_schema, corpus.x8),
             # X2 -> P137 -> X11
             (crm.P137_exemplifies, uris.x11_eltec)
         )
 
-        x2_e42_triples = plist(
+        x2_e42_triples = ttl_triples(
             uris.x2_e42,
             (RDF.type, crm.E42_Identifier),
             (RDFS.label, Literal(f"{self.bindings.work_title} [ELTeC ID]")),
             (crm.P190_has_symbolic_content, Literal(f"{self.bindings.file_stem}")),
-            (crm.P2_has_type, e55_eltec_id_uri)
+            (crm.P2_has_type, corpus.e55_eltec_id)
         )
 
         def work_id_triples() -> Iterator[_Triple]:
             """Triple iterator for work ID E42 assertions."""
             for e42_uri, work_data in work_ids.items():
-                triples = plist(
+                triples = ttl_triples(
                     e42_uri,
                     (RDF.type, crm.E42_Identifier),
                     (RDFS.label, Literal(f"{self.bindings.work_title} [ID]")),
                     (crm.P190_has_symbolic_content, Literal(f"{work_data.id_value}"))
                 )
 
-                with suppress(VocabLookupException):
-                    vocab_uri = vocab(work_data.id_type)
+                if (vocab_uri := vocab_lookup(work_data.id_type)) is not None:
                     yield (
                         e42_uri,
                         crm.P2_has_type,
@@ -140,7 +315,7 @@ class CLSCorGenerator(RDFGenerator):
         def f3_triples() -> Iterator[_Triple]:
             """Triple iterator for F3 generation based on work_ids."""
             for f3_uri, (e42_uri, work_data) in zip(f3_uris, work_ids.items()):
-                f3_triples = plist(
+                f3_triples = ttl_triples(
                     f3_uri,
                     (RDF.type, lrm.F3_Manifestation),
                     (
@@ -151,11 +326,9 @@ class CLSCorGenerator(RDFGenerator):
                     (lrm.R4_embodies, uris.f2),
                 )
 
-                with suppress(VocabLookupException):
-                    source_type: str = resolve_source_type(
-                        work_data.source_type
-                    )
-                    vocab_uri = vocab(source_type)
+                source_type: str = resolve_source_type(work_data.source_type)
+
+                if (vocab_uri := vocab_lookup(source_type)) is not None:
                     yield (
                         f3_uri,
                         crm.P2_has_type,
@@ -164,38 +337,41 @@ class CLSCorGenerator(RDFGenerator):
 
                 yield from f3_triples
 
-        x8_triples = plist(
-            x8_uri,
-            (RDF.type, crmcls.X8_Schema),
-            (RDFS.label, Literal("ELTeC Level 1 RNG Schema")),
-            (crm.P1_is_identified_by, schema_uri),
+        x8_triples = ttl_triples(
+            corpus.x8,
             (crmcls.Y3i_is_schema_of, uris.x2)
         )
 
-        f27_triples = plist(
+        # actor cluster triples are generated by ELTeCActorGenerator
+        registered: bool = self.bindings.actor_uri is not None
+        actor: URIRef = (
+            URIRef(self.bindings.actor_uri) if registered else uris.e39
+        )
+
+        f27_triples = ttl_triples(
             uris.f27,
             (RDF.type, lrm.F27_Work_Creation),
             (RDFS.label, Literal(f"{self.bindings.work_title} [Work Creation]")),
-            (crm.P14_carried_out_by, uris.e39),
+            (crm.P14_carried_out_by, actor),
             (lrm.R16_created, uris.f1)
         )
 
-        f28_triples = plist(
+        f28_triples = ttl_triples(
             uris.f28,
             (RDF.type, lrm.F28_Expression_Creation),
             (
                 RDFS.label,
                 Literal(f"{self.bindings.work_title} [Expression Creation]")
             ),
-            (crm.P14_carried_out_by, uris.e39),
+            (crm.P14_carried_out_by, actor),
             (lrm.R17_created, uris.f2)
         )
 
-        e35_triples = plist(
+        e35_triples = ttl_triples(
             uris.e35,
             (RDF.type, crm.E35_Title),
             (crm.P102i_is_title_of, uris.f2),
-            (crm.P2_has_type, e55_eltec_title_uri),
+            (crm.P2_has_type, corpus.e55_eltec_title),
             (
                 RDFS.label,
                 Literal(f"{self.bindings.work_title} [Title of Expression]")
@@ -208,6 +384,13 @@ class CLSCorGenerator(RDFGenerator):
 
         def e39_triples() -> Iterator[_Triple]:
             """E39 triple generator."""
+            if registered:
+                yield from ttl_triples(
+                    actor,
+                    (crm.P14i_performed, (uris.f27, uris.f28))
+                )
+                return
+
             first_id, *rest_ids = (
                 mkuri(self.bindings.author_name),
                 *author_ids.keys()
@@ -218,10 +401,10 @@ class CLSCorGenerator(RDFGenerator):
                 for _, author_id in author_ids.items()
             )
 
-            e39_triples = plist(
+            e39_triples = ttl_triples(
                 first_id,
                 (RDF.type, crm.E39_Actor),
-                (RDFS.label, Literal(f"{self.bindings.author_name} [Actor]")),
+                (RDFS.label, literal(f"{self.bindings.author_name} [Actor]")),
                 (crm.P14i_performed, (uris.f27, uris.f28)),
                 # create e41s based on author ids(todo)
                 (crm.P1_is_identified_by, (uris.e39_e41, *e42_uris))
@@ -235,30 +418,32 @@ class CLSCorGenerator(RDFGenerator):
             yield from e39_triples
             yield from e39_same_as
 
-        e39_e41_triples = plist(
+        e39_e41_triples = () if registered else ttl_triples(
             uris.e39_e41,
             (RDF.type, crm.E41_Appellation),
-            (RDFS.label, Literal("ELTeC Author Name [Appellation]")),
+            (RDFS.label, literal("ELTeC Author Name [Appellation]")),
             (
                 crm.P190_has_symbolic_content,
-                Literal(f"{self.bindings.author_name} [ELTeC Author Name]")
+                literal(f"{self.bindings.author_name} [ELTeC Author Name]")
             ),
-            (crm.P2_has_type, e55_eltec_author_name_uri),
+            (crm.P2_has_type, corpus.e55_eltec_author_name),
             (crm.P1i_identifies, uris.e39)
         )
 
         def e39_e42_triples() -> Iterator[_Triple]:
+            if registered:
+                return
+
             for _, author_id in author_ids.items():
                 e42_uri = mkuri(f"{author_id.id_value} [E42]")
-                e42_triples = plist(
+                e42_triples = ttl_triples(
                     e42_uri,
                     (RDF.type, crm.E42_Identifier),
-                    (RDFS.label, Literal(f"{self.bindings.author_name} [ID]")),
-                    (crm.P190_has_symbolic_content, Literal(f"{author_id.id_value}"))
+                    (RDFS.label, literal(f"{self.bindings.author_name} [ID]")),
+                    (crm.P190_has_symbolic_content, literal(f"{author_id.id_value}"))
                 )
 
-                with suppress(VocabLookupException):
-                    vocab_uri = vocab(author_id.id_type)
+                if (vocab_uri := vocab_lookup(author_id.id_type)) is not None:
                     yield (
                         e42_uri,
                         crm.P2_has_type,
@@ -267,34 +452,18 @@ class CLSCorGenerator(RDFGenerator):
 
                 yield from e42_triples
 
-        # todo: singleton (type)
-        e55_eltec_title_triples = plist(
-            e55_eltec_title_uri,
-            (RDF.type, crm.E55_Type),
-            (RDFS.label, Literal("ELTeC Work Title")),
+        e55_eltec_title_triples = ttl_triples(
+            corpus.e55_eltec_title,
             (crm.P2i_is_type_of, uris.e35)
         )
 
-        # todo: singleton (type)
-        eltec_schema_triples = plist(
-            schema_uri,
-            (RDF.type, crm.E42_Identifier),
-            (RDFS.label, Literal("Link to ELTeC Level 1 RNG Schema")),
-            (crm.P190_has_symbolic_content, Literal(schema_level1))
-        )
-
-        # todo: singleton (type)
-        e55_eltec_id_triples = plist(
-            e55_eltec_id_uri,
-            (RDF.type, crm.E55_Type),
-            (RDFS.label, Literal("ELTeC Corpus Document ID")),
+        e55_eltec_id_triples = ttl_triples(
+            corpus.e55_eltec_id,
             (crm.P2i_is_type_of, uris.x2_e42)
         )
 
-        e55_eltec_author_name_triples = plist(
-            e55_eltec_author_name_uri,
-            (RDF.type, crm.E55_Type),
-            (RDFS.label, Literal("ELTeC Author Name")),
+        e55_eltec_author_name_triples = () if registered else ttl_triples(
+            corpus.e55_eltec_author_name,
             (crm.P2i_is_type_of, uris.e39_e41)
         )
 
@@ -316,7 +485,6 @@ class CLSCorGenerator(RDFGenerator):
             e55_eltec_title_triples,
             e55_eltec_id_triples,
             e55_eltec_author_name_triples,
-            eltec_schema_triples,
             work_id_triples()
         )
 
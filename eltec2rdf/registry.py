@@ -0,0 +1,452 @@
+"""SQLite-backed registry of actor entities shared across documents and repos."""
+
+import copy
+import json
+import re
+import sqlite3
+import threading
+import unicodedata
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rdflib import URIRef
+
+from eltec2rdf.utils.utils import mkuri
+
+
+def normalize_author_name(author_name: str) -> str:
+    """Normalize an author name for registry lookups."""
+    name = unicodedata.normalize("NFKC", author_name).casefold()
+    return re.sub(r"\s+", " ", name).strip()
+
+
+def normalize_author_id(id_value: str) -> list[str]:
+    """Normalize an author ID attribute value for registry lookups.
+
+    Attribute values may hold several whitespace-separated IDs,
+    e.g. "viaf:123 wikidata:Q456"; a normalized ID is returned for each.
+    """
+    return [
+        re.sub(r"^(https?://)?(www\.)?", "", token.casefold()).rstrip("/")
+        for token in id_value.split()
+    ]
+
+
+def actor_keys(author_name: str, author_ids: Iterable[Mapping]) -> list[str]:
+    """Get the registry keys for an author name and author IDs."""
+    keys = [f"name:{normalize_author_name(author_name)}"]
+
+    for author_id in author_ids:
+        if author_id.get("id_value"):
+            keys.extend(
+                f"id:{_id}" for _id in normalize_author_id(author_id["id_value"])
+            )
+
+    return list(dict.fromkeys(keys))
+
+
+@dataclass
+class ActorRecord:
+    """Registry entry for an actor cluster."""
+
+    actor_uri: str
+    author_name: str
+    names: list[str] = field(default_factory=list)
+    ids: list[dict[str, str | None]] = field(default_factory=list)
+    aliases: list[str] = field(default_factory=list)
+
+
+@dataclass
+class DocumentAuthor:
+    """Registry entry for the author of a document.
+
+    actor_uri is the actor URI the document was last resolved to;
+    it differs from the URI of the document's cluster
+    once that cluster has been merged or recomputed since.
+    """
+
+    repo: str | None
+    author_name: str
+    author_ids: list[dict[str, str | None]]
+    actor_uri: str
+
+
+class EntityRegistry:
+    """Registry of actor clusters keyed on author names and author IDs.
+
+    Documents whose author name or author IDs share a normalized key
+    resolve to the same canonical actor URI; the URI of the first
+    registered name is used (i.e. mkuri(author_name)).
+    If a document links previously separate clusters,
+    they are merged and the later actor URIs are kept as aliases.
+
+    Every document contributes its author name and IDs only:
+    if a document is resolved again with another author, or pruned,
+    its cluster is recomputed from the remaining documents
+    (keeping the cluster's URI for the first of them).
+
+    Lookups run against in-memory indexes, so resolving an author
+    does not block on I/O. Without a path, the registry lives for
+    a single run; with a path, it is loaded from and saved to
+    an SQLite database and later runs reuse its actor URIs.
+    The registry is safe to use from multiple threads;
+    for a deterministic result, concurrent runs take turns
+    resolving authors in a fixed order (see RegistryTurn).
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        """Initialize an EntityRegistry and load the database if given."""
+        self.path = None if path is None else Path(path)
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+        self._actors: dict[str, ActorRecord] = {}
+        self._keys: dict[str, str] = {}
+        self._documents: dict[str, DocumentAuthor] = {}
+
+        if self.path is not None:
+            self._load()
+
+    def __enter__(self) -> "EntityRegistry":
+        """Enter an EntityRegistry context."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Save the registry."""
+        self.save()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the database and create the tables if necessary."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(self.path, timeout=60)
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS actors (
+                actor_uri TEXT PRIMARY KEY,
+                author_name TEXT NOT NULL,
+                record TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS actor_keys (
+                key TEXT PRIMARY KEY,
+                actor_uri TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS document_actors (
+                resource_uri TEXT PRIMARY KEY,
+                actor_uri TEXT NOT NULL,
+                repo TEXT,
+                author_name TEXT NOT NULL,
+                author_ids TEXT NOT NULL
+            );
+            """
+        )
+        return connection
+
+    def _load(self) -> None:
+        """Load the registry from the database."""
+        connection = self._connect()
+
+        try:
+            for actor_uri, author_name, record in connection.execute(
+                    "SELECT * FROM actors ORDER BY rowid"
+            ):
+                self._actors[actor_uri] = ActorRecord(
+                    actor_uri, author_name, **json.loads(record)
+                )
+            self._keys.update(connection.execute("SELECT * FROM actor_keys"))
+
+            for resource_uri, actor_uri, repo, author_name, author_ids in (
+                    connection.execute(
+                        "SELECT * FROM document_actors ORDER BY rowid"
+                    )
+            ):
+                self._documents[resource_uri] = DocumentAuthor(
+                    repo, author_name, json.loads(author_ids), actor_uri
+                )
+        finally:
+            connection.close()
+
+    def save(self) -> None:
+        """Save the registry to the database, if a path is given.
+
+        The registry is copied under its lock and written without it,
+        so resolving does not wait for the database
+        (e.g. for a manifest transaction in the same database).
+        Concurrent saves are serialized, so the latest copy is written last.
+        """
+        if self.path is None:
+            return
+
+        with self._save_lock:
+            with self._lock:
+                actors = [
+                    (
+                        actor.actor_uri,
+                        actor.author_name,
+                        json.dumps({
+                            "names": actor.names,
+                            "ids": actor.ids,
+                            "aliases": actor.aliases
+                        })
+                    )
+                    for actor in self._actors.values()
+                ]
+                keys = list(self._keys.items())
+                documents = [
+                    (
+                        resource_uri,
+                        document.actor_uri,
+                        document.repo,
+                        document.author_name,
+                        json.dumps(document.author_ids)
+                    )
+                    for resource_uri, document in self._documents.items()
+                ]
+
+            connection = self._connect()
+
+            try:
+                with connection:
+                    for table in ("actors", "actor_keys", "document_actors"):
+                        connection.execute(f"DELETE FROM {table}")
+
+                    connection.executemany(
+                        "INSERT INTO actors VALUES (?, ?, ?)", actors
+                    )
+                    connection.executemany(
+                        "INSERT INTO actor_keys VALUES (?, ?)", keys
+                    )
+                    connection.executemany(
+                        "INSERT INTO document_actors VALUES (?, ?, ?, ?, ?)",
+                        documents
+                    )
+            finally:
+                connection.close()
+
+    def __contains__(self, resource_uri: str) -> bool:
+        """Check if the author of the document resource_uri is registered.
+
+        Documents whose cluster changed its URI since they were
+        resolved (e.g. by a merge) do not count as registered.
+        """
+        with self._lock:
+            document = self._documents.get(resource_uri)
+            return (
+                document is not None
+                and document.actor_uri == self._cluster(document)
+            )
+
+    def _cluster(self, document: DocumentAuthor) -> str:
+        """Get the actor URI of the cluster of a registered document."""
+        return self._keys[f"name:{normalize_author_name(document.author_name)}"]
+
+    def resolve(self,
+                resource_uri: str,
+                author_name: str,
+                author_ids: Iterable[Mapping] = (),
+                repo: str | None = None) -> URIRef:
+        """Register the author of a document and get the canonical actor URI.
+
+        If the document was registered with another author before,
+        that registration is replaced.
+        """
+        author_ids = [
+            {"id_value": author_id["id_value"], "id_type": author_id.get("id_type")}
+            for author_id in author_ids
+            if author_id.get("id_value")
+        ]
+
+        with self._lock:
+            actor_uri = self._resolve(resource_uri, author_name, author_ids, repo)
+
+        return URIRef(actor_uri)
+
+    def _resolve(self,
+                 resource_uri: str,
+                 author_name: str,
+                 author_ids: list[dict[str, str | None]],
+                 repo: str | None) -> str:
+        """Register the author of a document; see EntityRegistry.resolve."""
+        document = self._documents.get(resource_uri)
+
+        if document is not None:
+            if (document.author_name, document.author_ids) == (
+                    author_name, author_ids
+            ):
+                document.repo = repo
+                document.actor_uri = self._cluster(document)
+                return document.actor_uri
+            self._remove(resource_uri)
+
+        actor_uri = self._register(author_name, author_ids)
+        self._documents[resource_uri] = DocumentAuthor(
+            repo, author_name, author_ids, actor_uri
+        )
+        return actor_uri
+
+    def _register(self,
+                  author_name: str,
+                  author_ids: list[dict[str, str | None]],
+                  actor_uri: str | None = None) -> str:
+        """Add an author name and IDs to their (possibly new) cluster.
+
+        A new cluster gets actor_uri if given (and unused), else mkuri(author_name).
+        """
+        keys = actor_keys(author_name, author_ids)
+        candidates = {
+            self._keys[key]: None for key in keys if key in self._keys
+        }
+
+        if candidates:
+            if len(candidates) > 1:
+                # the earliest registered cluster is canonical
+                order = list(self._actors)
+                candidates = sorted(candidates, key=order.index)
+
+            actor_uri, *merged = candidates
+            for alias_uri in merged:
+                self._merge(alias_uri, actor_uri)
+        else:
+            if actor_uri is None or actor_uri in self._actors:
+                actor_uri = str(mkuri(author_name))
+            self._actors[actor_uri] = ActorRecord(actor_uri, author_name)
+
+        actor = self._actors[actor_uri]
+
+        for key in keys:
+            self._keys[key] = actor_uri
+        if author_name not in actor.names:
+            actor.names.append(author_name)
+
+        registered_ids = {_id["id_value"] for _id in actor.ids}
+        for author_id in author_ids:
+            if author_id["id_value"] not in registered_ids:
+                actor.ids.append(dict(author_id))
+                registered_ids.add(author_id["id_value"])
+
+        return actor_uri
+
+    def _merge(self, alias_uri: str, actor_uri: str) -> None:
+        """Merge the cluster of alias_uri into the cluster of actor_uri."""
+        alias = self._actors.pop(alias_uri)
+        actor = self._actors[actor_uri]
+
+        actor.names.extend(n for n in alias.names if n not in actor.names)
+        registered_ids = {_id["id_value"] for _id in actor.ids}
+        actor.ids.extend(
+            _id for _id in alias.ids if _id["id_value"] not in registered_ids
+        )
+        actor.aliases.extend([*alias.aliases, alias_uri])
+
+        for key, value in self._keys.items():
+            if value == alias_uri:
+                self._keys[key] = actor_uri
+
+    def _remove(self, resource_uri: str) -> None:
+        """Unregister a document and recompute its cluster without it.
+
+        The remaining documents of the cluster are registered again
+        in their order of registration; the first keeps the cluster's URI.
+        """
+        actor_uri = self._cluster(self._documents.pop(resource_uri))
+        members = [
+            document for document in self._documents.values()
+            if self._cluster(document) == actor_uri
+        ]
+
+        del self._actors[actor_uri]
+        self._keys = {
+            key: value for key, value in self._keys.items() if value != actor_uri
+        }
+
+        for document in members:
+            self._register(document.author_name, document.author_ids, actor_uri)
+
+    def prune(self, repo: str, keep: Iterable[str]) -> int:
+        """Unregister documents of repo whose resource_uri is not in keep.
+
+        Return the number of unregistered documents.
+        """
+        keep = set(keep)
+
+        with self._lock:
+            stale = [
+                resource_uri
+                for resource_uri, document in self._documents.items()
+                if document.repo == repo and resource_uri not in keep
+            ]
+            for resource_uri in stale:
+                self._remove(resource_uri)
+
+        return len(stale)
+
+    def clear(self) -> None:
+        """Unregister all documents and actors."""
+        with self._lock:
+            self._actors.clear()
+            self._keys.clear()
+            self._documents.clear()
+
+    def actors(self, resource_uris: Iterable[str]) -> list[ActorRecord]:
+        """Get the actor clusters of the documents resource_uris.
+
+        Actors are returned in the order of their registration.
+        """
+        with self._lock:
+            actor_uris = {
+                self._cluster(self._documents[resource_uri])
+                for resource_uri in resource_uris
+                if resource_uri in self._documents
+            }
+
+            return [
+                copy.deepcopy(actor)
+                for actor_uri, actor in self._actors.items()
+                if actor_uri in actor_uris
+            ]
+
+
+class RegistryTurn:
+    """Turn of a run to resolve authors in a registry shared with concurrent runs.
+
+    Turns are taken in a fixed order: a turn starts once all previous
+    turns ended, so actor URIs and clusters are the same as if the runs
+    resolved their authors one after another.
+    """
+
+    def __init__(self, previous: "RegistryTurn | None" = None) -> None:
+        """Initialize a RegistryTurn taken after previous."""
+        self.previous = previous
+        self._ended = threading.Event()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def chain(cls, keys: Iterable[str]) -> dict[str, "RegistryTurn"]:
+        """Get a turn for every key, taken in the order of keys."""
+        turns: dict[str, RegistryTurn] = {}
+        previous = None
+
+        for key in keys:
+            turns[key] = previous = cls(previous)
+
+        return turns
+
+    def wait(self) -> None:
+        """Wait until all previous turns ended."""
+        if self.previous is not None:
+            self.previous.wait()
+            self.previous._ended.wait()
+
+    def end(self, callback: Callable[[], object] | None = None) -> None:
+        """End the turn; callback is called first, unless the turn already ended."""
+        with self._lock:
+            if self._ended.is_set():
+                return
+
+            try:
+                if callback is not None:
+                    callback()
+            finally:
+                self._ended.set()
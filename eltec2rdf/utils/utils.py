@@ -2,21 +2,29 @@
 
 import contextlib
 import hashlib
+import os
 import re
 import functools
+import tempfile
 
-from collections.abc import Callable, Iterator, Sequence
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future
 from itertools import repeat
+from pathlib import Path
 from typing import TypeVar, Optional
 from types import SimpleNamespace
 from uuid import uuid4
 
-from rdflib import URIRef, Graph, BNode
+from rdflib import URIRef, Graph, BNode, Literal
+from rdflib.namespace import DefinedNamespace, Namespace
 from lodkit.utils import genhash
+from toolz import partition_all
 from lodkit.types import _Triple, _TripleObject
 
 
 T = TypeVar("T")
+R = TypeVar("R")
 TDefault = TypeVar("TDefault")
 
 
@@ -67,6 +75,66 @@ def _or(*operands: Callable[..., T],
     return None
 
 
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write data to path so that readers never see partial files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+    os.replace(temp_path, path)
+
+
+def ordered_map(function: Callable[[T], R],
+                iterable: Iterable[T],
+                executor: Executor,
+                window: int) -> Iterator[R]:
+    """Map function over iterable concurrently and yield results in order.
+
+    At most window calls are in flight at any time,
+    so iterable is consumed lazily and memory stays bounded.
+    """
+    pending: deque[Future] = deque()
+
+    for item in iterable:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(function, item))
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def add_triples(graph: Graph,
+                triples: Iterable[_Triple],
+                batch_size: int = 10_000) -> int:
+    """Add triples to graph in batches of batch_size using Graph.addN.
+
+    Return the number of triples added.
+    """
+    count = 0
+
+    for batch in partition_all(batch_size, triples):
+        graph.addN((s, p, o, graph) for s, p, o in batch)
+        count += len(batch)
+
+    return count
+
+
+# size of the memos for hashed URIs and shared Literals
+TERM_CACHE_SIZE: int = 2 ** 13
+
+
+@functools.lru_cache(maxsize=TERM_CACHE_SIZE)
+def _hashed_uri(hash_value: str,
+                length: int | None,
+                hash_function: Callable) -> URIRef:
+    """Create a CLSCor entity URI from a hash value (memoized)."""
+    _path = genhash(hash_value, length=length, hash_function=hash_function)
+    return URIRef(f"https://clscor.io/entity/{_path[:length]}")
+
+
 def mkuri(
         hash_value: str | None = None,
         length: int | None = 10,
@@ -76,18 +144,66 @@ def mkuri(
 
     If a hash value is give, the path is generated using
     a hash function, else the path is generated using a uuid4.
+    Hashed URIs are memoized, so repeated hash values
+    (e.g. for corpus-level entities) are hashed once
+    and share a single URIRef.
     """
-    _base_uri: str = "https://clscor.io/entity/"
-    _path: str = (
-        str(uuid4()) if hash_value is None
-        else genhash(
-                hash_value,
-                length=length,
-                hash_function=hash_function
-        )
-    )
+    if hash_value is None:
+        return URIRef(f"https://clscor.io/entity/{str(uuid4())[:length]}")
 
-    return URIRef(f"{_base_uri}{_path[:length]}")
+    return _hashed_uri(hash_value, length, hash_function)
+
+
+@functools.lru_cache(maxsize=TERM_CACHE_SIZE)
+def literal(value: str,
+            lang: str | None = None,
+            datatype: URIRef | None = None) -> Literal:
+    """Get a shared Literal from a bounded term table.
+
+    Meant for values that recur across documents (fixed labels,
+    author names); document-specific values should use Literal.
+    """
+    return Literal(value, lang=lang, datatype=datatype)
+
+
+class InternedNamespace:
+    """Namespace wrapper returning the same URIRef for repeated term lookups.
+
+    rdflib.Namespace creates a new URIRef on every attribute access;
+    here each term is created once and then cached as an attribute.
+    """
+
+    def __init__(self,
+                 namespace: Namespace | type[DefinedNamespace]) -> None:
+        """Initialize an InternedNamespace."""
+        self._namespace = namespace
+
+    def __getattr__(self, name: str) -> URIRef:
+        """Get and cache the term name of the wrapped namespace."""
+        term = getattr(self._namespace, name)
+        setattr(self, name, term)
+        return term
+
+
+def ttl_triples(uri: URIRef,
+                *predicate_object_pairs: tuple[URIRef, _TripleObject | list]
+                ) -> Iterator[_Triple]:
+    """Generate triples from a subject and ttl-like predicate-object pairs.
+
+    This is the triple-generating core of ttl;
+    no ttl or Graph instances are created.
+    """
+    for pred, obj in predicate_object_pairs:
+        match obj:
+            case list() | Iterator():
+                _b = BNode()
+                yield (uri, pred, _b)
+                yield from ttl_triples(_b, *obj)
+            case tuple():
+                _object_list = zip(repeat(pred), obj)
+                yield from ttl_triples(uri, *_object_list)
+            case _:
+                yield (uri, pred, obj)
 
 
 # this will be available in lodkit soon!
@@ -101,31 +217,34 @@ class ttl:
         """Initialize a plist object."""
         self.uri = uri
         self.predicate_object_pairs = predicate_object_pairs
-        self.graph = Graph() if graph is None else graph
-        self._iter = iter(self)
+        self._graph = graph
+        self._iter: Iterator[_Triple] | None = None
+
+    @property
+    def graph(self) -> Graph:
+        """Getter for the Graph component; the Graph is created on first access."""
+        if self._graph is None:
+            self._graph = Graph()
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: Graph) -> None:
+        """Setter for the Graph component."""
+        self._graph = graph
 
     def __iter__(self) -> Iterator[_Triple]:
         """Generate an iterator of tuple-based triple representations."""
-        for pred, obj in self.predicate_object_pairs:
-            match obj:
-                case list() | Iterator():
-                    _b = BNode()
-                    yield (self.uri, pred, _b)
-                    yield from ttl(_b, *obj)
-                case tuple():
-                    _object_list = zip(repeat(pred), obj)
-                    yield from ttl(self.uri, *_object_list)
-                case _:
-                    yield (self.uri, pred, obj)
+        return ttl_triples(self.uri, *self.predicate_object_pairs)
 
     def __next__(self) -> _Triple:
         """Return the next triple from the iterator."""
+        if self._iter is None:
+            self._iter = iter(self)
         return next(self._iter)
 
     def to_graph(self) -> Graph:
         """Generate a graph instance."""
-        for triple in self:
-            self.graph.add(triple)
+        add_triples(self.graph, self)
         return self.graph
 
 
@@ -138,13 +257,20 @@ class plist(ttl):
     """
 
 
-def uri_ns(*names: str | tuple[str, str]) -> SimpleNamespace:
-    """Generate a Namespace mapping for names and computed URIs."""
+def uri_ns(*names: str | tuple[str, str],
+           seed: str | None = None) -> SimpleNamespace:
+    """Generate a Namespace mapping for names and computed URIs.
+
+    For plain str names, URIs are hashed from seed and name if a seed
+    is given, so identical seeds always yield identical URIs;
+    without a seed, URIs are random (uuid4-based).
+    """
     def _uris():
         for name in names:
             match name:
                 case str():
-                    yield name, mkuri()
+                    hash_value = None if seed is None else f"{seed}/{name}"
+                    yield name, mkuri(hash_value)
                 case tuple():
                     yield name[0], mkuri(name[1])
                 case _:
@@ -1,14 +1,33 @@
-"""Functionality for vocab lookup."""
+"""Functionality for vocab lookup.
+
+Labels are looked up in a precompiled snapshot (vocabs.snapshot.json)
+of the .ttl files in this package, so no Turtle needs to be parsed
+for lookups. The snapshot records a sha256 hash per .ttl file and
+is regenerated if the .ttl files change. The vocab graph itself
+is only parsed on first access of vocab_graph.
+"""
 
 import abc
+import hashlib
+import json
 import typing
 
+from collections.abc import Iterable, Iterator, Mapping
+from functools import cache
 from importlib.resources import files
+from pathlib import Path
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
+
+from loguru import logger
 from rdflib import Graph, Literal, URIRef
 from rdflib.namespace import RDFS
 
+from eltec2rdf.utils.utils import atomic_write
+
 
 _vocabs_path = files("eltec2rdf.vocabs")
+_snapshot_name = "vocabs.snapshot.json"
 
 
 @typing.runtime_checkable
@@ -21,31 +40,210 @@ class SupportsIterdir(typing.Protocol):
         raise NotImplementedError
 
 
+def _ttl_files(_path: SupportsIterdir = _vocabs_path) -> list:
+    """Get the ttl files of a dir sorted by name."""
+    return sorted(
+        (f for f in _path.iterdir() if f.name.endswith(".ttl")),
+        key=lambda f: f.name
+    )
+
+
 def load_vocabs_graph(_path: SupportsIterdir = _vocabs_path) -> Graph:
     """Scan a dir for ttl files and load them in to a Graph."""
     _graph = Graph()
 
-    for f in _vocabs_path.iterdir():
-        if f.name.endswith(".ttl"):
-            _graph.parse(f)
+    for f in _ttl_files(_path):
+        _graph.parse(f)
 
     return _graph
 
 
-vocab_graph = load_vocabs_graph()
+def _plain_labels(graph: Graph) -> Iterator[tuple[str, URIRef]]:
+    """Get (label, subject) pairs for plain literal rdfs:labels in graph.
+
+    Labels with a language tag or datatype are skipped
+    to match the semantics of a lookup by Literal(term).
+    """
+    for subject, label in graph.subject_objects(RDFS.label):
+        if (
+                isinstance(label, Literal)
+                and label.language is None
+                and label.datatype is None
+        ):
+            yield str(label), subject
+
+
+def build_vocabs_snapshot(_path: SupportsIterdir = _vocabs_path) -> dict:
+    """Parse the ttl files of a dir into a snapshot.
+
+    The snapshot maps each file name to the sha256 hash
+    of the file and a label -> subject URI mapping.
+    """
+    snapshot = {}
+
+    for f in _ttl_files(_path):
+        data = f.read_bytes()
+        labels: dict[str, str] = {}
+
+        for label, subject in _plain_labels(Graph().parse(data=data, format="turtle")):
+            labels.setdefault(label, str(subject))
+
+        snapshot[f.name] = {
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "labels": labels
+        }
+
+    return snapshot
+
+
+def _is_current(snapshot: dict, _path: SupportsIterdir = _vocabs_path) -> bool:
+    """Check if a snapshot matches the ttl files of a dir."""
+    return {
+        f.name: hashlib.sha256(f.read_bytes()).hexdigest()
+        for f in _ttl_files(_path)
+    } == {name: entry["sha256"] for name, entry in snapshot.items()}
+
+
+@cache
+def load_vocabs_snapshot(_path: SupportsIterdir = _vocabs_path) -> dict:
+    """Load the vocabs snapshot of a dir.
+
+    If the snapshot is missing or outdated, it is rebuilt
+    and written back if the dir is writable.
+    """
+    try:
+        snapshot = json.loads((_path / _snapshot_name).read_text())
+    except (FileNotFoundError, ValueError):
+        snapshot = None
+
+    if snapshot is not None and _is_current(snapshot, _path):
+        return snapshot
+
+    logger.info("Rebuilding vocabs snapshot.")
+    snapshot = build_vocabs_snapshot(_path)
+
+    try:
+        atomic_write(
+            Path(str(_path / _snapshot_name)),
+            json.dumps(snapshot, indent=2, ensure_ascii=False).encode()
+        )
+    except OSError as e:
+        logger.warning(f"Unable to write vocabs snapshot: {e}")
+
+    return snapshot
+
+
+def vocab_labels(name: str, _path: SupportsIterdir = _vocabs_path) -> list[str]:
+    """Get the plain rdfs:labels of a ttl file in a dir, e.g. 'identifier.ttl'."""
+    return list(load_vocabs_snapshot(_path)[name]["labels"])
+
+
+@cache
+def get_vocab_graph() -> Graph:
+    """Get the vocab graph; the ttl files are parsed on first call."""
+    return load_vocabs_graph()
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Construct vocab_graph lazily."""
+    if name == "vocab_graph":
+        return get_vocab_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class VocabLookupException(Exception):
     """Exception for indicating a failed vocab term lookup."""
 
 
-def vocab(term: str, _graph: Graph = vocab_graph) -> URIRef:
-    """Lookup a term in a vocab graph and return the subject URI."""
-    _subjects = vocab_graph.subjects(RDFS.label, Literal(term))
+class VocabIndex(Mapping[str, URIRef]):
+    """Immutable label -> subject URI index over one or more vocab graphs.
+
+    The index is a snapshot of the rdfs:labels in the graphs
+    at construction time; lookups are O(1) dict lookups.
+    If a label occurs more than once, the first subject found wins.
+    """
+
+    def __init__(self, *graphs: Graph) -> None:
+        """Initialize a VocabIndex."""
+        self._index = self._build(
+            label_subject
+            for graph in graphs
+            for label_subject in _plain_labels(graph)
+        )
+
+    @staticmethod
+    def _build(
+            labels: Iterable[tuple[str, URIRef]]
+    ) -> MappingProxyType[str, URIRef]:
+        """Build an immutable index from (label, subject) pairs."""
+        index: dict[str, URIRef] = {}
+
+        for label, subject in labels:
+            index.setdefault(label, subject)
+
+        return MappingProxyType(index)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> "VocabIndex":
+        """Initialize a VocabIndex from a vocabs snapshot."""
+        vocab_index = cls()
+        vocab_index._index = cls._build(
+            (label, URIRef(uri))
+            for entry in snapshot.values()
+            for label, uri in entry["labels"].items()
+        )
+        return vocab_index
+
+    def __getitem__(self, term: str) -> URIRef:
+        """Get the subject URI for term."""
+        return self._index[term]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over indexed terms."""
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        """Get the number of indexed terms."""
+        return len(self._index)
+
+    def lookup(self, term: str | None) -> URIRef | None:
+        """Get the subject URI for term or None if term is not indexed."""
+        return self._index.get(term)
+
+
+_vocab_indexes: WeakKeyDictionary[Graph, VocabIndex] = WeakKeyDictionary()
+
+
+@cache
+def _snapshot_index() -> VocabIndex:
+    """Get the VocabIndex for the vocabs snapshot."""
+    return VocabIndex.from_snapshot(load_vocabs_snapshot())
+
+
+def vocab_index(_graph: Graph | None = None) -> VocabIndex:
+    """Get the VocabIndex for a vocab graph; indexes are built once per graph.
+
+    If no graph is given, the index is built from the vocabs snapshot.
+    """
+    if _graph is None:
+        return _snapshot_index()
 
     try:
-        vocab_uri = next(_subjects)
-    except StopIteration:
+        return _vocab_indexes[_graph]
+    except KeyError:
+        index = _vocab_indexes[_graph] = VocabIndex(_graph)
+        return index
+
+
+def vocab_lookup(term: str | None,
+                 _graph: Graph | None = None) -> URIRef | None:
+    """Lookup a term in a vocab graph and return the subject URI or None."""
+    return vocab_index(_graph).lookup(term)
+
+
+def vocab(term: str, _graph: Graph | None = None) -> URIRef:
+    """Lookup a term in a vocab graph and return the subject URI."""
+    if (vocab_uri := vocab_lookup(term, _graph)) is None:
         raise VocabLookupException(f"No subject URI for term '{term}'.")
 
     return vocab_uri
@@ -0,0 +1,271 @@
+"""Streaming serializers for writing triples without a repo-wide Graph."""
+
+import gzip
+import hashlib
+import json
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import IO, TextIO
+
+from clisn import CLSInfraNamespaceManager
+from lodkit.graph import Graph
+from lodkit.types import _Triple
+from rdflib import URIRef
+from rdflib.plugins.serializers.nquads import _nq_row
+from rdflib.plugins.serializers.nt import _nt_row
+
+from eltec2rdf.batches import TripleBatch
+from eltec2rdf.utils.utils import atomic_write
+
+
+OUTPUT_FORMATS: dict[str, str] = {
+    "turtle": "ttl",
+    "nt": "nt",
+    "nq": "nq"
+}
+
+SHARD_INDEX = "index.json"
+
+
+def open_output(path: Path | str,
+                compress: bool = False,
+                binary: bool = False) -> TextIO | IO[bytes]:
+    """Open an output file for writing, optionally gzip-compressed.
+
+    Files are opened for writing UTF-8 text unless binary is set.
+    """
+    if compress:
+        return (
+            gzip.open(path, "wb") if binary
+            else gzip.open(path, "wt", encoding="utf-8")
+        )
+    return open(path, "wb") if binary else open(path, "w", encoding="utf-8")
+
+
+class NTriplesWriter:
+    """Line-based writer for N-Triples and N-Quads output.
+
+    Triples are written as they are passed in,
+    so memory use is independent of the number of triples.
+    If a graph_name is given, N-Quads are written.
+    """
+
+    def __init__(self,
+                 path: Path | str,
+                 graph_name: URIRef | None = None,
+                 compress: bool = False) -> None:
+        """Initialize an NTriplesWriter."""
+        self.path = Path(path)
+        self.graph_name = graph_name
+        self.compress = compress
+
+        self.count: int = 0
+        self._file: TextIO | None = None
+
+    def __enter__(self) -> "NTriplesWriter":
+        """Open the output file."""
+        self._file = open_output(self.path, compress=self.compress)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the output file."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the output file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write(self, triples: Iterable[_Triple] | TripleBatch) -> int:
+        """Write triples and return the number of triples written.
+
+        TripleBatches are written without decoding their terms.
+        """
+        if self._file is None:
+            raise ValueError("NTriplesWriter is not open.")
+
+        if isinstance(triples, TripleBatch):
+            self._file.write(triples.to_ntriples(self.graph_name))
+            self.count += len(triples)
+            return len(triples)
+
+        rows = (
+            map(_nt_row, triples) if self.graph_name is None
+            else (_nq_row(triple, self.graph_name) for triple in triples)
+        )
+
+        count = 0
+        for row in rows:
+            self._file.write(row)
+            count += 1
+
+        self.count += count
+        return count
+
+
+class ShardedWriter:
+    """Writer for sharded output: one file per document or per N documents.
+
+    Shards are written to directory and keyed by the ELTeCPath stem
+    of their first document. An index (index.json) lists the documents,
+    triple count, byte size and sha256 hash of every shard,
+    so loaders can fetch and verify shards in parallel.
+
+    Shard file names carry a prefix of their hash
+    (e.g. deu001.3f2a9c1b0d4e.nt), so new shards never overwrite
+    the files of the current index: the index is replaced atomically
+    once all shards were written, and only then are files no longer
+    in the index deleted. If writing fails, the previous index and
+    its shards stay intact. Shards whose content did not change
+    are not rewritten. Gzip-compressed shards are written
+    without a timestamp, so their hashes only depend on their content.
+    """
+
+    def __init__(self,
+                 directory: Path | str,
+                 output_format: str = "nt",
+                 graph_name: URIRef | None = None,
+                 compress: bool = False,
+                 shard_size: int = 1) -> None:
+        """Initialize a ShardedWriter."""
+        self.directory = Path(directory)
+        self.output_format = output_format
+        self.graph_name = graph_name
+        self.compress = compress
+        self.shard_size = shard_size
+
+        self.count: int = 0
+        self.unchanged: int = 0
+        self.shards: list[dict] = []
+
+        self._previous: dict[str, dict] = {}
+        self._pending: list[tuple[str, list[_Triple] | TripleBatch]] = []
+
+    @property
+    def index_path(self) -> Path:
+        """Get the path of the shard index."""
+        return self.directory / SHARD_INDEX
+
+    def __enter__(self) -> "ShardedWriter":
+        """Create the directory and load the index of the last run."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        if self.index_path.exists():
+            index = json.loads(self.index_path.read_text())
+            self._previous = {shard["key"]: shard for shard in index["shards"]}
+
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        """Write pending documents and the index, unless an error occurred."""
+        if exc_type is None:
+            self.close()
+
+    def write(self, key: str, triples: Iterable[_Triple] | TripleBatch) -> int:
+        """Add the triples of the document key to the current shard.
+
+        Return the number of triples added.
+        """
+        if not isinstance(triples, TripleBatch):
+            triples = list(triples)
+
+        self._pending.append((key, triples))
+        if len(self._pending) >= self.shard_size:
+            self.flush()
+
+        self.count += len(triples)
+        return len(triples)
+
+    def write_shard(self,
+                    key: str,
+                    triples: Iterable[_Triple] | TripleBatch) -> int:
+        """Write triples to a shard of their own, e.g. for repo-level entities.
+
+        Return the number of triples written.
+        """
+        self.flush()
+        count = self.write(key, triples)
+        self.flush()
+        return count
+
+    def _serialize(self) -> tuple[bytes, int]:
+        """Serialize the pending documents and count the shard's triples."""
+        if self.output_format == "turtle":
+            g = Graph()
+            CLSInfraNamespaceManager(g)
+            g.addN(
+                (s, p, o, g)
+                for _, triples in self._pending
+                for s, p, o in triples
+            )
+            return g.serialize(format="turtle", encoding="utf-8"), len(g)
+
+        parts = []
+        for _, triples in self._pending:
+            if not isinstance(triples, TripleBatch):
+                triples = TripleBatch.from_triples(triples)
+            parts.append(triples.to_ntriples(self.graph_name))
+
+        return "".join(parts).encode("utf-8"), sum(
+            len(triples) for _, triples in self._pending
+        )
+
+    def flush(self) -> None:
+        """Write the pending documents as a shard."""
+        if not self._pending:
+            return
+
+        data, count = self._serialize()
+        if self.compress:
+            data = gzip.compress(data, mtime=0)
+
+        key = self._pending[0][0]
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.directory / (
+            f"{key}.{digest[:12]}.{OUTPUT_FORMATS[self.output_format]}"
+            f'{".gz" if self.compress else ""}'
+        )
+        shard = {
+            "key": key,
+            "path": path.name,
+            "documents": [_key for _key, _ in self._pending],
+            "triples": count,
+            "bytes": len(data),
+            "sha256": digest
+        }
+
+        if self._previous.get(key) == shard and path.exists():
+            self.unchanged += 1
+        elif not path.exists():
+            atomic_write(path, data)
+
+        self.shards.append(shard)
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Write pending documents and the index; delete stale files.
+
+        Stale files are all files in directory that are not in the index,
+        e.g. shards of removed documents or of a failed run.
+        """
+        self.flush()
+
+        index = {
+            "format": self.output_format,
+            "compress": self.compress,
+            "shard_size": self.shard_size,
+            "triples": sum(shard["triples"] for shard in self.shards),
+            "bytes": sum(shard["bytes"] for shard in self.shards),
+            "shards": self.shards
+        }
+        atomic_write(
+            self.index_path, json.dumps(index, indent=2).encode("utf-8")
+        )
+        self._previous = {shard["key"]: shard for shard in self.shards}
+
+        paths = {SHARD_INDEX, *(shard["path"] for shard in self.shards)}
+        for path in self.directory.iterdir():
+            if path.is_file() and path.name not in paths:
+                path.unlink()
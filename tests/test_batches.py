@@ -0,0 +1,152 @@
+"""Round-trip tests for dictionary-encoded triple batches."""
+
+import pickle
+import types
+
+import pytest
+
+from rdflib import BNode, Literal, URIRef, namespace
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser
+from rdflib.plugins.serializers.nquads import _nq_row
+from rdflib.plugins.serializers.nt import _nt_row
+
+from eltec2rdf.batches import TripleBatch
+
+
+subject = URIRef("https://example.org/s")
+predicate = URIRef("https://example.org/p")
+
+LITERALS = [
+    Literal("Effi Briest"),
+    Literal(""),
+    Literal("a", lang="en"),
+    Literal("a", lang="EN"),
+    Literal("Effi Briest", lang="de-AT"),
+    Literal("Effi Briest", datatype=namespace.XSD.string),
+    Literal("1895", datatype=namespace.XSD.gYear),
+    Literal("01", datatype=namespace.XSD.integer, normalize=False),
+    Literal("1", datatype=namespace.XSD.integer),
+    Literal("1.50", datatype=namespace.XSD.decimal, normalize=False),
+    Literal(True),
+    Literal('"quoted" \\ backslash'),
+    Literal("multi\nline\r\ntext\ttab"),
+    Literal("next\x85line"),
+    Literal("line\u2028separator"),
+    Literal("paragraph\u2029separator"),
+    Literal("vertical\x0btab\x0cform feed\x1cfile\x1dgroup\x1erecord"),
+    Literal("ünïcödé ✓ 😀", lang="fr"),
+]
+
+TRIPLES = [(subject, predicate, literal) for literal in LITERALS] + [
+    (BNode("b0"), predicate, subject),
+    (subject, predicate, BNode("b0")),
+    (subject, predicate, URIRef("https://example.org/o?q=1#f")),
+]
+
+
+def exact(term) -> tuple:
+    """Get a key for term that distinguishes all of its components.
+
+    rdflib's Literal equality ignores the case of language tags.
+    """
+    return (
+        type(term),
+        str(term),
+        getattr(term, "language", None),
+        getattr(term, "datatype", None)
+    )
+
+
+def assert_exact(triples, expected) -> None:
+    """Assert that triples equal expected term by term."""
+    assert [tuple(map(exact, t)) for t in triples] == [
+        tuple(map(exact, t)) for t in expected
+    ]
+
+
+@pytest.mark.parametrize("triple", TRIPLES, ids=repr)
+def test_single_triple_round_trip(triple):
+    """Every kind of term survives encoding and decoding on its own."""
+    assert_exact(TripleBatch.from_triples([triple]), [triple])
+
+
+def test_round_trip():
+    """Decoded triples equal the encoded triples, in order."""
+    batch = TripleBatch.from_triples(TRIPLES)
+
+    assert len(batch) == len(TRIPLES)
+    assert_exact(batch, TRIPLES)
+
+
+def test_language_tag_case_is_kept():
+    """Literals differing only in language tag case are distinct terms."""
+    batch = TripleBatch.from_triples(
+        [(subject, predicate, Literal("a", lang=lang)) for lang in ("en", "EN")]
+    )
+
+    assert [o.language for _, _, o in batch] == ["en", "EN"]
+    assert batch.to_ntriples().splitlines()[1].endswith('"a"@EN .')
+
+
+def test_pickle():
+    """Pickled batches decode to the encoded triples."""
+    batch = TripleBatch.from_triples(TRIPLES)
+
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        unpickled = pickle.loads(pickle.dumps(batch, protocol))
+        assert unpickled == batch
+        assert_exact(unpickled, TRIPLES)
+
+
+def test_to_ntriples():
+    """Batches write the same N-Triples and N-Quads as rdflib."""
+    batch = TripleBatch.from_triples(TRIPLES)
+    graph_name = URIRef("https://example.org/graph")
+
+    assert batch.to_ntriples() == "".join(map(_nt_row, TRIPLES))
+    assert batch.to_ntriples(graph_name) == "".join(
+        _nq_row(triple, graph_name) for triple in TRIPLES
+    )
+
+
+def test_from_ntriples():
+    """N-Triples written by rdflib are read back without changes."""
+    ntriples = "".join(map(_nt_row, TRIPLES))
+    batch = TripleBatch.from_ntriples(ntriples)
+
+    assert batch == TripleBatch.from_triples(TRIPLES)
+    assert batch.to_ntriples() == ntriples
+    assert_exact(batch, TRIPLES)
+
+
+def test_from_ntriples_line_separators():
+    """Line separators other than newline do not split stored triples.
+
+    The W3C N-Triples parser, previously used for stored triples,
+    reads the same data.
+    """
+    triples = [
+        (subject, predicate, Literal(f"a{separator}b"))
+        for separator in "\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+    ]
+    ntriples = "".join(map(_nt_row, triples))
+    batch = TripleBatch.from_ntriples(ntriples)
+
+    assert len(batch) == len(triples)
+    assert_exact(batch, triples)
+
+    parsed = []
+    sink = types.SimpleNamespace(triple=lambda *triple: parsed.append(triple))
+    W3CNTriplesParser(sink).parsestring(ntriples)
+    assert_exact(parsed, triples)
+
+
+def test_empty_batch():
+    """Empty batches round-trip as well."""
+    batch = TripleBatch.from_triples([])
+
+    assert len(batch) == 0
+    assert list(batch) == []
+    assert batch.to_ntriples() == ""
+    assert TripleBatch.from_ntriples("") == batch
+    assert pickle.loads(pickle.dumps(batch)) == batch
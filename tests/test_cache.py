@@ -0,0 +1,95 @@
+"""Tests for the on-disk XML cache."""
+
+import itertools
+import json
+import types
+
+from eltec2rdf.extractors import cache as cache_module
+from eltec2rdf.extractors.cache import XMLCache
+
+
+def test_read_does_not_save_index(tmp_path):
+    """Cache hits update access times in memory only, until close."""
+    with XMLCache(tmp_path) as cache:
+        cache.put("https://example.org/a.xml", b"<a/>")
+        cache.flush()
+        saved = (tmp_path / "index.json").stat().st_mtime_ns
+
+        for _ in range(10):
+            assert cache.read("https://example.org/a.xml") == b"<a/>"
+        assert (tmp_path / "index.json").stat().st_mtime_ns == saved
+
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert index["https://example.org/a.xml"]["accessed"] == (
+        cache.get("https://example.org/a.xml").accessed
+    )
+
+
+def test_index_persists(tmp_path):
+    """Entries stored before close are found by a new cache."""
+    with XMLCache(tmp_path) as cache:
+        cache.put("https://example.org/a.xml", b"<a/>", etag='"1"')
+
+    cache = XMLCache(tmp_path)
+    assert cache.get("https://example.org/a.xml").etag == '"1"'
+    assert cache.read("https://example.org/a.xml") == b"<a/>"
+    assert cache.size() == 4
+
+
+def test_checkpoint(tmp_path):
+    """The index is saved every checkpoint_every stored entries."""
+    cache = XMLCache(tmp_path, checkpoint_every=3)
+
+    for i in range(3):
+        cache.put(f"https://example.org/{i}.xml", f"<a n='{i}'/>".encode())
+
+    assert len(json.loads((tmp_path / "index.json").read_text())) == 3
+
+
+def test_size_counts_shared_blobs_once(tmp_path):
+    """URLs with the same body share a blob, which is counted once."""
+    cache = XMLCache(tmp_path)
+    cache.put("https://example.org/a.xml", b"<a/>")
+    cache.put("https://example.org/b.xml", b"<a/>")
+
+    assert cache.size() == 4
+    assert len([p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]) == 1
+
+    cache.put("https://example.org/a.xml", b"<b/>")
+    cache.put("https://example.org/b.xml", b"<b/>")
+
+    assert cache.size() == 4
+    assert len([p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]) == 1
+
+
+def test_evict_least_recently_used(tmp_path, monkeypatch):
+    """Least recently used entries are evicted once max_bytes is exceeded."""
+    clock = types.SimpleNamespace(time=itertools.count().__next__)
+    monkeypatch.setattr(cache_module, "time", clock)
+    cache = XMLCache(tmp_path, max_bytes=100)
+
+    for i in range(3):
+        cache.put(f"https://example.org/{i}.xml", bytes([i]) * 30)
+    cache.read("https://example.org/0.xml")
+    cache.put("https://example.org/3.xml", bytes([3]) * 30)
+
+    assert cache.size() == 90
+    assert [
+        f"https://example.org/{i}.xml" in cache for i in range(4)
+    ] == [True, False, True, True]
+    assert len([p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]) == 3
+
+
+def test_read_missing_entry(tmp_path):
+    """Entries that are not cached, or whose blob vanished, read as None."""
+    cache = XMLCache(tmp_path)
+    cache.put("https://example.org/a.xml", b"<a/>")
+
+    assert cache.read("https://example.org/b.xml") is None
+
+    for path in (tmp_path / "blobs").rglob("*"):
+        if path.is_file():
+            path.unlink()
+
+    assert cache.read("https://example.org/a.xml") is None
+    assert cache.size() == 0
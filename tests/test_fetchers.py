@@ -0,0 +1,235 @@
+"""Tests for HTTP fetching against a local server serving the fixtures."""
+
+import http.server
+import threading
+import time
+
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from eltec2rdf.extractors.bindings_extractor import extract_bindings
+from eltec2rdf.extractors.cache import CachingFetcher, XMLCache
+from eltec2rdf.extractors.fetchers import FetchError, HTTPFetcher
+from eltec2rdf.instrumentation import InstrumentedFetcher, Metrics
+
+
+fixtures_path = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+FIXTURES = sorted(p.name for p in fixtures_path.glob("*.xml"))
+
+
+class FixtureHandler(http.server.BaseHTTPRequestHandler):
+    """Serve fixtures by file name, with failures, delays and padding.
+
+    The behavior is configured on the server (see fixture_server):
+    failures maps file names to statuses sent before the fixture,
+    delays maps file names to response delays in seconds and
+    padding is the size of an XML comment inserted before </TEI>.
+    Fixtures are sent with their name as ETag.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        """Serve a fixture."""
+        server = self.server
+        name = self.path.rsplit("/", 1)[-1]
+
+        with server.lock:
+            server.requests[name] += 1
+            failures = server.failures.get(name, [])
+            status = failures.pop(0) if failures else None
+
+        time.sleep(server.delays.get(name, 0))
+
+        if status is None and name not in FIXTURES:
+            status = 404
+        if status is not None:
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = f'"{name}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        body = (fixtures_path / name).read_bytes()
+        if server.padding:
+            padding = b"<!--" + b" " * server.padding + b"-->"
+            body = body.replace(b"</TEI>", padding + b"</TEI>")
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        try:
+            for i in range(0, len(body), 64 * 1024):
+                self.wfile.write(body[i:i + 64 * 1024])
+                server.sent[name] = i + 64 * 1024
+        except OSError:
+            self.close_connection = True
+        finally:
+            server.done.set()
+
+    def log_message(self, *args) -> None:
+        """Do not log requests."""
+
+
+@pytest.fixture
+def fixture_server():
+    """Run a FixtureHandler server in a background thread."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = Counter()
+    server.failures = {}
+    server.delays = {}
+    server.padding = 0
+    server.sent = {}
+    server.done = threading.Event()
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def fixture_url(server, name: str) -> str:
+    """Get an ELTeC-style raw URL for a fixture on server."""
+    language = name[:3].lower()
+    return (
+        f"http://127.0.0.1:{server.server_port}"
+        f"/COST-ELTeC/ELTeC-{language}/master/level1/{name}"
+    )
+
+
+def test_extract_bindings_keeps_order(fixture_server):
+    """Bindings are yielded in input order, whatever order fetches finish in."""
+    names = FIXTURES * 2
+    fixture_server.delays = {
+        name: 0.2 * (len(FIXTURES) - i) for i, name in enumerate(FIXTURES)
+    }
+    urls = [fixture_url(fixture_server, name) for name in names]
+
+    bindings = list(extract_bindings(urls, workers=4, fetcher=HTTPFetcher()))
+
+    assert [b["resource_uri"] for b in bindings] == urls
+    assert [b["file_stem"] for b in bindings] == [
+        Path(name).stem.lower() for name in names
+    ]
+
+
+def test_retries_server_errors(fixture_server):
+    """5xx responses are retried until a fetch succeeds or retries run out."""
+    fetcher = HTTPFetcher(retries=3, backoff=0)
+    name = FIXTURES[0]
+    url = fixture_url(fixture_server, name)
+
+    fixture_server.failures[name] = [503, 502, 500]
+    assert fetcher.fetch(url) == (fixtures_path / name).read_bytes()
+    assert fixture_server.requests[name] == 4
+
+    fixture_server.requests.clear()
+    fixture_server.failures[name] = [503] * 4
+    with pytest.raises(FetchError) as error:
+        fetcher.fetch(url)
+    assert error.value.status == 503
+    assert fixture_server.requests[name] == 4
+
+
+def test_does_not_retry_client_errors(fixture_server):
+    """Statuses other than retry_statuses fail at once."""
+    fetcher = HTTPFetcher(retries=3, backoff=0)
+
+    with pytest.raises(FetchError) as error:
+        fetcher.fetch(fixture_url(fixture_server, "missing.xml"))
+
+    assert error.value.status == 404
+    assert fixture_server.requests["missing.xml"] == 1
+
+
+def test_header_only_cuts_off_download(fixture_server):
+    """Header-only extraction stops reading after tei:teiHeader."""
+    padding = 64 * 1024 * 1024
+    fixture_server.padding = padding
+    name = FIXTURES[0]
+
+    [bindings] = extract_bindings(
+        [fixture_url(fixture_server, name)], workers=1, fetcher=HTTPFetcher()
+    )
+
+    assert bindings["file_stem"] == Path(name).stem.lower()
+    assert fixture_server.done.wait(10)
+    assert fixture_server.sent[name] < padding / 4
+
+
+def test_instrumented_fetcher_counts_network_bytes(fixture_server, tmp_path):
+    """Only bytes read from the network count as fetched; cache hits apart."""
+    name = FIXTURES[0]
+    url = fixture_url(fixture_server, name)
+    size = len((fixtures_path / name).read_bytes())
+    metrics = Metrics()
+
+    with XMLCache(tmp_path) as cache:
+        fetcher = InstrumentedFetcher(CachingFetcher(cache), metrics)
+        fetcher.fetch(url)
+        assert metrics.counters == {"bytes_fetched": size}
+
+        with fetcher.stream(url) as f:
+            assert len(f.read()) == size
+        assert metrics.counters == {"bytes_fetched": size, "cache_hits": 1}
+
+        offline = InstrumentedFetcher(CachingFetcher(cache, offline=True), metrics)
+        offline.fetch(url)
+        assert metrics.counters == {"bytes_fetched": size, "cache_hits": 2}
+
+    assert fixture_server.requests[name] == 2
+
+
+def test_instrumented_fetcher_counts_streamed_bytes(fixture_server):
+    """Streamed bodies count the bytes read before the download is cut off."""
+    padding = 64 * 1024 * 1024
+    fixture_server.padding = padding
+    metrics = Metrics()
+
+    list(extract_bindings(
+        [fixture_url(fixture_server, FIXTURES[0])],
+        workers=1,
+        fetcher=InstrumentedFetcher(HTTPFetcher(), metrics)
+    ))
+
+    assert 0 < metrics.counters["bytes_fetched"] < padding / 4
+    assert "cache_hits" not in metrics.counters
+
+
+def test_refetch_evicted_entry(fixture_server, tmp_path, monkeypatch):
+    """A body evicted while revalidating it is fetched again."""
+    name = FIXTURES[0]
+    url = fixture_url(fixture_server, name)
+    metrics = Metrics()
+
+    with XMLCache(tmp_path) as cache:
+        fetcher = InstrumentedFetcher(CachingFetcher(cache), metrics)
+        body = fetcher.fetch(url)
+        get = cache.get
+
+        def get_and_evict(_url: str):
+            """Get the entry for _url, then delete its blob."""
+            entry = get(_url)
+            for path in (tmp_path / "blobs").rglob("*"):
+                if path.is_file():
+                    path.unlink()
+            return entry
+
+        monkeypatch.setattr(cache, "get", get_and_evict)
+        assert fetcher.fetch(url) == body
+
+    assert fixture_server.requests[name] == 3
+    assert "cache_hits" not in metrics.counters
@@ -0,0 +1,176 @@
+"""Tests for cached, rate-limit aware GitHub listings."""
+
+import json
+
+import pytest
+
+from eltec2rdf.extractors import listings as listings_module
+from eltec2rdf.extractors.fetchers import FetchError, Response
+from eltec2rdf.extractors.listings import CachedListings, GitHubBackend, Listing
+
+
+class FakeClock:
+    """Stand-in for the time module; sleeping advances the clock."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        """Initialize a FakeClock."""
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        """Get the current time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Advance the clock by seconds."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    """Patch the time module used by listings with a FakeClock."""
+    clock = FakeClock()
+    monkeypatch.setattr(listings_module, "time", clock)
+    return clock
+
+
+class FakeBackend:
+    """ListingBackend serving listings with versioned ETags."""
+
+    def __init__(self) -> None:
+        """Initialize a FakeBackend."""
+        self.data: dict[str, list] = {}
+        self.calls: list[tuple[str, str | None]] = []
+
+    def get(self, path: str, etag: str | None = None) -> Listing:
+        """Get the listing for path."""
+        self.calls.append((path, etag))
+        current = f'"{len(self.data[path])}"'
+
+        if etag == current:
+            return Listing(None, etag)
+        return Listing(list(self.data[path]), current)
+
+
+def test_ttl(clock):
+    """Listings are served from the cache until ttl has passed."""
+    backend = FakeBackend()
+    backend.data["/a"] = ["x.xml"]
+    listings = CachedListings(backend, ttl=60)
+
+    assert listings.get("/a") == ["x.xml"]
+    clock.now += 59
+    assert listings.get("/a") == ["x.xml"]
+    assert backend.calls == [("/a", None)]
+
+    clock.now += 1
+    backend.data["/a"].append("y.xml")
+    assert listings.get("/a") == ["x.xml", "y.xml"]
+    assert backend.calls == [("/a", None), ("/a", '"1"')]
+
+
+def test_not_modified_refreshes_entry(clock, tmp_path):
+    """304 responses keep the cached data and restart the ttl."""
+    backend = FakeBackend()
+    backend.data["/a"] = ["x.xml"]
+    cache_path = tmp_path / "listings.json"
+    listings = CachedListings(backend, cache_path, ttl=60)
+
+    listings.get("/a")
+    clock.now += 100
+    assert listings.get("/a") == ["x.xml"]
+    assert backend.calls == [("/a", None), ("/a", '"1"')]
+
+    clock.now += 30
+    listings.get("/a")
+    assert len(backend.calls) == 2
+    assert json.loads(cache_path.read_text())["/a"] == {
+        "data": ["x.xml"], "etag": '"1"', "fetched": 1100.0
+    }
+
+
+def test_offline(clock, tmp_path):
+    """Offline, cached listings are served whatever their age."""
+    backend = FakeBackend()
+    backend.data["/a"] = ["x.xml"]
+    cache_path = tmp_path / "listings.json"
+    CachedListings(backend, cache_path, ttl=60).get("/a")
+    backend.calls.clear()
+
+    clock.now += 10 ** 6
+    listings = CachedListings(backend, cache_path, ttl=60, offline=True)
+
+    assert listings.get("/a") == ["x.xml"]
+    with pytest.raises(FetchError):
+        listings.get("/b")
+    assert backend.calls == []
+
+
+class FakeFetcher:
+    """Fetcher replaying a sequence of responses and errors."""
+
+    def __init__(self, responses: list) -> None:
+        """Initialize a FakeFetcher."""
+        self.responses = responses
+        self.requests: list[tuple[str, dict]] = []
+
+    def request(self, url: str, headers: dict) -> Response:
+        """Replay the next response."""
+        self.requests.append((url, headers))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def rate_limited(reset: float) -> FetchError:
+    """Construct the error for a request with an exhausted rate limit."""
+    return FetchError(
+        "HTTP 403",
+        status=403,
+        headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(reset)}
+    )
+
+
+def test_rate_limit_wait(clock):
+    """Rate-limited requests wait for the reset and are sent again."""
+    fetcher = FakeFetcher([
+        rate_limited(clock.now + 30),
+        Response(200, {"ETag": '"1"'}, b'["x.xml"]'),
+        Response(304, {}, b""),
+    ])
+    backend = GitHubBackend(base_url="https://api.test", fetcher=fetcher)
+
+    assert backend.get("/a") == Listing(["x.xml"], '"1"')
+    assert clock.sleeps == [31.0]
+    assert backend.get("/a", etag='"1"') == Listing(None, '"1"')
+    assert fetcher.requests[-1][1]["If-None-Match"] == '"1"'
+
+
+def test_rate_limit_reset_from_successful_response(clock):
+    """Once a response exhausts the rate limit, the next request waits."""
+    fetcher = FakeFetcher([
+        Response(
+            200,
+            {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(clock.now + 10)},
+            b"[]"
+        ),
+        Response(200, {}, b"[]"),
+    ])
+    backend = GitHubBackend(fetcher=fetcher)
+
+    backend.get("/a")
+    assert clock.sleeps == []
+    backend.get("/b")
+    assert clock.sleeps == [10.0]
+
+
+def test_rate_limit_max_wait(clock):
+    """Waits longer than max_wait fail instead of sleeping."""
+    fetcher = FakeFetcher([rate_limited(clock.now + 7200)])
+    backend = GitHubBackend(fetcher=fetcher, max_wait=3600)
+
+    with pytest.raises(FetchError):
+        backend.get("/a")
+    assert clock.sleeps == []
@@ -0,0 +1,166 @@
+"""Tests for conversion runs via the command line interface."""
+
+import contextlib
+import json
+import os
+import signal
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from eltec2rdf import main
+from eltec2rdf.manifest import Manifest
+
+
+fixtures_path = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+FONTANE = '<author ref="gnd:118534262">Fontane, Theodor (1819-1898)</author>'
+
+# runs the CLI and kills the process once ENG003 is converted
+KILLED_RUN = """
+import os, sys
+from eltec2rdf import main
+from eltec2rdf.manifest import Manifest
+
+put = Manifest.put
+
+def put_or_kill(self, record, *args, **kwargs):
+    if record.resource_uri.endswith("ENG003.xml"):
+        os._exit(1)
+    put(self, record, *args, **kwargs)
+
+Manifest.put = put_or_kill
+sys.argv = ["eltec2rdf", *sys.argv[1:]]
+main.main()
+"""
+
+
+def checkouts(directory: Path) -> Path:
+    """Create local checkouts sharing an author across repos.
+
+    The author has a GND ID in ELTeC-eng only.
+    """
+    fontane = (fixtures_path / "DEU001.xml").read_text()
+    files = {
+        "ELTeC-eng/level1/ENG001.xml": (fixtures_path / "ENG001.xml").read_text(),
+        "ELTeC-eng/level1/ENG002.xml": fontane,
+        "ELTeC-deu/level1/DEU001.xml": fontane.replace(
+            FONTANE, "<author>Fontane, Theodor (1819-1898)</author>"
+        ),
+        "ELTeC-fra/level1/FRA001.xml": (fixtures_path / "FRA001.xml").read_text(),
+    }
+
+    for name, text in files.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+    return directory
+
+
+def cli_args(directory: Path, *args: str) -> list[str]:
+    """Get CLI arguments for a run in directory without the XML cache."""
+    return ["--no-cache", "--cache-dir", str(directory / "cache"), *args]
+
+
+def run_main(monkeypatch, directory: Path, *args: str) -> dict[str, bytes]:
+    """Run the CLI in directory and get the contents of the output files."""
+    (directory / "output").mkdir(parents=True, exist_ok=True)
+    monkeypatch.chdir(directory)
+    monkeypatch.setattr(sys, "argv", ["eltec2rdf", *cli_args(directory, *args)])
+    main.main()
+
+    return {
+        path.name: path.read_bytes()
+        for path in sorted((directory / "output").glob("*.nt"))
+    }
+
+
+def test_jobs_output_equals_serial_output(tmp_path, monkeypatch):
+    """Concurrent repos resolve shared authors as a serial run does."""
+    local = checkouts(tmp_path / "local")
+    outputs = [
+        run_main(
+            monkeypatch, tmp_path / f"jobs{jobs}",
+            "--local", str(local), "--format", "nt", "--jobs", str(jobs),
+            "--manifest", "output/manifest.db"
+        )
+        for jobs in (1, 3)
+    ]
+
+    assert outputs[0] == outputs[1]
+    # the actor of ELTeC-deu has the GND ID registered by ELTeC-eng
+    assert b"118534262" in outputs[1]["eltec_deu.nt"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_resume_after_kill(tmp_path, monkeypatch, jobs):
+    """Documents checkpointed before a run is killed are reused on resume."""
+    local = checkouts(tmp_path / "local")
+    (local / "ELTeC-eng/level1/ENG003.xml").write_bytes(
+        (fixtures_path / "FRA001.xml").read_bytes()
+    )
+    expected = run_main(
+        monkeypatch, tmp_path / "fresh", "--local", str(local), "--format", "nt"
+    )
+
+    directory = tmp_path / "killed"
+    (directory / "output").mkdir(parents=True)
+    args = [
+        "--local", str(local), "--format", "nt", "--jobs", str(jobs),
+        "--manifest", "output/manifest.db", "--checkpoint-every", "1"
+    ]
+    killed = subprocess.Popen(
+        [sys.executable, "-c", KILLED_RUN, *cli_args(directory, *args)],
+        cwd=directory,
+        env={"PYTHONPATH": str(Path(__file__).parent.parent)},
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    try:
+        assert killed.wait(timeout=60) == 1
+    finally:
+        # worker processes of the killed run are left behind
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(killed.pid, signal.SIGKILL)
+
+    assert run_main(monkeypatch, directory, *args, "--resume") == expected
+    counters = json.loads(
+        (directory / "output/eltec_eng.metrics.json").read_text()
+    )["counters"]
+    assert (counters["documents_reused"], counters["documents"]) == (2, 1)
+
+
+def test_profile_keeps_the_journal(tmp_path, monkeypatch):
+    """Profiling a document does not reset the journal of an interrupted run."""
+    local = checkouts(tmp_path / "local")
+    directory = tmp_path / "run"
+    args = ["--local", str(local), "--manifest", "output/manifest.db"]
+    run_main(monkeypatch, directory, *args, "--format", "nt")
+
+    url = (
+        "https://raw.githubusercontent.com/COST-ELTeC/ELTeC-deu/master/"
+        "level1/DEU001.xml"
+    )
+    run_main(monkeypatch, directory, *args, "--profile", url)
+
+    with Manifest(directory / "output/manifest.db") as manifest:
+        assert set(manifest.finished_repos()) == set(main.REPOS)
+
+
+def test_store_path_requires_a_persistent_store(tmp_path, monkeypatch, capsys):
+    """--store-path is rejected for in-memory stores."""
+    for store in ("default", "Memory"):
+        with pytest.raises(SystemExit):
+            run_main(
+                monkeypatch, tmp_path,
+                "--store", store, "--store-path", str(tmp_path / "store")
+            )
+        assert "--store-path requires a persistent --store" in (
+            capsys.readouterr().err
+        )
+
+    with pytest.raises(ValueError):
+        main.generate_graph("ELTeC-deu", store_path=tmp_path / "store")
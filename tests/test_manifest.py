@@ -0,0 +1,155 @@
+"""Tests for the incremental conversion manifest."""
+
+import shutil
+import threading
+
+from pathlib import Path
+
+from eltec2rdf.extractors.sources import CheckoutSource
+from eltec2rdf.instrumentation import Metrics
+from eltec2rdf.main import _generate_batches, _incremental_batches, _registered
+from eltec2rdf.manifest import Manifest, ManifestRecord
+from eltec2rdf.registry import EntityRegistry
+
+
+fixtures_path = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+
+def record(resource_uri: str, repo: str = "ELTeC-deu") -> ManifestRecord:
+    """Construct a ManifestRecord for resource_uri."""
+    return ManifestRecord(
+        resource_uri=resource_uri,
+        repo=repo,
+        source_sha="sha",
+        bindings_hash="hash",
+        triples="<https://example.org/s> <https://example.org/p> \"o\" .\n"
+    )
+
+
+def test_pending_records(tmp_path):
+    """Uncommitted records are readable, but only persisted on commit."""
+    path = tmp_path / "manifest.db"
+
+    with Manifest(path) as manifest:
+        manifest.put(record("doc:1"), commit=False)
+
+        assert manifest.get("doc:1") == record("doc:1")
+        assert Manifest(path).get("doc:1") is None
+
+        manifest.commit()
+        assert Manifest(path).get("doc:1") == record("doc:1")
+
+        manifest.put(record("doc:2"), commit=False)
+
+    assert Manifest(path).get("doc:2") == record("doc:2")
+
+
+def test_pending_records_do_not_lock_the_database(tmp_path):
+    """Other manifests and the registry write while records are pending."""
+    path = tmp_path / "manifest.db"
+    deu = Manifest(path)
+    registry = EntityRegistry(path)
+    registry.resolve("doc:1", "Fontane, Theodor")
+
+    deu.put(record("deu:1"), commit=False)
+
+    def _write() -> None:
+        with Manifest(path) as eng:
+            eng.put(record("eng:1", "ELTeC-eng"))
+            eng.finish_repo("ELTeC-eng", "output/eltec_eng.nt", 1)
+        registry.save()
+
+    writing = threading.Thread(target=_write)
+    writing.start()
+    writing.join(timeout=5)
+    assert not writing.is_alive()
+
+    deu.close()
+
+    with Manifest(path) as manifest:
+        assert manifest.get("deu:1") is not None
+        assert manifest.get("eng:1") is not None
+        assert "ELTeC-eng" in manifest.finished_repos()
+
+
+def checkout(directory: Path) -> CheckoutSource:
+    """Create a checkout of ELTeC-deu with two documents."""
+    (directory / "level1").mkdir(parents=True)
+    shutil.copy(fixtures_path / "DEU001.xml", directory / "level1/DEU001.xml")
+    shutil.copy(fixtures_path / "ENG001.xml", directory / "level1/DEU002.xml")
+
+    return CheckoutSource(directory, repo="ELTeC-deu")
+
+
+def convert(source: CheckoutSource,
+            path: Path) -> tuple[dict[str, set], Metrics]:
+    """Convert source incrementally with the manifest and registry at path.
+
+    Return the triples per document and the metrics of the run.
+    """
+    metrics = Metrics()
+    registry = EntityRegistry(path)
+
+    def generate(bindings):
+        return _generate_batches(
+            _registered(bindings, registry, source.repo), None, 1,
+            metrics=metrics
+        )
+
+    with Manifest(path) as manifest, registry:
+        batches = _incremental_batches(
+            source.files(), source.repo, manifest, source.extract, generate,
+            metrics=metrics,
+            registry=registry
+        )
+        triples = {url: set(_triples) for url, _triples in batches}
+
+    return triples, metrics
+
+
+def test_unchanged_documents_are_reused(tmp_path):
+    """A second run reuses all documents and yields the same triples."""
+    source = checkout(tmp_path / "ELTeC-deu")
+    path = tmp_path / "manifest.db"
+
+    first, metrics = convert(source, path)
+    assert metrics.counters["documents"] == 2
+
+    second, metrics = convert(source, path)
+    assert second == first
+    assert metrics.counters["documents_reused"] == 2
+    assert metrics.counters["documents"] == 0
+
+
+def test_changed_document_is_converted(tmp_path):
+    """Only a modified file is converted again, as a fresh run would."""
+    source = checkout(tmp_path / "ELTeC-deu")
+    path = tmp_path / "manifest.db"
+    convert(source, path)
+
+    deu001 = tmp_path / "ELTeC-deu/level1/DEU001.xml"
+    deu001.write_text(
+        deu001.read_text().replace("Effi Briest : ELTeC-Ausgabe", "Effi Briest")
+    )
+    triples, metrics = convert(source, path)
+    fresh, _ = convert(source, tmp_path / "fresh.db")
+
+    assert metrics.counters["documents"] == 1
+    assert metrics.counters["documents_reused"] == 1
+    assert triples == fresh
+
+
+def test_vanished_documents_are_pruned(tmp_path):
+    """Records of files removed from the checkout are pruned."""
+    source = checkout(tmp_path / "ELTeC-deu")
+    path = tmp_path / "manifest.db"
+    first, _ = convert(source, path)
+
+    (tmp_path / "ELTeC-deu/level1/DEU002.xml").unlink()
+    triples, _ = convert(source, path)
+    [deu001, deu002] = first
+
+    assert triples == {deu001: first[deu001]}
+    with Manifest(path) as manifest:
+        assert manifest.get(deu001) is not None
+        assert manifest.get(deu002) is None
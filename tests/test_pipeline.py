@@ -0,0 +1,114 @@
+"""Tests for the threaded pipeline."""
+
+import random
+import threading
+import time
+
+import pytest
+
+from eltec2rdf.pipeline import Stage, pipeline
+
+
+def sleepy(function):
+    """Wrap function so that it sleeps for a random time first."""
+    def _sleepy(item):
+        time.sleep(random.uniform(0, 0.005))
+        return function(item)
+    return _sleepy
+
+
+def test_results_in_input_order():
+    """Results are yielded in input order, whatever order workers finish in."""
+    results = pipeline(
+        range(200),
+        Stage(sleepy(lambda x: x * 2), workers=4),
+        Stage(sleepy(lambda x: x + 1), workers=3),
+        max_in_flight=8
+    )
+
+    assert list(results) == [x * 2 + 1 for x in range(200)]
+
+
+def test_in_flight_bound():
+    """At most max_in_flight items (plus one being admitted) are in flight."""
+    max_in_flight = 4
+    lock = threading.Lock()
+    pulled = 0
+
+    def items():
+        nonlocal pulled
+        for i in range(50):
+            with lock:
+                pulled += 1
+            yield i
+
+    in_flight = []
+    for consumed, _ in enumerate(
+            pipeline(
+                items(),
+                Stage(lambda x: x, workers=4),
+                max_in_flight=max_in_flight
+            ),
+            start=1
+    ):
+        # let the feeder and workers run ahead as far as they can
+        time.sleep(0.005)
+        with lock:
+            in_flight.append(pulled - consumed)
+
+    assert max(in_flight) <= max_in_flight + 1
+    assert max(in_flight) >= max_in_flight - 1
+
+
+def test_stage_exception():
+    """A stage exception is raised once its position is reached."""
+    def fail_on_5(x):
+        if x == 5:
+            raise ValueError(x)
+        return x
+
+    results = []
+    with pytest.raises(ValueError):
+        for result in pipeline(
+                range(20), Stage(sleepy(fail_on_5), workers=4), max_in_flight=4
+        ):
+            results.append(result)
+
+    assert results == [0, 1, 2, 3, 4]
+
+
+def test_source_exception():
+    """An exception raised by the items iterable is raised after its items."""
+    def items():
+        yield from range(3)
+        raise ValueError
+
+    results = []
+    with pytest.raises(ValueError):
+        for result in pipeline(items(), Stage(lambda x: x, workers=2)):
+            results.append(result)
+
+    assert results == [0, 1, 2]
+
+
+def test_early_close_stops_threads():
+    """Closing the results early stops all threads without running stages."""
+    calls = []
+    threads = threading.active_count()
+
+    def record(x):
+        calls.append(x)
+        return x
+
+    results = pipeline(
+        iter(range(1000)), Stage(record, workers=4), max_in_flight=4
+    )
+    assert [next(results), next(results)] == [0, 1]
+
+    closer = threading.Thread(target=results.close)
+    closer.start()
+    closer.join(timeout=5)
+
+    assert not closer.is_alive()
+    assert threading.active_count() == threads
+    assert len(calls) <= 2 + 4 + 4
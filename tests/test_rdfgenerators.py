@@ -0,0 +1,81 @@
+"""Tests for RDF generation with registered actors."""
+
+from dataclasses import asdict
+from pathlib import Path
+
+import clisn
+
+from rdflib import RDF, Graph, URIRef
+
+from eltec2rdf.extractors.bindings_extractor import ELTeCBindingsExtractor
+from eltec2rdf.rdfgenerators import CLSCorGenerator, ELTeCActorGenerator
+from eltec2rdf.registry import EntityRegistry
+
+
+fixtures_path = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+crm = clisn.crm
+
+
+def registered_graph(names: list[str]) -> tuple[Graph, URIRef]:
+    """Generate the graph for fixtures resolved against one registry.
+
+    Fixtures are converted as documents DEU001, DEU002, ... of ELTeC-deu.
+    Return the graph and the actor URI of the first document.
+    """
+    registry = EntityRegistry()
+    graph = Graph()
+    urls, actor_uris = [], []
+
+    for i, name in enumerate(names, start=1):
+        url = (
+            "https://raw.githubusercontent.com/COST-ELTeC/ELTeC-deu/master/"
+            f"level1/DEU{i:03}.xml"
+        )
+        urls.append(url)
+        bindings = dict(
+            ELTeCBindingsExtractor(url, source=(fixtures_path / name).read_bytes())
+        )
+        actor_uri = registry.resolve(
+            url, bindings["author_name"], bindings["author_ids"] or ()
+        )
+        actor_uris.append(actor_uri)
+
+        for triple in CLSCorGenerator(**bindings, actor_uri=str(actor_uri)):
+            graph.add(triple)
+
+    for actor in registry.actors(urls):
+        for triple in ELTeCActorGenerator(**asdict(actor)):
+            graph.add(triple)
+
+    return graph, actor_uris[0]
+
+
+def test_documents_link_the_registered_actor():
+    """With a registry, no E39 other than the registered actor appears."""
+    graph, actor_uri = registered_graph(["DEU001.xml"])
+
+    actors = {
+        *graph.subjects(RDF.type, crm.E39_Actor),
+        *graph.objects(None, crm.P14_carried_out_by),
+        *graph.subjects(crm.P14i_performed, None),
+        *graph.objects(None, crm.P1i_identifies),
+    }
+
+    assert actors == {actor_uri}
+    assert len(set(graph.objects(None, crm.P14_carried_out_by))) == 1
+    assert set(graph.subject_objects(crm.P1i_identifies)) == {
+        (e41, actor_uri) for e41 in graph.objects(actor_uri, crm.P1_is_identified_by)
+        if (e41, RDF.type, crm.E41_Appellation) in graph
+    }
+
+
+def test_documents_of_an_author_share_one_actor():
+    """Documents by the same author add no actors of their own."""
+    one, actor_uri = registered_graph(["DEU001.xml"])
+    graph, _ = registered_graph(["DEU001.xml", "DEU001.xml"])
+
+    assert set(graph.subjects(RDF.type, crm.E39_Actor)) == {actor_uri}
+    assert set(graph.objects(None, crm.P1i_identifies)) == {actor_uri}
+    # only the document-specific triples are added
+    assert len(set(graph.objects(None, crm.P14_carried_out_by))) == 1
+    assert len(graph) < 2 * len(one)
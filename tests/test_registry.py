@@ -0,0 +1,195 @@
+"""Tests for the actor registry."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from eltec2rdf.registry import EntityRegistry, RegistryTurn
+from eltec2rdf.utils.utils import mkuri
+
+
+GND = [{"id_value": "gnd:118534262", "id_type": "gnd"}]
+
+
+def uri(author_name: str) -> str:
+    """Get the actor URI minted for author_name."""
+    return str(mkuri(author_name))
+
+
+def test_clusters():
+    """Normalized names and shared IDs resolve to the first actor URI."""
+    registry = EntityRegistry()
+
+    a = registry.resolve("doc:1", "Fontane, Theodor")
+    b = registry.resolve("doc:2", "fontane,  theodor")
+    c = registry.resolve("doc:3", "Fontane, T.", GND)
+    d = registry.resolve("doc:4", "Fontane, Th.", GND)
+
+    assert str(a) == str(b) == uri("Fontane, Theodor")
+    assert str(c) == str(d) == uri("Fontane, T.")
+
+    e = registry.resolve("doc:5", "Fontane, Theodor", GND)
+    [actor] = registry.actors(["doc:1", "doc:3"])
+
+    assert str(e) == str(a)
+    assert actor.aliases == [uri("Fontane, T.")]
+    assert actor.names == [
+        "Fontane, Theodor", "fontane,  theodor", "Fontane, T.", "Fontane, Th."
+    ]
+    # resolved before the merge, to the alias
+    assert "doc:1" in registry and "doc:3" not in registry
+
+
+def test_resolve_replaces_previous_author():
+    """A document resolved with another author leaves its former cluster."""
+    registry = EntityRegistry()
+    registry.resolve("doc:1", "Fontane, Theodor")
+    registry.resolve("doc:2", "Fontane, T.", GND)
+    registry.resolve("doc:3", "Fontane, Theodor", GND)
+
+    storm = registry.resolve("doc:3", "Storm, Theodor")
+    assert str(storm) == uri("Storm, Theodor")
+
+    assert [
+        (actor.actor_uri, actor.names, actor.aliases)
+        for actor in registry.actors(["doc:1", "doc:2", "doc:3"])
+    ] == [
+        (uri("Fontane, Theodor"), ["Fontane, Theodor"], []),
+        (uri("Fontane, T."), ["Fontane, T."], []),
+        (uri("Storm, Theodor"), ["Storm, Theodor"], []),
+    ]
+    assert str(registry.resolve("doc:2", "Fontane, T.", GND)) == uri("Fontane, T.")
+
+
+def test_prune(tmp_path):
+    """Pruned documents are dropped from the registry and the database."""
+    path = tmp_path / "registry.db"
+
+    with EntityRegistry(path) as registry:
+        registry.resolve("deu:1", "Fontane, Theodor", repo="ELTeC-deu")
+        registry.resolve("deu:2", "Fontane, T.", GND, repo="ELTeC-deu")
+        registry.resolve("eng:1", "Fontane, Theodor", GND, repo="ELTeC-eng")
+
+        assert registry.prune("ELTeC-deu", keep=["deu:2"]) == 1
+        assert registry.prune("ELTeC-eng", keep=[]) == 1
+
+    registry = EntityRegistry(path)
+    [actor] = registry.actors(["deu:1", "deu:2", "eng:1"])
+
+    # the cluster keeps its URI, but deu:2 was resolved before the merge
+    assert (actor.actor_uri, actor.names, actor.aliases) == (
+        uri("Fontane, Theodor"), ["Fontane, T."], []
+    )
+    assert "deu:2" not in registry
+
+    connection = sqlite3.connect(path)
+    assert connection.execute(
+        "SELECT resource_uri FROM document_actors"
+    ).fetchall() == [("deu:2",)]
+    assert connection.execute(
+        "SELECT key FROM actor_keys ORDER BY key"
+    ).fetchall() == [("id:gnd:118534262",), ("name:fontane, t.",)]
+
+
+def test_cluster_keeps_uri_if_documents_remain():
+    """A recomputed cluster keeps its URI for its first remaining document."""
+    registry = EntityRegistry()
+    registry.resolve("doc:1", "Fontane, Theodor", GND)
+    registry.resolve("doc:2", "Fontane, T.", GND)
+
+    assert registry.prune(None, keep=["doc:2"]) == 1
+    assert str(registry.resolve("doc:2", "Fontane, T.", GND)) == uri(
+        "Fontane, Theodor"
+    )
+    assert "doc:2" in registry
+
+
+def test_clear(tmp_path):
+    """Cleared registries are saved empty."""
+    path = tmp_path / "registry.db"
+
+    with EntityRegistry(path) as registry:
+        registry.resolve("doc:1", "Fontane, Theodor")
+
+    with EntityRegistry(path) as registry:
+        registry.clear()
+
+    assert registry.actors(["doc:1"]) == []
+    assert "doc:1" not in EntityRegistry(path)
+
+
+def test_turns_resolve_in_a_fixed_order():
+    """Turns resolve authors in their order, whatever order they start in."""
+    registry = EntityRegistry()
+    turns = RegistryTurn.chain(["ELTeC-eng", "ELTeC-deu", "ELTeC-fra"])
+    documents = {
+        "ELTeC-eng": [("eng:1", "Fontane, T.", GND)],
+        "ELTeC-deu": [("deu:1", "Fontane, Theodor", GND)],
+        "ELTeC-fra": [("fra:1", "Fontane, Theodor", [])],
+    }
+    actor_uris = {}
+
+    def run(repo: str) -> None:
+        turn = turns[repo]
+        turn.wait()
+        for resource_uri, author_name, author_ids in documents[repo]:
+            actor_uris[resource_uri] = str(
+                registry.resolve(resource_uri, author_name, author_ids, repo)
+            )
+        turn.end()
+
+    threads = [
+        threading.Thread(target=run, args=(repo,)) for repo in reversed(turns)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert list(actor_uris) == ["eng:1", "deu:1", "fra:1"]
+    assert set(actor_uris.values()) == {uri("Fontane, T.")}
+
+
+def test_failed_turn_ends():
+    """Turns end once, even if their callback fails."""
+    [first, second] = RegistryTurn.chain(["a", "b"]).values()
+    calls = []
+
+    def fail() -> None:
+        calls.append("fail")
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        first.end(fail)
+    first.end(lambda: calls.append("again"))
+
+    second.wait()
+    assert calls == ["fail"]
+
+
+def test_save_does_not_block_resolving(tmp_path):
+    """While save waits for the database, authors can still be resolved."""
+    path = tmp_path / "registry.db"
+    registry = EntityRegistry(path)
+    registry.resolve("doc:1", "Fontane, Theodor")
+
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    saving = threading.Thread(target=registry.save)
+    saving.start()
+
+    try:
+        resolving = threading.Thread(
+            target=registry.resolve, args=("doc:2", "Storm, Theodor")
+        )
+        resolving.start()
+        resolving.join(timeout=5)
+        assert not resolving.is_alive()
+    finally:
+        writer.execute("COMMIT")
+        saving.join()
+
+    assert "doc:2" not in EntityRegistry(path)
+    registry.save()
+    assert "doc:2" in EntityRegistry(path)
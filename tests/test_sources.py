@@ -0,0 +1,136 @@
+"""Tests for archive and checkout sources of ELTeC XML resources."""
+
+import io
+import shutil
+import subprocess
+import tarfile
+import zipfile
+
+from pathlib import Path
+
+import pytest
+
+from eltec2rdf.extractors.sources import (
+    ArchiveSource,
+    CheckoutSource,
+    _is_level1_xml,
+    git_blob_sha
+)
+
+
+fixtures_path = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+LEVEL1 = {
+    "DEU001.xml": "DEU001.xml",
+    "DEU002.xml": "ENG001.xml",
+    "DEU003.xml": "FRA001.xml",
+}
+
+
+@pytest.fixture
+def checkout(tmp_path) -> Path:
+    """Create a checkout of ELTeC-deu with level1 and other files."""
+    directory = tmp_path / "ELTeC-deu"
+    (directory / "level1").mkdir(parents=True)
+    (directory / "level0").mkdir()
+
+    for name, fixture in LEVEL1.items():
+        shutil.copy(fixtures_path / fixture, directory / "level1" / name)
+    shutil.copy(fixtures_path / "DEU001.xml", directory / "level0/DEU001.xml")
+    (directory / "README.md").write_text("ELTeC-deu")
+
+    return directory
+
+
+def archive(checkout: Path, path: Path) -> Path:
+    """Pack checkout as GitHub does, below a top-level directory.
+
+    Tarballs and zipballs are told apart by the suffix of path.
+    """
+    top = f"{checkout.name}-master"
+    files = sorted(p for p in checkout.rglob("*") if p.is_file())
+
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path, "w") as f:
+            for p in files:
+                f.write(p, f"{top}/{p.relative_to(checkout).as_posix()}")
+    else:
+        with tarfile.open(path, "w:gz") as f:
+            f.add(checkout, arcname=top)
+
+    return path
+
+
+@pytest.fixture(params=["tar", "zip", "checkout"])
+def source(request, checkout, tmp_path):
+    """Get a source of the checkout, as a tarball, zipball or directory."""
+    if request.param == "checkout":
+        return CheckoutSource(checkout)
+
+    suffix = ".tar.gz" if request.param == "tar" else ".zip"
+    return ArchiveSource(
+        archive(checkout, tmp_path / f"ELTeC-deu{suffix}"), repo="ELTeC-deu"
+    )
+
+
+def test_files(source, checkout):
+    """Sources list level1 files only, with raw URLs and Git blob SHAs."""
+    files = list(source.files())
+
+    assert [f.url for f in files] == [
+        "https://raw.githubusercontent.com/COST-ELTeC/ELTeC-deu/master/"
+        f"level1/{name}"
+        for name in LEVEL1
+    ]
+    assert [f.sha for f in files] == [
+        subprocess.run(
+            ["git", "hash-object", str(checkout / "level1" / name)],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+        for name in LEVEL1
+    ]
+
+
+def test_extract_order(source, checkout):
+    """Bindings are extracted in the requested order, as from the checkout."""
+    urls = [f.url for f in source.files()]
+    urls = [urls[2], urls[0], urls[1]]
+
+    bindings = [dict(b) for b in source.extract(urls)]
+    expected = [dict(b) for b in CheckoutSource(checkout).extract(urls)]
+
+    assert [b["resource_uri"] for b in bindings] == urls
+    assert bindings == expected
+    assert [b["file_stem"] for b in bindings] == ["deu003", "deu001", "deu002"]
+
+
+def test_git_blob_sha():
+    """Blob SHAs match git hash-object, whatever the chunk size."""
+    path = fixtures_path / "DEU001.xml"
+    expected = subprocess.run(
+        ["git", "hash-object", str(path)],
+        capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    for chunk_size in (1, 1000, 1 << 16):
+        with open(path, "rb") as f:
+            assert git_blob_sha(f, path.stat().st_size, chunk_size) == expected
+    assert git_blob_sha(io.BytesIO(b""), 0) == (
+        "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+    )
+
+
+@pytest.mark.parametrize(
+    "member_name, expected",
+    [
+        ("level1/DEU001.xml", True),
+        ("ELTeC-deu-master/level1/DEU001.xml", True),
+        ("ELTeC-deu-master/level0/DEU001.xml", False),
+        ("ELTeC-deu-master/level1/README.md", False),
+        ("ELTeC-deu-master/level1/", False),
+        ("ELTeC-deu-master/a/level1/DEU001.xml", False),
+        ("DEU001.xml", False),
+    ]
+)
+def test_is_level1_xml(member_name, expected):
+    """Only XML files in level1 at the top or below one directory match."""
+    assert _is_level1_xml(member_name) is expected
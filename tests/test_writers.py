@@ -0,0 +1,146 @@
+"""Tests for sharded output."""
+
+import gzip
+import hashlib
+import json
+
+import pytest
+
+from rdflib import Graph, Literal, URIRef
+
+from eltec2rdf.writers import SHARD_INDEX, ShardedWriter
+
+
+def triples(key: str, n: int = 3) -> list[tuple]:
+    """Generate n triples for the document key."""
+    subject = URIRef(f"https://example.org/{key}")
+    return [
+        (subject, URIRef(f"https://example.org/p{i}"), Literal(f"{key} {i}"))
+        for i in range(n)
+    ]
+
+
+def write(directory, documents, **kwargs) -> ShardedWriter:
+    """Write documents ({key: triples}) and a corpus shard to directory."""
+    with ShardedWriter(directory, **kwargs) as writer:
+        writer.write_shard("corpus", triples("corpus", 1))
+        for key, _triples in documents.items():
+            writer.write(key, _triples)
+    return writer
+
+
+def read_index(directory) -> dict:
+    """Read the shard index in directory."""
+    return json.loads((directory / SHARD_INDEX).read_text())
+
+
+def assert_consistent(directory) -> None:
+    """Assert that the index matches the shards on disk, and only those."""
+    index = read_index(directory)
+
+    for shard in index["shards"]:
+        data = (directory / shard["path"]).read_bytes()
+        assert len(data) == shard["bytes"]
+        assert hashlib.sha256(data).hexdigest() == shard["sha256"]
+
+    assert {p.name for p in directory.iterdir()} == {
+        SHARD_INDEX, *(shard["path"] for shard in index["shards"])
+    }
+
+
+@pytest.mark.parametrize("output_format", ["nt", "nq", "turtle"])
+@pytest.mark.parametrize("compress", [False, True])
+def test_shards(tmp_path, output_format, compress):
+    """Every document gets a shard whose triples are listed in the index."""
+    documents = {f"deu00{i}": triples(f"deu00{i}") for i in range(1, 4)}
+    write(
+        tmp_path, documents,
+        output_format=output_format,
+        graph_name=(
+            URIRef("https://example.org/g") if output_format == "nq" else None
+        ),
+        compress=compress
+    )
+    index = read_index(tmp_path)
+
+    assert [shard["key"] for shard in index["shards"]] == ["corpus", *documents]
+    assert index["triples"] == 10
+    assert_consistent(tmp_path)
+
+    for shard in index["shards"][1:]:
+        data = (tmp_path / shard["path"]).read_bytes()
+        data = (gzip.decompress(data) if compress else data).decode()
+
+        if output_format == "nq":
+            lines = data.splitlines(keepends=True)
+            assert all(
+                line.endswith(" <https://example.org/g> .\n") for line in lines
+            )
+            data = data.replace(" <https://example.org/g> .\n", " .\n")
+
+        g = Graph().parse(
+            data=data, format="turtle" if output_format == "turtle" else "nt"
+        )
+        assert set(g) == set(documents[shard["key"]])
+        assert shard["triples"] == len(g)
+
+
+def test_shard_size(tmp_path):
+    """Shards hold shard_size documents and are keyed by the first one."""
+    documents = {f"deu00{i}": triples(f"deu00{i}") for i in range(1, 6)}
+    write(tmp_path, documents, shard_size=2)
+
+    assert [
+        (shard["key"], shard["documents"])
+        for shard in read_index(tmp_path)["shards"]
+    ] == [
+        ("corpus", ["corpus"]),
+        ("deu001", ["deu001", "deu002"]),
+        ("deu003", ["deu003", "deu004"]),
+        ("deu005", ["deu005"]),
+    ]
+
+
+def test_updates_touch_changed_shards_only(tmp_path):
+    """Unchanged shards are kept, changed ones replaced, removed ones deleted."""
+    documents = {f"deu00{i}": triples(f"deu00{i}") for i in range(1, 4)}
+    write(tmp_path, documents, compress=True)
+    before = {s["key"]: s for s in read_index(tmp_path)["shards"]}
+    mtimes = {p.name: p.stat().st_mtime_ns for p in tmp_path.iterdir()}
+
+    documents["deu002"] = triples("deu002", 4)
+    del documents["deu003"]
+    writer = write(tmp_path, documents, compress=True)
+    after = {s["key"]: s for s in read_index(tmp_path)["shards"]}
+
+    assert writer.unchanged == 2
+    assert after["deu001"] == before["deu001"]
+    assert (
+        (tmp_path / after["deu001"]["path"]).stat().st_mtime_ns
+        == mtimes[after["deu001"]["path"]]
+    )
+    assert after["deu002"]["sha256"] != before["deu002"]["sha256"]
+    assert "deu003" not in after
+    assert_consistent(tmp_path)
+
+
+def test_failed_run_keeps_previous_index(tmp_path):
+    """If writing fails, the previous index still matches its shards."""
+    documents = {f"deu00{i}": triples(f"deu00{i}") for i in range(1, 4)}
+    write(tmp_path, documents)
+    index = read_index(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with ShardedWriter(tmp_path) as writer:
+            writer.write("deu001", triples("deu001", 5))
+            writer.write("deu002", triples("deu002", 5))
+            raise RuntimeError
+
+    assert read_index(tmp_path) == index
+    for shard in index["shards"]:
+        data = (tmp_path / shard["path"]).read_bytes()
+        assert hashlib.sha256(data).hexdigest() == shard["sha256"]
+
+    write(tmp_path, documents)
+    assert read_index(tmp_path) == index
+    assert_consistent(tmp_path)